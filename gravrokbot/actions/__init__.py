@@ -1,17 +1,42 @@
 """
 Actions package for GravRokBot
 
-Contains the various game action implementations.
+Contains the various game action implementations. Action modules are only
+imported when their class is first used.
 """
 
-from gravrokbot.actions.gather_resources import GatherResourcesAction
-from gravrokbot.actions.collect_city_resources import CollectCityResourcesAction
-from gravrokbot.actions.change_character import ChangeCharacterAction
-from gravrokbot.actions.close_game import CloseGameAction
-from gravrokbot.actions.start_game import StartGameAction
-from gravrokbot.actions.material_production import MaterialProductionAction
-from gravrokbot.actions.open_mails import OpenMailsAction
-from gravrokbot.actions.claim_daily_vip_gifts import ClaimDailyVIPGiftsAction
+from gravrokbot.utils.lazy_import import lazy_exports
+from gravrokbot.core.action_registry import registry
+
+# Action class name to the module defining it
+_EXPORTS = {
+    'GatherResourcesAction': '.gather_resources',
+    'CollectCityResourcesAction': '.collect_city_resources',
+    'ChangeCharacterAction': '.change_character',
+    'CloseGameAction': '.close_game',
+    'StartGameAction': '.start_game',
+    'MaterialProductionAction': '.material_production',
+    'OpenMailsAction': '.open_mails',
+    'ClaimDailyVIPGiftsAction': '.claim_daily_vip_gifts'
+}
+
+# Built-in actions as (config key, display name, class name, schedulable activity),
+# in the order they are listed in the UI
+BUILTIN_ACTIONS = [
+    ('gather_resources', 'Gather Resources', 'GatherResourcesAction', True),
+    ('collect_city_resources', 'Collect City Resources', 'CollectCityResourcesAction', True),
+    ('material_production', 'Material Production', 'MaterialProductionAction', True),
+    ('open_mails', 'Open Mails', 'OpenMailsAction', True),
+    ('claim_daily_vip_gifts', 'Claim Daily VIP Gifts', 'ClaimDailyVIPGiftsAction', True),
+    ('change_character', 'Change Character', 'ChangeCharacterAction', True),
+    ('close_game', 'Close Game', 'CloseGameAction', False),
+    ('start_game', 'Start Game', 'StartGameAction', False)
+]
+
+for _key, _name, _class_name, _activity in BUILTIN_ACTIONS:
+    registry.register(_key, _name, f"{__name__}{_EXPORTS[_class_name]}:{_class_name}", _activity)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     'GatherResourcesAction',
@@ -21,5 +46,6 @@ __all__ = [
     'StartGameAction',
     'MaterialProductionAction',
     'OpenMailsAction',
-    'ClaimDailyVIPGiftsAction'
+    'ClaimDailyVIPGiftsAction',
+    'BUILTIN_ACTIONS'
 ]
@@ -40,6 +40,15 @@ class ActionTemplate(ActionWorkflow):
             after='on_third_step'
         )
         
+        # Waiting for the element the next step needs: the pre-delay polls for
+        # it and is tuned to how fast the game shows it
+        self.add_transition_with_delays(
+            'open_menu', 'clicking', 'detecting',
+            profile='menu_navigation',
+            expect='menu_button',  # Key of the 'images' config, an image path or a function
+            after='on_open_menu'
+        )
+        
         # METHOD 2: Using custom delay values
         self.add_transition_with_delays(
             'fourth_step', 'verifying', 'succeeded',
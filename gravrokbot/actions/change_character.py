@@ -1,8 +1,5 @@
-import os
-import time
-import logging
-import json
 from gravrokbot.core.action_workflow import ActionWorkflow
+from gravrokbot.core.config_snapshot import resolve_asset_path
 
 class ChangeCharacterAction(ActionWorkflow):
     """Action to change character in Rise of Kingdoms game"""
@@ -16,79 +13,34 @@ class ChangeCharacterAction(ActionWorkflow):
             config (dict): Configuration dict with action settings
         """
         super().__init__("Change Character", screen_interaction, config)
-        self.character_settings = {}
-        self.load_character_settings()
-    
-    def load_character_settings(self):
-        """Load character settings from file"""
-        try:
-            path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "character_settings.json")
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    self.character_settings = json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error loading character settings: {e}")
-            self.character_settings = {"characters": {}, "current_character": None}
-    
-    def save_character_settings(self):
-        """Save character settings to file"""
-        try:
-            path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "character_settings.json")
-            with open(path, 'w') as f:
-                json.dump(self.character_settings, f, indent=4)
-        except Exception as e:
-            self.logger.error(f"Error saving character settings: {e}")
-    
-    def initialize_character_settings(self, character_name):
-        """Initialize settings for a new character"""
-        self.logger.info(f"Initializing settings for new character: {character_name}")
+        # Character chosen by the runner's switch planner, None to switch blindly
+        self.target_character = None
+        # Character the last run switched to, None if unknown or not switched
+        self.switched_to = None
+        self._selected_character = None
         
-        # Load default settings
-        default_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "default_settings.json")
-        try:
-            with open(default_path, 'r') as f:
-                default_settings = json.load(f)
-                
-            # Create new character settings with defaults
-            self.character_settings["characters"][character_name] = {
-                "actions": {}
-            }
-            
-            # Copy default action settings
-            for action_key, action_config in default_settings["actions"].items():
-                self.character_settings["characters"][character_name]["actions"][action_key] = {
-                    "enabled": False,  # Initialize actions as disabled by default
-                    "cooldown_minutes": action_config["cooldown_minutes"]
-                }
-                
-            # Update current character
-            self.character_settings["current_character"] = character_name
-            
-            # Save the updated settings
-            self.save_character_settings()
-            
-            self.logger.info(f"Successfully initialized settings for {character_name}")
-            
-        except Exception as e:
-            self.logger.error(f"Error initializing character settings: {e}")
+        # Template of each character's entry in the character menu
+        self.character_images = {
+            name: resolve_asset_path(path)
+            for name, path in self.settings.get('character_images', {}).items()
+        }
+    
+    @property
+    def selectable_characters(self):
+        """list: Characters the switch can select, those with a character menu template"""
+        return list(self.character_images)
     
     def detect_character_name(self):
         """
-        Detect the current character name from the game screen
+        Get the name of the character switched to
+        
+        There is no text recognition yet, so the name is only known when the
+        switch selected the character by its character menu template.
+        
         Returns:
-            str: Detected character name or None if detection fails
+            str: Character name or None if it is not known
         """
-        # TODO: Implement actual character name detection using OCR
-        # For now, we'll use a placeholder that assumes we can get the name
-        # This should be replaced with actual OCR implementation
-        try:
-            # Placeholder for OCR implementation
-            # This should use self.screen.find_text() or similar to detect the name
-            detected_name = "Character1"  # Replace with actual detection
-            return detected_name
-        except Exception as e:
-            self.logger.error(f"Error detecting character name: {e}")
-            return None
+        return self._selected_character
 
     def setup_transitions(self):
         """Setup change character specific transitions"""
@@ -101,7 +53,12 @@ class ChangeCharacterAction(ActionWorkflow):
     
     def on_start(self):
         """Start changing character"""
-        self.logger.info("Starting change character action")
+        self.switched_to = None
+        self._selected_character = None
+        if self.target_character:
+            self.logger.info(f"Starting change character action, target: {self.target_character}")
+        else:
+            self.logger.info("Starting change character action")
         self.open_settings()
     
     def on_open_settings(self):
@@ -109,11 +66,7 @@ class ChangeCharacterAction(ActionWorkflow):
         self.logger.info("Opening settings menu")
         
         # Get settings button path from config
-        settings_button = self.config['images']['settings_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(settings_button):
-            settings_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), settings_button)
+        settings_button = self.images.settings_button
         
         # Find and click the settings button
         if self.screen.find_and_click_image(settings_button):
@@ -129,11 +82,7 @@ class ChangeCharacterAction(ActionWorkflow):
         self.logger.info("Opening character menu")
         
         # Get character button path from config
-        character_button = self.config['images']['character_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(character_button):
-            character_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), character_button)
+        character_button = self.images.character_button
         
         # Find and click the character button
         if self.screen.find_and_click_image(character_button):
@@ -145,15 +94,22 @@ class ChangeCharacterAction(ActionWorkflow):
             self.fail()
     
     def on_switch_character(self):
-        """Switch to another character"""
+        """Switch to the target character, or to another character if there is none"""
         self.logger.info("Switching character")
         
-        # Get switch button path from config
-        switch_button = self.config['images']['switch_button']
+        # Select the planned character first when its template is known
+        target_image = self.character_images.get(self.target_character)
+        if target_image:
+            if not self.screen.find_and_click_image(target_image):
+                self.logger.error(f"Could not find character {self.target_character} in the character menu")
+                self.fail()
+                return
+            self.logger.info(f"Selected character {self.target_character}")
+            self._selected_character = self.target_character
+            self.screen.humanized_wait(0.8, 1.2)
         
-        # Make sure the image path is absolute
-        if not os.path.isabs(switch_button):
-            switch_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), switch_button)
+        # Get switch button path from config
+        switch_button = self.images.switch_button
         
         # Find and click the switch button
         if self.screen.find_and_click_image(switch_button):
@@ -173,11 +129,7 @@ class ChangeCharacterAction(ActionWorkflow):
             bool: True if character switch was successful, False otherwise
         """
         # Get confirmation image path from config
-        confirmation_image = self.config['images']['confirmation']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(confirmation_image):
-            confirmation_image = os.path.join(os.path.dirname(os.path.dirname(__file__)), confirmation_image)
+        confirmation_image = self.images.confirmation
         
         # Check if confirmation image is on screen
         return self.screen.find_image(confirmation_image) is not None
@@ -186,21 +138,10 @@ class ChangeCharacterAction(ActionWorkflow):
         """Handle successful character switch"""
         self.logger.info("Successfully changed character")
         
-        # Detect the new character name
-        new_character = self.detect_character_name()
-        if new_character:
-            self.logger.info(f"Detected character: {new_character}")
-            
-            # Check if this is a new character
-            if new_character not in self.character_settings.get("characters", {}):
-                self.logger.info(f"New character detected: {new_character}")
-                self.initialize_character_settings(new_character)
-            else:
-                # Update current character in settings
-                self.character_settings["current_character"] = new_character
-                self.save_character_settings()
-                
-            self.logger.info(f"Character settings updated for: {new_character}")
+        # The runner applies the switch to the character settings through the UI
+        self.switched_to = self.detect_character_name()
+        if self.switched_to:
+            self.logger.info(f"Switched to character: {self.switched_to}")
         else:
             self.logger.warning("Could not detect character name")
             
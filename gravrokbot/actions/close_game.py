@@ -35,11 +35,7 @@ class CloseGameAction(ActionWorkflow):
         self.logger.info("Opening settings menu")
         
         # Get settings button path from config
-        settings_button = self.config['images']['settings_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(settings_button):
-            settings_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), settings_button)
+        settings_button = self.images.settings_button
         
         # Find and click the settings button
         if self.screen.find_and_click_image(settings_button):
@@ -55,11 +51,7 @@ class CloseGameAction(ActionWorkflow):
         self.logger.info("Looking for exit button")
         
         # Get exit button path from config
-        exit_button = self.config['images']['exit_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(exit_button):
-            exit_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), exit_button)
+        exit_button = self.images.exit_button
         
         # Find and click the exit button
         if self.screen.find_and_click_image(exit_button):
@@ -75,11 +67,7 @@ class CloseGameAction(ActionWorkflow):
         self.logger.info("Looking for exit confirmation dialog")
         
         # Get confirmation image path from config
-        confirmation_image = self.config['images']['confirmation']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(confirmation_image):
-            confirmation_image = os.path.join(os.path.dirname(os.path.dirname(__file__)), confirmation_image)
+        confirmation_image = self.images.confirmation
         
         # Find the confirmation dialog and click yes/confirm
         if self.screen.find_and_click_image(confirmation_image):
@@ -100,12 +88,8 @@ class CloseGameAction(ActionWorkflow):
         """
         # This can be tricky to determine - one approach is to look for elements that
         # should be present when the game is running
-        for key, img_path in self.config['images'].items():
+        for key, img_path in zip(self.images._fields, self.images):
             if key != 'confirmation':  # Don't check confirmation image itself
-                # Make sure the image path is absolute
-                if not os.path.isabs(img_path):
-                    img_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), img_path)
-                
                 # If we find any game element, it's not closed
                 if os.path.exists(img_path) and self.screen.find_image(img_path):
                     return False
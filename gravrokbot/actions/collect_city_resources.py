@@ -30,6 +30,7 @@ class CollectCityResourcesAction(ActionWorkflow):
             'find_collect_button', 'detecting', 'clicking', 
             pre_delay_min=0.3, pre_delay_max=0.6,  # Delay before finding collect button
             post_delay_min=0.8, post_delay_max=1.2,  # Delay after finding
+            expect='collect_all',  # Wait for the collect button, tuned to how fast it appears
             after='on_find_collect_button'
         )
         
@@ -73,11 +74,7 @@ class CollectCityResourcesAction(ActionWorkflow):
         self.logger.info("Checking if we're in city view")
         
         # Get city view image path from config
-        city_view_image = self.config['images']['city_view']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(city_view_image):
-            city_view_image = os.path.join(os.path.dirname(os.path.dirname(__file__)), city_view_image)
+        city_view_image = self.images.city_view
         
         # Check if we're in city view
         if self.screen.find_image(city_view_image):
@@ -94,11 +91,7 @@ class CollectCityResourcesAction(ActionWorkflow):
         self.logger.info("Looking for collect all button")
         
         # Get collect all button path from config
-        collect_all_button = self.config['images']['collect_all']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(collect_all_button):
-            collect_all_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), collect_all_button)
+        collect_all_button = self.images.collect_all
         
         # Find and click the collect all button
         if self.screen.find_and_click_image(collect_all_button):
@@ -113,16 +106,12 @@ class CollectCityResourcesAction(ActionWorkflow):
         self.logger.info("Collecting resources from individual buildings")
         
         # Get resource buildings paths from config
-        resource_buildings = self.config['images']['resource_buildings']
+        resource_buildings = self.images.resource_buildings
         
         clicked_count = 0
         
         # Loop through each building type
         for building_img in resource_buildings:
-            # Make sure the image path is absolute
-            if not os.path.isabs(building_img):
-                building_img = os.path.join(os.path.dirname(os.path.dirname(__file__)), building_img)
-            
             # Find all instances of this building
             self.logger.info(f"Looking for buildings of type: {os.path.basename(building_img)}")
             building_locations = self.screen.find_all_images(building_img)
@@ -156,11 +145,7 @@ class CollectCityResourcesAction(ActionWorkflow):
             bool: True if collection was successful, False otherwise
         """
         # Get confirmation image path from config
-        confirmation_image = self.config['images']['confirmation']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(confirmation_image):
-            confirmation_image = os.path.join(os.path.dirname(os.path.dirname(__file__)), confirmation_image)
+        confirmation_image = self.images.confirmation
         
         # This could also just return True, as there might not be a specific indicator of success
         # For now, we'll check for a confirmation image, but this might need adjustment
@@ -1,4 +1,3 @@
-import os
 import time
 import logging
 from gravrokbot.core.action_workflow import ActionWorkflow
@@ -30,12 +29,14 @@ class GatherResourcesAction(ActionWorkflow):
         self.add_transition_with_delays(
             'click_gather', 'detecting', 'clicking', 
             profile='menu_navigation',  # Use menu_navigation profile for UI interactions
+            expect='gather_button',  # Wait for the gather button, tuned to how fast it appears
             after='on_click_gather'
         )
         
         self.add_transition_with_delays(
             'click_march', 'clicking', 'verifying', 
             profile='long_wait',  # Use long_wait profile for march command which needs longer delays
+            expect='march_button',
             after='on_click_march'
         )
         
@@ -64,11 +65,7 @@ class GatherResourcesAction(ActionWorkflow):
         self.logger.info("Looking for resource node on map")
         
         # Get resource icon path from config
-        resource_icon = self.config['images']['resource_icon']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(resource_icon):
-            resource_icon = os.path.join(os.path.dirname(os.path.dirname(__file__)), resource_icon)
+        resource_icon = self.images.resource_icon
         
         # Find the resource on screen
         resource_location = self.screen.find_image(resource_icon)
@@ -89,11 +86,7 @@ class GatherResourcesAction(ActionWorkflow):
         self.logger.info("Looking for gather button")
         
         # Get gather button path from config
-        gather_button = self.config['images']['gather_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(gather_button):
-            gather_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), gather_button)
+        gather_button = self.images.gather_button
         
         # Click the gather button
         if self.screen.find_and_click_image(gather_button):
@@ -108,11 +101,7 @@ class GatherResourcesAction(ActionWorkflow):
         self.logger.info("Looking for march button")
         
         # Get march button path from config
-        march_button = self.config['images']['march_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(march_button):
-            march_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), march_button)
+        march_button = self.images.march_button
         
         # Click the march button
         if self.screen.find_and_click_image(march_button):
@@ -130,11 +119,7 @@ class GatherResourcesAction(ActionWorkflow):
             bool: True if gather action was successful, False otherwise
         """
         # Get confirmation image path from config
-        confirmation_image = self.config['images']['confirmation']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(confirmation_image):
-            confirmation_image = os.path.join(os.path.dirname(os.path.dirname(__file__)), confirmation_image)
+        confirmation_image = self.images.confirmation
         
         # Check if confirmation image is on screen
         return self.screen.find_image(confirmation_image) is not None
@@ -3,6 +3,7 @@ import time
 import logging
 import subprocess
 from gravrokbot.core.action_workflow import ActionWorkflow
+from gravrokbot.core.config_snapshot import resolve_asset_path
 
 class StartGameAction(ActionWorkflow):
     """Action to start Rise of Kingdoms game"""
@@ -61,11 +62,7 @@ class StartGameAction(ActionWorkflow):
         self.logger.info("Looking for start button")
         
         # Get start button path from config
-        start_button = self.config['images']['start_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(start_button):
-            start_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), start_button)
+        start_button = self.images.start_button
         
         # Find and click the start button
         if self.screen.find_and_click_image(start_button):
@@ -73,11 +70,7 @@ class StartGameAction(ActionWorkflow):
             self.wait_for_login()
         else:
             # Try finding the game icon if start button isn't found
-            game_icon = self.config['images']['game_icon']
-            
-            # Make sure the image path is absolute
-            if not os.path.isabs(game_icon):
-                game_icon = os.path.join(os.path.dirname(os.path.dirname(__file__)), game_icon)
+            game_icon = self.images.game_icon
                 
             if self.screen.find_and_click_image(game_icon):
                 self.logger.info("Clicked game icon")
@@ -101,11 +94,7 @@ class StartGameAction(ActionWorkflow):
         self.logger.info("Looking for login button")
         
         # Get login button path from config
-        login_button = self.config['images']['login_button']
-        
-        # Make sure the image path is absolute
-        if not os.path.isabs(login_button):
-            login_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), login_button)
+        login_button = self.images.login_button
         
         # Find and click the login button if present
         if self.screen.find_and_click_image(login_button):
@@ -130,15 +119,12 @@ class StartGameAction(ActionWorkflow):
         
         # Get city view image from any action that might have one
         # For simplicity here, just checking settings button exists
-        settings_button = self.config['images'].get('settings_button')
+        settings_button = getattr(self.images, 'settings_button', None)
         if not settings_button and 'change_character' in self.config:
             settings_button = self.config['change_character']['images'].get('settings_button')
+            settings_button = resolve_asset_path(settings_button) if settings_button else None
         
         if settings_button:
-            # Make sure the image path is absolute
-            if not os.path.isabs(settings_button):
-                settings_button = os.path.join(os.path.dirname(os.path.dirname(__file__)), settings_button)
-                
             # If we find settings button, game is started
             if os.path.exists(settings_button) and self.screen.find_image(settings_button):
                 return True
@@ -0,0 +1,5 @@
+"""
+Analysis package for GravRokBot
+
+Contains tools that read the logs of past runs.
+"""
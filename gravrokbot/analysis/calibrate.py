@@ -0,0 +1,203 @@
+"""
+Template threshold calibration for GravRokBot.
+Reads the match score histograms recorded with screen.score_telemetry and
+proposes a threshold per template in the gap between the scores of screens
+without the element and those showing it, so neither strict thresholds
+cause retries nor loose ones cause false clicks.
+
+Usage:
+    gravrokbot-calibrate [--scores logs/match_scores.json] [--min-samples 30] [--write]
+"""
+
+import os
+import sys
+import json
+import argparse
+
+import numpy as np
+
+from gravrokbot.core.match_scores import BINS
+from gravrokbot.core.state_store import JsonStateStore
+from gravrokbot.core.config_snapshot import USER_SETTINGS_PATH, load_settings
+
+# Bounds of proposed thresholds
+MIN_THRESHOLD = 0.5
+MAX_THRESHOLD = 0.99
+
+# Fewest scores on each side of the split for the split to count
+MIN_CLUSTER = 3
+
+def otsu_split(counts):
+    """
+    Find the bin splitting a histogram into two classes with the largest between-class variance
+
+    Args:
+        counts (numpy.ndarray): Histogram counts
+
+    Returns:
+        int: Index of the first bin of the upper class, None if the histogram is empty
+    """
+    total = counts.sum()
+    if total == 0:
+        return None
+    centers = (np.arange(len(counts)) + 0.5) / len(counts)
+    weighted = np.cumsum(counts * centers)
+    # Class weights and score sums for every split after the first bin
+    lower_weights = np.cumsum(counts)[:-1]
+    upper_weights = total - lower_weights
+    lower_sums = weighted[:-1]
+    valid = (lower_weights > 0) & (upper_weights > 0)
+    if not valid.any():
+        return None
+    lower_means = np.divide(lower_sums, lower_weights, out=np.zeros_like(lower_sums), where=valid)
+    upper_means = np.divide(weighted[-1] - lower_sums, upper_weights, out=np.zeros_like(lower_sums), where=valid)
+    variance = np.where(valid, lower_weights * upper_weights * (lower_means - upper_means) ** 2, -1.0)
+    return int(np.argmax(variance)) + 1
+
+def percentile_bin(counts, fraction):
+    """
+    Get the bin holding a percentile of a histogram
+
+    Args:
+        counts (numpy.ndarray): Histogram counts
+        fraction (float): Percentile as a fraction
+
+    Returns:
+        int: Bin index
+    """
+    return int(np.searchsorted(np.cumsum(counts), fraction * counts.sum()))
+
+def propose_threshold(entry, current, min_samples=30):
+    """
+    Propose a threshold from the score histograms of a template
+
+    Hits and near-misses are pooled and split into the scores of absent and
+    present elements. The threshold goes in the middle of the gap between
+    the 99th percentile of the lower and the 1st percentile of the upper
+    scores, or on the split itself if the two overlap.
+
+    Args:
+        entry (dict): Histograms as recorded by MatchScores
+        current (float): Threshold in use
+        min_samples (int): Fewest hits and near-misses to propose a threshold
+
+    Returns:
+        dict: Sample counts, 'current', 'proposed' (None if no proposal) and 'reason'
+    """
+    hits = np.asarray(entry.get('hits', [0] * BINS), dtype=float)
+    near_misses = np.asarray(entry.get('near_misses', [0] * BINS), dtype=float)
+    scores = hits + near_misses
+    result = {
+        'hits': int(hits.sum()),
+        'near_misses': int(near_misses.sum()),
+        'far_misses': int(entry.get('far_misses', 0)),
+        'current': current,
+        'proposed': None
+    }
+
+    if scores.sum() < min_samples:
+        result['reason'] = 'too few samples'
+        return result
+    split = otsu_split(scores)
+    if split is None or min(scores[:split].sum(), scores[split:].sum()) < MIN_CLUSTER:
+        result['reason'] = 'single cluster'
+        return result
+
+    lower_top = (percentile_bin(scores[:split], 0.99) + 1) / BINS
+    upper_bottom = (split + percentile_bin(scores[split:], 0.01)) / BINS
+    if upper_bottom > lower_top:
+        proposed, result['reason'] = (lower_top + upper_bottom) / 2, 'gap'
+    else:
+        proposed, result['reason'] = split / BINS, 'overlap'
+    result['proposed'] = round(min(MAX_THRESHOLD, max(MIN_THRESHOLD, proposed)), 2)
+    return result
+
+def calibrate(histograms, thresholds, default_confidence=0.8, min_samples=30):
+    """
+    Propose thresholds for all recorded templates
+
+    Args:
+        histograms (dict): Template key to histograms, as saved by MatchScores
+        thresholds (dict): Template key to the calibrated threshold in use
+        default_confidence (float): Threshold of templates without one
+        min_samples (int): Fewest hits and near-misses to propose a threshold
+
+    Returns:
+        dict: Template key to the proposal from propose_threshold
+    """
+    return {
+        template: propose_threshold(entry, thresholds.get(template, default_confidence), min_samples)
+        for template, entry in sorted(histograms.items())
+    }
+
+def write_thresholds(proposals, settings_path=USER_SETTINGS_PATH):
+    """
+    Store the proposed thresholds in the user settings
+
+    A running bot picks them up with its next settings reload.
+
+    Args:
+        proposals (dict): Proposals from calibrate
+        settings_path (str): User settings file
+
+    Returns:
+        int: Number of thresholds written
+    """
+    store = JsonStateStore(settings_path)
+    settings = store.load(default={})
+    thresholds = settings.setdefault('screen', {}).setdefault('template_thresholds', {})
+    changed = 0
+    for template, proposal in proposals.items():
+        if proposal['proposed'] is not None and proposal['proposed'] != proposal['current']:
+            thresholds[template] = proposal['proposed']
+            changed += 1
+    if changed:
+        store.save(settings)
+        store.flush()
+    return changed
+
+def format_proposals(proposals):
+    """
+    Format proposals as a text table
+
+    Args:
+        proposals (dict): Proposals from calibrate
+
+    Returns:
+        str: Table text
+    """
+    lines = [f"  {'template':<40} {'hits':>6} {'near':>6} {'far':>6}  current  proposed"]
+    for template, proposal in proposals.items():
+        proposed = f"{proposal['proposed']:.2f}" if proposal['proposed'] is not None else '-'
+        lines.append(f"  {template:<40} {proposal['hits']:>6} {proposal['near_misses']:>6} {proposal['far_misses']:>6}  "
+                     f"{proposal['current']:>7.2f}  {proposed:>8}  ({proposal['reason']})")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Propose per-template thresholds from the command line"""
+    parser = argparse.ArgumentParser(description="Calibrate GravRokBot template thresholds")
+    parser.add_argument("--scores", default=os.path.join("logs", "match_scores.json"),
+                        help="match score histograms recorded with screen.score_telemetry")
+    parser.add_argument("--min-samples", type=int, default=30, help="fewest scores to propose a threshold")
+    parser.add_argument("--write", action="store_true", help="store the proposed thresholds in the user settings")
+    parser.add_argument("--settings", default=USER_SETTINGS_PATH, help="user settings file to write to")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.scores):
+        print(f"No match scores in {args.scores}, enable screen.score_telemetry and run the bot first")
+        return 1
+    with open(args.scores, 'r') as f:
+        histograms = json.load(f)
+
+    screen = load_settings(user_path=args.settings).get('screen', {})
+    proposals = calibrate(histograms, screen.get('template_thresholds', {}),
+                          screen.get('default_confidence', 0.8), args.min_samples)
+    print(format_proposals(proposals))
+
+    if args.write:
+        changed = write_thresholds(proposals, args.settings)
+        print(f"{changed} thresholds written to {args.settings}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
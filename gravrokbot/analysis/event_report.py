@@ -0,0 +1,204 @@
+"""
+Event log analysis for GravRokBot.
+Reads the daily JSONL event files and reports per-action throughput and
+failure rates, step latency distributions and template match scores.
+
+Usage:
+    gravrokbot-events [--directory logs/events] [--days 7] [--json report.json]
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Event kinds with a duration in milliseconds
+LATENCY_KINDS = ('transition', 'capture', 'match', 'ocr', 'input', 'delay')
+
+EVENT_FILE = re.compile(r"^events-(\d{4}-\d{2}-\d{2})\.jsonl$")
+
+def find_event_files(directory, days=7, today=None):
+    """
+    Find the event files of the last days
+
+    Args:
+        directory (str): Directory of the daily event files
+        days (int): Number of days, including today
+        today (date, optional): Last day, the current date if None
+
+    Returns:
+        list: Paths, oldest first
+    """
+    if not os.path.isdir(directory):
+        return []
+
+    today = today or datetime.now().date()
+    first_day = today - timedelta(days=days - 1)
+    paths = []
+    for name in sorted(os.listdir(directory)):
+        match = EVENT_FILE.match(name)
+        if match and first_day <= datetime.strptime(match.group(1), '%Y-%m-%d').date() <= today:
+            paths.append(os.path.join(directory, name))
+    return paths
+
+def read_events(paths):
+    """
+    Read events from JSONL files, skipping lines that are not valid JSON
+
+    A line cut short by a crash while writing is skipped rather than failing
+    the whole report.
+
+    Args:
+        paths (list): Event file paths
+
+    Yields:
+        dict: Events in file order
+    """
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+def distribution(values):
+    """
+    Summarize values by their percentiles
+
+    Args:
+        values (list): Numbers
+
+    Returns:
+        dict: count, p50, p90, p99 and max
+    """
+    data = np.asarray(values, dtype=float)
+    p50, p90, p99 = np.percentile(data, (50, 90, 99))
+    return {
+        'count': int(data.size),
+        'p50': round(float(p50), 3),
+        'p90': round(float(p90), 3),
+        'p99': round(float(p99), 3),
+        'max': round(float(data.max()), 3)
+    }
+
+def analyze(events):
+    """
+    Compute the report of a set of events
+
+    Args:
+        events (iterable): Events as written by the event log
+
+    Returns:
+        dict: 'period', 'actions', 'latency_ms' and 'templates'
+    """
+    first_ts = last_ts = None
+    runs = {}
+    latencies = {}
+    templates = {}
+
+    for event in events:
+        ts = event.get('ts')
+        if ts is not None:
+            first_ts = ts if first_ts is None else min(first_ts, ts)
+            last_ts = ts if last_ts is None else max(last_ts, ts)
+
+        kind = event.get('kind')
+        if kind == 'action_finish':
+            runs.setdefault(event.get('action'), []).append(event)
+        if kind in LATENCY_KINDS and 'ms' in event:
+            latencies.setdefault(kind, []).append(event['ms'])
+        if kind == 'match':
+            templates.setdefault(event.get('template'), []).append(event)
+
+    hours = (last_ts - first_ts) / 3600 if first_ts is not None else 0.0
+    days = max(hours / 24, 1 / 24)
+
+    actions = {}
+    for action, finished in sorted(runs.items(), key=lambda item: str(item[0])):
+        failed = sum(1 for event in finished if not event.get('succeeded'))
+        actions[action] = {
+            'runs': len(finished),
+            'failed': failed,
+            'failure_rate': round(failed / len(finished), 4),
+            'runs_per_day': round(len(finished) / days, 2),
+            'seconds': distribution([event.get('seconds', 0) for event in finished])
+        }
+
+    template_report = {}
+    for template, matches in sorted(templates.items(), key=lambda item: str(item[0])):
+        scores = [event['score'] for event in matches if event.get('score') is not None]
+        template_report[template] = {
+            'matches': len(matches),
+            'found_rate': round(sum(1 for event in matches if event.get('found')) / len(matches), 4),
+            'score': distribution(scores) if scores else None
+        }
+
+    return {
+        'period': {
+            'start': datetime.fromtimestamp(first_ts).isoformat(timespec='seconds') if first_ts else None,
+            'end': datetime.fromtimestamp(last_ts).isoformat(timespec='seconds') if last_ts else None,
+            'hours': round(hours, 2)
+        },
+        'actions': actions,
+        'latency_ms': {kind: distribution(values) for kind, values in sorted(latencies.items())},
+        'templates': template_report
+    }
+
+def format_report(report):
+    """
+    Format a report as text tables
+
+    Args:
+        report (dict): Report from analyze
+
+    Returns:
+        str: Report text
+    """
+    period = report['period']
+    lines = [f"Events from {period['start']} to {period['end']} ({period['hours']} h)", "", "Actions:"]
+    for action, stats in report['actions'].items():
+        seconds = stats['seconds']
+        lines.append(f"  {action:<26} runs {stats['runs']:>5}  {stats['runs_per_day']:>7.1f}/day  "
+                     f"failed {stats['failure_rate']:>6.1%}  p50 {seconds['p50']:>7.1f} s  p90 {seconds['p90']:>7.1f} s")
+
+    lines += ["", "Latency (ms):"]
+    for kind, stats in report['latency_ms'].items():
+        lines.append(f"  {kind:<12} n {stats['count']:>7}  p50 {stats['p50']:>9.2f}  p90 {stats['p90']:>9.2f}  "
+                     f"p99 {stats['p99']:>9.2f}  max {stats['max']:>9.2f}")
+
+    lines += ["", "Templates:"]
+    for template, stats in report['templates'].items():
+        score = stats['score']
+        score_text = f"score p50 {score['p50']:.3f}" if score else "no scores"
+        lines.append(f"  {str(template):<32} matches {stats['matches']:>6}  found {stats['found_rate']:>6.1%}  {score_text}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Report on the event log from the command line"""
+    parser = argparse.ArgumentParser(description="Analyze GravRokBot event logs")
+    parser.add_argument("--directory", default=os.path.join("logs", "events"), help="directory of the event files")
+    parser.add_argument("--days", type=int, default=7, help="number of days to include, including today")
+    parser.add_argument("--json", help="also write the report as JSON to this file")
+    args = parser.parse_args(argv)
+
+    paths = find_event_files(args.directory, args.days)
+    if not paths:
+        print(f"No event files in {args.directory} for the last {args.days} days")
+        return 1
+
+    report = analyze(read_events(paths))
+    print(format_report(report))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=4)
+        print(f"Report written to {args.json}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
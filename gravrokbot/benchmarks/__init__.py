@@ -0,0 +1,5 @@
+"""
+Benchmarks package for GravRokBot
+
+Contains micro-benchmarks that are run from the command line.
+"""
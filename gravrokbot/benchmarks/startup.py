@@ -0,0 +1,181 @@
+"""
+Startup benchmark for GravRokBot.
+Imports the entry modules in fresh interpreters with `-X importtime`,
+reports the median cumulative import time of each and the heavy libraries
+that importing it pulled in, and saves the results as JSON so runs can be
+compared.
+
+Usage:
+    gravrokbot-bench-startup [--runs N] [--output results.json] [--compare baseline.json]
+"""
+
+import os
+import re
+import sys
+import json
+import platform
+import argparse
+import statistics
+import subprocess
+from datetime import datetime
+from importlib import metadata
+
+# Modules imported at startup by the UI, the runner and the bot
+ENTRY_MODULES = [
+    "gravrokbot.ui.main_window",
+    "gravrokbot.core.runner_factory",
+    "gravrokbot.core.screen_interaction",
+    "gravrokbot.actions",
+]
+
+# Libraries that should only be loaded when the bot first needs them
+HEAVY_MODULES = ["numpy", "cv2", "pyautogui", "pytesseract", "PIL", "PyQt6"]
+
+# Line of -X importtime output: self and cumulative microseconds, indented name
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+def parse_importtime(output):
+    """
+    Parse the stderr of an interpreter run with -X importtime
+
+    Args:
+        output (str): Captured stderr
+
+    Returns:
+        dict: Module name to (self_us, cumulative_us, depth)
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return modules
+
+def time_import(module, python=sys.executable):
+    """
+    Import a module in a fresh interpreter
+
+    Args:
+        module (str): Module to import
+        python (str): Interpreter to run
+
+    Returns:
+        dict: Module name to (self_us, cumulative_us, depth), empty if the import failed
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+    process = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env
+    )
+    if process.returncode != 0:
+        return {}
+    return parse_importtime(process.stderr)
+
+def run_benchmarks(runs=5, modules=ENTRY_MODULES, log=print):
+    """
+    Time the import of each entry module
+
+    Args:
+        runs (int): Fresh interpreters per module
+        modules (list): Modules to import
+        log (callable): Progress output
+
+    Returns:
+        list: Result dicts with median and best cumulative time, and the heavy modules loaded
+    """
+    results = []
+    for module in modules:
+        totals = []
+        loaded = set()
+        slowest = {}
+        for _ in range(runs):
+            times = time_import(module)
+            if module not in times:
+                break
+            totals.append(times[module][1])
+            loaded.update(name for name in HEAVY_MODULES if name in times)
+            for name, (self_us, _, _) in times.items():
+                slowest[name] = max(slowest.get(name, 0), self_us)
+
+        if not totals:
+            log(f"{module:<36} import failed")
+            results.append({'module': module, 'error': 'import failed'})
+            continue
+
+        top = sorted(slowest.items(), key=lambda item: item[1], reverse=True)[:10]
+        result = {
+            'module': module,
+            'median_ms': round(statistics.median(totals) / 1000, 3),
+            'min_ms': round(min(totals) / 1000, 3),
+            'heavy_modules': sorted(loaded),
+            'slowest': [{'module': name, 'self_ms': round(self_us / 1000, 3)} for name, self_us in top]
+        }
+        results.append(result)
+        log(f"{module:<36} median {result['median_ms']:9.1f} ms  min {result['min_ms']:9.1f} ms  "
+            f"loads {', '.join(result['heavy_modules']) or 'no heavy modules'}")
+    return results
+
+def compare(results, baseline):
+    """
+    Compare results with a baseline run
+
+    Args:
+        results (list): Current results
+        baseline (list): Results of an earlier run
+
+    Returns:
+        list: (module, baseline median, current median, ratio) for modules timed in both runs
+    """
+    previous = {result['module']: result for result in baseline if 'median_ms' in result}
+    rows = []
+    for result in results:
+        old = previous.get(result['module'])
+        if old and 'median_ms' in result and old['median_ms'] > 0:
+            rows.append((result['module'], old['median_ms'], result['median_ms'], result['median_ms'] / old['median_ms']))
+    return rows
+
+def package_version():
+    """Get the installed package version"""
+    try:
+        return metadata.version("gravrokbot")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def main(argv=None):
+    """Run the startup benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark GravRokBot import and startup time")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--module", action="append", help="module to time instead of the entry modules")
+    parser.add_argument("--output", default=os.path.join("logs", "benchmark_startup.json"),
+                        help="JSON file to write the results to")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.runs, args.module or ENTRY_MODULES)
+    report = {
+        'version': package_version(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results
+    }
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare} (version {baseline.get('version')}):")
+        for module, old_ms, new_ms, ratio in compare(results, baseline['results']):
+            print(f"{module:<36} {old_ms:9.1f} -> {new_ms:9.1f} ms  x{ratio:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
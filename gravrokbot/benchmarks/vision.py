@@ -0,0 +1,254 @@
+"""
+Vision micro-benchmarks for GravRokBot.
+Times the screen matching, OCR and image helpers on synthetic screens of
+several resolutions and template sizes, and saves median/p95 latency and
+peak allocations per call as JSON so runs can be compared. The find_image
+and find_all_images cases match with the in-process TemplateMatcher used by
+the vision pool and the non-default match methods, the *_locate cases with
+PyAutoGUI's locate, the default path without vision workers.
+
+Usage:
+    gravrokbot-bench-vision [--iterations N] [--output results.json] [--compare baseline.json]
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime
+from importlib import metadata
+
+import cv2
+import numpy as np
+import pytesseract
+from PIL import Image
+
+from gravrokbot.core.screen_interaction import ScreenInteraction
+from gravrokbot.testing.replay import ReplayScreenInteraction
+from gravrokbot.utils.image_utils import enhance_image_for_ocr, pil_to_cv2, highlight_matches
+
+RESOLUTIONS = [(1280, 720), (1600, 900), (1920, 1080)]
+TEMPLATE_SIZES = [(32, 32), (64, 64), (128, 96)]
+
+# Region of the synthetic screen holding text for the OCR benchmark
+TEXT_REGION = (40, 40, 360, 60)
+
+class LocateScreenInteraction(ReplayScreenInteraction):
+    """Replay screen interaction matching like the bot does by default"""
+
+    def _create_vision_pool(self):
+        """Select the matcher as the bot does, None to match with PyAutoGUI's locate"""
+        return ScreenInteraction._create_vision_pool(self)
+
+def make_screen(width, height, template_size, rng):
+    """
+    Build a synthetic screen with a template placed at three positions
+
+    Args:
+        width (int): Screen width
+        height (int): Screen height
+        template_size (tuple): (width, height) of the template
+        rng (numpy.random.Generator): Random source
+
+    Returns:
+        tuple: (screen PIL image, template PIL image, list of template centers)
+    """
+    template_width, template_height = template_size
+    screen = rng.integers(0, 80, size=(height, width, 3), dtype=np.uint8)
+    template = rng.integers(0, 256, size=(template_height, template_width, 3), dtype=np.uint8)
+
+    centers = []
+    for fx, fy in ((0.25, 0.7), (0.5, 0.4), (0.8, 0.75)):
+        x, y = int(width * fx), int(height * fy)
+        screen[y:y + template_height, x:x + template_width] = template
+        centers.append((x + template_width // 2, y + template_height // 2))
+
+    left, top, region_width, region_height = TEXT_REGION
+    screen[top:top + region_height, left:left + region_width] = 255
+    cv2.putText(screen, "Gathering 1,234,567", (left + 10, top + 40),
+                cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    return Image.fromarray(screen), Image.fromarray(template), centers
+
+def measure(func, iterations, warmup=2, alloc_calls=3):
+    """
+    Time a function and measure its allocations
+
+    Args:
+        func (callable): Function without arguments
+        iterations (int): Timed calls
+        warmup (int): Untimed calls before timing
+        alloc_calls (int): Calls traced for allocations, after timing
+
+    Returns:
+        dict: iterations, median_ms, p95_ms, min_ms and peak_alloc_kb
+    """
+    for _ in range(warmup):
+        func()
+
+    durations = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter_ns()
+        func()
+        durations[i] = (time.perf_counter_ns() - start) / 1e6
+
+    # Traced separately, tracemalloc slows the calls down
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_calls):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'iterations': iterations,
+        'median_ms': round(float(np.median(durations)), 4),
+        'p95_ms': round(float(np.percentile(durations, 95)), 4),
+        'min_ms': round(float(durations.min()), 4),
+        'peak_alloc_kb': round(max(peaks) / 1024, 1)
+    }
+
+def tesseract_available():
+    """Check whether the Tesseract binary can be run"""
+    try:
+        pytesseract.get_tesseract_version()
+        return True
+    except Exception:
+        return False
+
+def run_benchmarks(iterations=20, resolutions=RESOLUTIONS, template_sizes=TEMPLATE_SIZES, log=print):
+    """
+    Run all vision benchmarks
+
+    Args:
+        iterations (int): Timed calls per case
+        resolutions (list): Screen (width, height) sizes
+        template_sizes (list): Template (width, height) sizes
+        log (callable): Called with a line per finished case
+
+    Returns:
+        list: Result dicts with 'name', 'resolution', 'template' and the timings
+    """
+    rng = np.random.default_rng(0)
+    ocr_enabled = tesseract_available()
+    results = []
+
+    def add(name, resolution, template, func):
+        result = {
+            'name': name,
+            'resolution': f"{resolution[0]}x{resolution[1]}",
+            'template': f"{template[0]}x{template[1]}" if template else None
+        }
+        result.update(measure(func, iterations))
+        results.append(result)
+        log(f"{name:<22} {result['resolution']:>10} {result['template'] or '':>8} "
+            f"median {result['median_ms']:9.3f} ms  p95 {result['p95_ms']:9.3f} ms  "
+            f"peak {result['peak_alloc_kb']:9.1f} KiB")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for resolution in resolutions:
+            for template_size in template_sizes:
+                screen_image, template_image, centers = make_screen(*resolution, template_size, rng)
+                template_path = os.path.join(temp_dir, f"template_{template_size[0]}x{template_size[1]}.png")
+                template_image.save(template_path)
+
+                screen = ReplayScreenInteraction({}, [screen_image])
+                add('find_image', resolution, template_size,
+                    lambda: screen.find_image(template_path))
+                add('find_all_images', resolution, template_size,
+                    lambda: screen.find_all_images(template_path))
+                locate_screen = LocateScreenInteraction({}, [screen_image])
+                add('find_image_locate', resolution, template_size,
+                    lambda: locate_screen.find_image(template_path))
+                add('find_all_images_locate', resolution, template_size,
+                    lambda: locate_screen.find_all_images(template_path))
+                for method in ('edges', 'concordance'):
+                    method_screen = ReplayScreenInteraction({'match_method': method}, [screen_image])
+                    add(f'find_image_{method}', resolution, template_size,
+                        lambda: method_screen.find_image(template_path))
+                add('highlight_matches', resolution, template_size,
+                    lambda: highlight_matches(screen_image, template_image, centers))
+
+            # Helpers that do not depend on the template size
+            add('pil_to_cv2', resolution, None, lambda: pil_to_cv2(screen_image))
+            add('enhance_image_for_ocr', resolution, None, lambda: enhance_image_for_ocr(screen_image))
+            if ocr_enabled:
+                add('extract_text', resolution, None, lambda: screen.extract_text(TEXT_REGION))
+
+    if not ocr_enabled:
+        log("extract_text skipped, Tesseract is not installed")
+    return results
+
+def compare(results, baseline):
+    """
+    Compare results with a baseline run
+
+    Args:
+        results (list): Current results
+        baseline (list): Results of an earlier run
+
+    Returns:
+        list: (case, baseline median, current median, ratio) for cases in both runs
+    """
+    def key(result):
+        return (result['name'], result['resolution'], result['template'])
+
+    previous = {key(result): result for result in baseline}
+    rows = []
+    for result in results:
+        old = previous.get(key(result))
+        if old and old['median_ms'] > 0:
+            rows.append((key(result), old['median_ms'], result['median_ms'], result['median_ms'] / old['median_ms']))
+    return rows
+
+def package_version():
+    """Get the installed package version"""
+    try:
+        return metadata.version("gravrokbot")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def main(argv=None):
+    """Run the vision benchmarks from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark GravRokBot vision primitives")
+    parser.add_argument("--iterations", type=int, default=20, help="timed calls per case")
+    parser.add_argument("--output", default=os.path.join("logs", "benchmark_vision.json"),
+                        help="JSON file to write the results to")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.iterations)
+    report = {
+        'version': package_version(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+        'results': results
+    }
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=4)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare} (version {baseline.get('version')}):")
+        for (name, resolution, template), old_ms, new_ms, ratio in compare(results, baseline['results']):
+            print(f"{name:<22} {resolution:>10} {template or '':>8} {old_ms:9.3f} -> {new_ms:9.3f} ms  x{ratio:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,17 @@
 """
 Core package for GravRokBot
 
-Contains the base functionality and core components.
+Contains the base functionality and core components. Members are imported
+on first use so importing a core module does not load the vision stack.
 """
 
-from gravrokbot.core.screen_interaction import ScreenInteraction
-from gravrokbot.core.action_workflow import ActionWorkflow
-from gravrokbot.core.action_runner import ActionRunner
+from gravrokbot.utils.lazy_import import lazy_exports
+
+__getattr__ = lazy_exports(__name__, {
+    'ScreenInteraction': '.screen_interaction',
+    'ActionWorkflow': '.action_workflow',
+    'ActionRunner': '.action_runner'
+})
 
 __all__ = [
     'ScreenInteraction',
@@ -0,0 +1,249 @@
+"""
+Action registry for GravRokBot.
+Maps the config keys of actions (e.g. 'gather_resources') to their classes.
+Actions are registered by import path and only imported when first created,
+from the built-in table, from `gravrokbot.actions` entry points of installed
+plugins, or with the register_action decorator.
+"""
+
+import logging
+import importlib
+import threading
+from gravrokbot.utils.lazy_import import lazy_module
+
+# Only needed to look up plugins, and slow to import
+metadata = lazy_module("importlib.metadata")
+
+# Entry point group plugins declare their actions in, name = config key
+ENTRY_POINT_GROUP = "gravrokbot.actions"
+
+class ActionSpec:
+    """Registered action, its class imported on first use"""
+
+    __slots__ = ('key', 'name', 'target', 'activity', 'action_class')
+
+    def __init__(self, key, name, target, activity=True, action_class=None):
+        """
+        Initialize the action spec
+
+        Args:
+            key (str): Config key under 'actions'
+            name (str): Display name
+            target (str): Import path as 'module:Class'
+            activity (bool): Whether the action is listed as a schedulable activity
+            action_class (type, optional): Class, if already imported
+        """
+        self.key = key
+        self.name = name
+        self.target = target
+        self.activity = activity
+        self.action_class = action_class
+
+    def load(self):
+        """
+        Import the action class once
+
+        Returns:
+            type: Action class
+        """
+        if self.action_class is None:
+            module_name, _, class_name = self.target.partition(':')
+            self.action_class = getattr(importlib.import_module(module_name), class_name)
+        return self.action_class
+
+class ActionRegistry:
+    """Config key to action class mapping with lazy loading"""
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self.logger = logging.getLogger("GravRokBot.ActionRegistry")
+        self._specs = {}
+        self._lock = threading.RLock()
+        self._entry_points_loaded = False
+
+    def register(self, key, name, target, activity=True, action_class=None):
+        """
+        Register an action by import path
+
+        A later registration of the same key with another target replaces the
+        earlier one, so a plugin can override a built-in action.
+
+        Args:
+            key (str): Config key under 'actions'
+            name (str): Display name
+            target (str): Import path as 'module:Class'
+            activity (bool): Whether the action is listed as a schedulable activity
+            action_class (type, optional): Class, if already imported
+
+        Returns:
+            ActionSpec: Registered spec
+        """
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None and spec.target == target:
+                spec.name = name
+                spec.activity = activity
+                spec.action_class = action_class or spec.action_class
+                return spec
+            if spec is not None:
+                self.logger.warning(f"Action '{key}' from {spec.target} replaced by {target}")
+            spec = ActionSpec(key, name, target, activity, action_class)
+            self._specs[key] = spec
+            return spec
+
+    def action(self, key, name=None, activity=True):
+        """
+        Class decorator registering an action
+
+        Args:
+            key (str): Config key under 'actions'
+            name (str, optional): Display name, derived from the key if None
+            activity (bool): Whether the action is listed as a schedulable activity
+
+        Returns:
+            function: Decorator returning the class unchanged
+        """
+        def decorator(cls):
+            self.register(key, name or display_name(key), f"{cls.__module__}:{cls.__qualname__}",
+                          activity, action_class=cls)
+            return cls
+        return decorator
+
+    def load_entry_points(self):
+        """Register the actions declared by installed plugins, once"""
+        with self._lock:
+            if self._entry_points_loaded:
+                return
+            self._entry_points_loaded = True
+
+        try:
+            entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10
+            entry_points = metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+
+        for entry_point in entry_points:
+            self.register(entry_point.name, display_name(entry_point.name), entry_point.value)
+            self.logger.info(f"Registered plugin action '{entry_point.name}' from {entry_point.value}")
+
+    def get(self, key):
+        """
+        Get the spec of an action
+
+        Args:
+            key (str): Config key
+
+        Returns:
+            ActionSpec: Spec
+
+        Raises:
+            KeyError: If no action is registered under the key
+        """
+        try:
+            return self._specs[key]
+        except KeyError:
+            raise KeyError(f"Unknown action: {key}") from None
+
+    def __contains__(self, key):
+        return key in self._specs
+
+    def specs(self, activities_only=False):
+        """
+        Get the registered actions in registration order
+
+        Args:
+            activities_only (bool): Only the schedulable activities
+
+        Returns:
+            list: ActionSpec instances
+        """
+        return [spec for spec in self._specs.values() if spec.activity or not activities_only]
+
+    def key_for_name(self, name):
+        """
+        Get the config key of an action by its display name
+
+        Args:
+            name (str): Display name
+
+        Returns:
+            str: Config key, or None if no action has that name
+        """
+        for spec in self._specs.values():
+            if spec.name == name:
+                return spec.key
+        return None
+
+    def load(self, key):
+        """
+        Get the class of an action, importing it on first use
+
+        Args:
+            key (str): Config key
+
+        Returns:
+            type: Action class
+        """
+        return self.get(key).load()
+
+    def create(self, key, screen_interaction, config):
+        """
+        Create an action
+
+        Args:
+            key (str): Config key
+            screen_interaction (ScreenInteraction): Screen interaction instance
+            config (dict): Settings of the action
+
+        Returns:
+            ActionWorkflow: New action, its 'key' set to the config key
+        """
+        action = self.load(key)(screen_interaction, config)
+        # The display name of a plugin action need not map back to its key
+        action.key = key
+        return action
+
+def display_name(key):
+    """
+    Derive a display name from a config key
+
+    Args:
+        key (str): Config key, e.g. 'open_mails'
+
+    Returns:
+        str: Display name, e.g. 'Open Mails'
+    """
+    return key.replace('_', ' ').title()
+
+# Process-wide registry, filled with the built-in actions and plugins on first use
+registry = ActionRegistry()
+_populated = False
+
+def get_action_registry():
+    """
+    Get the process-wide action registry
+
+    Returns:
+        ActionRegistry: Registry with the built-in and plugin actions
+    """
+    global _populated
+    if not _populated:
+        _populated = True
+        # Registers the built-in actions without importing their modules
+        importlib.import_module("gravrokbot.actions")
+        registry.load_entry_points()
+    return registry
+
+def register_action(key, name=None, activity=True):
+    """
+    Class decorator registering an action with the process-wide registry
+
+    Args:
+        key (str): Config key under 'actions'
+        name (str, optional): Display name, derived from the key if None
+        activity (bool): Whether the action is listed as a schedulable activity
+
+    Returns:
+        function: Decorator returning the class unchanged
+    """
+    return registry.action(key, name, activity)
@@ -1,9 +1,15 @@
-import time
+import os
 import logging
 import threading
-import random
 from datetime import datetime, timedelta
 from gravrokbot.core.bot_runner import BotRunner
+from gravrokbot.core.tracing import get_tracer
+from gravrokbot.core.metrics import get_registry
+from gravrokbot.core.profiler import LoopProfiler
+from gravrokbot.core.rng import get_random_service
+from gravrokbot.core.adaptive_delay import get_delay_tuner
+from gravrokbot.core.event_log import get_event_log
+from gravrokbot.core.match_scores import get_match_scores
 
 class ActionRunner(BotRunner):
     """Manages and executes game actions based on scheduling and cooldowns"""
@@ -28,12 +34,18 @@ class ActionRunner(BotRunner):
         self.coffee_break_max_minutes = self.config.get('coffee_break_max_minutes', 30)
         self.coffee_break_chance = self.config.get('coffee_break_chance', 0.05)  # 5% chance per cycle
         
+        # Random stream for breaks and pauses between actions
+        self.random = get_random_service().random('runner')
+        
         # Last time the bot took a break
         self.last_break_time = None
         
         # Loop counter
         self.loop_counter = 0
         
+        # Character the actions run as, set by the UI before starting and after switches
+        self.current_character = None
+        
         # Test Mode Settings
         test_mode_config = self.config.get('test_mode', {})
         self.test_mode_enabled = test_mode_config.get('enabled', False)
@@ -43,6 +55,35 @@ class ActionRunner(BotRunner):
             self.logger.warning("----- TEST MODE ENABLED -----")
             self.logger.info(f"Dummy execution time: {self.test_mode_dummy_seconds} seconds per action.")
 
+        # Step latency tracing
+        tracing_config = self.config.get('tracing', {})
+        self.tracer = get_tracer()
+        self.tracer.enabled = tracing_config.get('enabled', True)
+        self.tracer.set_capacity(tracing_config.get('capacity', 4096))
+        self.trace_export_path = tracing_config.get('export_path', 'logs/trace_summary.json')
+        
+        # Metrics endpoint
+        metrics_config = self.config.get('metrics', {})
+        self.metrics = get_registry()
+        if metrics_config.get('enabled', False):
+            self._start_metrics(metrics_config)
+        
+        # Structured event log for analysis after the run
+        self.events = get_event_log()
+        self.events.configure(self.config.get('event_log', {}))
+        if self.events.enabled and self.events.trace_sink not in self.tracer.sinks:
+            self.tracer.add_sink(self.events.trace_sink)
+        
+        # Match score histograms, configured by the screen interaction and written every loop
+        self.match_scores = get_match_scores()
+        
+        # Delays tuned to the observed response times of the game
+        get_delay_tuner().configure(self.config.get('adaptive_delays', {}))
+        
+        # Loop profiler, set while profiling is switched on
+        self.profiling_config = self.config.get('profiling', {})
+        self.profiler = None
+
         self.logger.info("Action runner initialized")
     
     def add_action(self, action):
@@ -64,6 +105,7 @@ class ActionRunner(BotRunner):
         self.logger.info("Starting action runner")
         self.running = True
         self.interrupt_requested = False
+        self.stop_event.clear()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
     
@@ -85,23 +127,69 @@ class ActionRunner(BotRunner):
             status = "Waiting" if action.enabled else "N/A"
             self.main_window.update_action_status(action.name, status)
     
+    def _start_metrics(self, metrics_config):
+        """
+        Enable metrics collection and start the HTTP endpoint
+        
+        Args:
+            metrics_config (dict): Metrics settings with host and port
+        """
+        self.metrics.enabled = True
+        if self.metrics.trace_sink not in self.tracer.sinks:
+            self.tracer.add_sink(self.metrics.trace_sink)
+        try:
+            self.metrics.start_server(
+                metrics_config.get('host', '127.0.0.1'),
+                metrics_config.get('port', 9464)
+            )
+        except OSError as e:
+            self.logger.error(f"Error starting metrics endpoint: {e}")
+    
+    def enable_profiling(self, loops=None, mode=None):
+        """
+        Profile the next loops and write the result to the logs directory
+        
+        Args:
+            loops (int, optional): Number of loops to profile, from settings if None
+            mode (str, optional): 'sampling' or 'cprofile', from settings if None
+        """
+        self.profiler = LoopProfiler(
+            loops or self.profiling_config.get('loops', 3),
+            mode=mode or self.profiling_config.get('mode', 'sampling'),
+            output_dir=self.profiling_config.get('output_dir', 'logs'),
+            interval=self.profiling_config.get('interval_ms', 5) / 1000.0,
+            top=self.profiling_config.get('top', 15)
+        )
+        self.logger.info(f"Profiling enabled for {self.profiler.loops} loops ({self.profiler.mode})")
+    
+    def disable_profiling(self):
+        """Stop profiling and write what was collected so far"""
+        profiler = self.profiler
+        self.profiler = None
+        if profiler:
+            profiler.finish()
+    
     def _interruptible_sleep(self, seconds):
         """Sleep function that can be interrupted"""
-        end_time = time.time() + seconds
-        while time.time() < end_time:
-            # Check if interrupted
-            if self.interrupt_requested:
-                self.logger.debug("Sleep interrupted")
-                return True
-                
-            # Check if paused
-            if self.wait_if_paused():
-                return True
+        started_at = self.clock.time()
+        end_time = started_at + seconds
+        try:
+            while self.clock.time() < end_time:
+                # Check if interrupted
+                if self.interrupt_requested:
+                    self.logger.debug("Sleep interrupted")
+                    return True
+                    
+                # Check if paused
+                if self.wait_if_paused():
+                    return True
+                    
+                # Sleep in small increments to allow interruption
+                self.clock.sleep(min(self.clock.poll_interval, end_time - self.clock.time()))
                 
-            # Sleep in small increments to allow interruption
-            time.sleep(0.1)
-            
-        return False
+            return False
+        finally:
+            self.metrics.inc('gravrokbot_sleep_seconds_total', self.clock.time() - started_at)
     
     def _is_night_sleep_time(self):
         """
@@ -113,7 +201,7 @@ class ActionRunner(BotRunner):
         if not self.night_sleep_enabled:
             return False
             
-        now = datetime.now().time()
+        now = self.clock.now().time()
         start_time = datetime.strptime(self.night_sleep_start, '%H:%M').time()
         end_time = datetime.strptime(self.night_sleep_end, '%H:%M').time()
         
@@ -133,22 +221,22 @@ class ActionRunner(BotRunner):
         # Check if we recently had a break
         if self.last_break_time:
             min_break_interval = self.config.get('min_break_interval_minutes', 120)  # 2 hours minimum between breaks
-            elapsed_minutes = (datetime.now() - self.last_break_time).total_seconds() / 60
+            elapsed_minutes = (self.clock.now() - self.last_break_time).total_seconds() / 60
             if elapsed_minutes < min_break_interval:
                 return False
         
         # Random chance for coffee break
-        return random.random() < self.coffee_break_chance
+        return self.random.random() < self.coffee_break_chance
     
     def _take_coffee_break(self):
         """
         Take a coffee break (pause execution for a random time)
         """
-        break_minutes = random.uniform(self.coffee_break_min_minutes, self.coffee_break_max_minutes)
+        break_minutes = self.random.uniform(self.coffee_break_min_minutes, self.coffee_break_max_minutes)
         self.logger.info(f"Taking a coffee break for {break_minutes:.1f} minutes")
         
         # Record break time
-        self.last_break_time = datetime.now()
+        self.last_break_time = self.clock.now()
         
         # Sleep for break duration (interruptible)
         if self._interruptible_sleep(break_minutes * 60):
@@ -158,6 +246,50 @@ class ActionRunner(BotRunner):
         self.logger.info("Coffee break finished, resuming actions")
         return False
     
+    def _is_due(self, action):
+        """
+        Check if an action should run in this cycle
+        
+        Actions run when the cooldown index of the window has them off
+        cooldown for the current character. Character switches are planned
+        from the due work of all characters instead, when the switch can
+        select the planned character. Without character menu templates it
+        cannot, and the switch runs on its fixed cooldown.
+        
+        Args:
+            action (ActionWorkflow): Action to check
+            
+        Returns:
+            bool: True if the action should run now
+        """
+        if not getattr(action, 'selectable_characters', None):
+            # Actions are rebuilt every loop, so their own last run is not known here
+            return bool(self.main_window.is_action_ready(action.key, stop_event=self.stop_event))
+            
+        batch = self.main_window.plan_character_switch(action.selectable_characters, stop_event=self.stop_event)
+        if not batch:
+            action.target_character = None
+            return False
+            
+        self.logger.info(f"Switching to {batch['character']} for {len(batch['actions'])} due actions")
+        action.target_character = batch['character']
+        return True
+    
+    def _apply_character_switch(self, action):
+        """
+        Make the character an action switched to the current character
+        
+        Args:
+            action (ActionWorkflow): Executed action
+        """
+        character = getattr(action, 'switched_to', None)
+        if not character or character == self.current_character:
+            return
+        self.logger.info(f"Current character is now {character}")
+        self.current_character = character
+        # Queued before the cooldowns and executions of the following actions
+        self.main_window.update_character_name(character)
+    
     def _run_loop(self):
         """Main action runner loop"""
         self.logger.info("Action runner loop started")
@@ -165,16 +297,20 @@ class ActionRunner(BotRunner):
         try:
             while self.running and not self.interrupt_requested:
                 # Increment the loop counter and log start
+                loop_started_at = self.clock.time()
+                profiler = self.profiler
+                if profiler:
+                    profiler.begin_loop()
                 self.loop_counter += 1
                 self.logger.info(f"Start loop number {self.loop_counter}")
-                self.main_window.add_log(f"Start loop number {self.loop_counter}")
+                self.main_window.add_log(f"Start loop number {self.loop_counter}", kind='loop')
                 
                 # Refresh action list at the start of each loop - log added by the refresh method
-                self.main_window.refresh_runner_actions()
+                self.main_window.refresh_runner_actions(stop_event=self.stop_event)
                 
                 # Add log message for resetting action statuses to Waiting
                 self.logger.info("Reset actions status to Waiting")
-                self.main_window.add_log("Reset actions status to Waiting")
+                self.main_window.add_log("Reset actions status to Waiting", kind='loop')
                 
                 # Set enabled actions to "Waiting" status
                 for action in self.actions:
@@ -206,7 +342,7 @@ class ActionRunner(BotRunner):
                     
                     # Log the start of action execution
                     self.logger.info("Start Actions Execution")
-                    self.main_window.add_log("Start Actions Execution")
+                    self.main_window.add_log("Start Actions Execution", kind='loop')
                     
                     for action in self.actions:
                         # Check for interruption
@@ -217,7 +353,7 @@ class ActionRunner(BotRunner):
                             # Update action status in UI
                             self.main_window.update_action_status(action.name, "Working")
                             
-                            start_time = datetime.now().strftime("%H:%M:%S")
+                            start_time = self.clock.now().strftime("%H:%M:%S")
                             self.logger.info(f"[{start_time}] Testing Action: {action.name} - Starting (Simulating {self.test_mode_dummy_seconds}s)")
                             
                             # Simulation with interruptible sleep
@@ -227,7 +363,7 @@ class ActionRunner(BotRunner):
                             
                             # If we're still running (not interrupted), log completion
                             if self.running and not self.interrupt_requested:
-                                end_time = datetime.now().strftime("%H:%M:%S")
+                                end_time = self.clock.now().strftime("%H:%M:%S")
                                 self.logger.info(f"[{end_time}] Testing Action: {action.name} - Completed")
                                 self.main_window.update_action_status(action.name, "Done")
                                 test_executed_count += 1
@@ -241,26 +377,57 @@ class ActionRunner(BotRunner):
                     
                     # Log the start of action execution
                     self.logger.info("Start Actions Execution")
-                    self.main_window.add_log("Start Actions Execution")
+                    self.main_window.add_log("Start Actions Execution", kind='loop')
                     
                     for action in self.actions:
                         # Check for interruption
                         if not self.running or self.interrupt_requested:
                             break
                             
-                        if not action.is_on_cooldown() and action.enabled:
+                        if action.enabled and self._is_due(action):
                             # Update UI status
                             self.main_window.update_action_status(action.name, "Working")
                             
-                            # Execute action
-                            action.execute()
+                            # Execute action, the due check above already covers cooldowns
+                            character = self.current_character or 'unknown'
+                            self.events.emit('action_start', action.name, character=character)
+                            started_at = self.clock.time()
+                            action.execute(ignore_cooldown=True)
                             executed_count += 1
+                            succeeded = bool(action.succeeded)
+                            self.events.emit(
+                                'action_finish', action.name,
+                                character=character,
+                                succeeded=succeeded,
+                                retries=action.retry_count,
+                                seconds=round(self.clock.time() - started_at, 3)
+                            )
+                            
+                            self.metrics.inc('gravrokbot_actions_executed_total', character=character, action=action.name)
+                            if not succeeded:
+                                self.metrics.inc('gravrokbot_actions_failed_total', character=character, action=action.name)
+                            
+                            # Start the per-character cooldown used for planning, a failed
+                            # action stays due so the planner can come back to retry it
+                            if succeeded:
+                                self.main_window.start_cooldown(action.key, action.cooldown_minutes)
+                            
+                            # Record the run in the execution history
+                            self.main_window.record_execution(
+                                action.key,
+                                started_at,
+                                self.clock.time(),
+                                succeeded
+                            )
+                            
+                            # Charge the following actions to the character switched to
+                            self._apply_character_switch(action)
                             
                             # Update UI status after execution
-                            self.main_window.update_action_status(action.name, "Done")
+                            self.main_window.update_action_status(action.name, "Done" if succeeded else "Failed")
 
                             # Small delay between actions
-                            delay = random.uniform(1.0, 3.0)
+                            delay = self.random.uniform(1.0, 3.0)
                             if self._interruptible_sleep(delay):
                                 break
 
@@ -272,9 +439,20 @@ class ActionRunner(BotRunner):
                 if not self.running or self.interrupt_requested:
                     break
                 
+                # Export step timings of the recent loops
+                self._export_trace()
+                self.events.flush()
+                self.match_scores.flush()
+                self.metrics.inc('gravrokbot_loops_total')
+                self.metrics.observe('gravrokbot_loop_duration_seconds', self.clock.time() - loop_started_at)
+                
+                # Finish profiling once enough loops were profiled
+                if profiler and profiler.end_loop() and self.profiler is profiler:
+                    self.profiler = None
+                
                 # Log loop completion
                 self.logger.info(f"Completed loop number {self.loop_counter}")
-                self.main_window.add_log(f"Completed loop number {self.loop_counter}")
+                self.main_window.add_log(f"Completed loop number {self.loop_counter}", kind='loop')
                 
                 # Check if we should continue running
                 if not self.continuous_running:
@@ -282,10 +460,10 @@ class ActionRunner(BotRunner):
                     break
                 
                 # Calculate and log when the next loop will start
-                next_loop_time = datetime.now() + timedelta(seconds=self.refresh_rate_seconds)
+                next_loop_time = self.clock.now() + timedelta(seconds=self.refresh_rate_seconds)
                 next_loop_time_str = next_loop_time.strftime("%H:%M:%S")
                 self.logger.info(f"Next loop will start in {self.refresh_rate_seconds} seconds, at {next_loop_time_str}")
-                self.main_window.add_log(f"Next loop will start in {self.refresh_rate_seconds} seconds, at {next_loop_time_str}")
+                self.main_window.add_log(f"Next loop will start in {self.refresh_rate_seconds} seconds, at {next_loop_time_str}", kind='loop')
                     
                 # Wait for next cycle with interruptible sleep
                 self.logger.info(f"Waiting {self.refresh_rate_seconds} seconds for next cycle...")
@@ -297,11 +475,30 @@ class ActionRunner(BotRunner):
                 
         except Exception as e:
             self.logger.error(f"Error in action runner loop: {e}")
+            self.main_window.add_log(f"Error in action runner loop: {e}", kind='error')
         finally:
+            if self.profiler:
+                self.disable_profiling()
+            self.events.flush()
+            self.match_scores.flush()
             self.logger.info("Action runner loop stopped")
             self.running = False
             self.interrupt_requested = False
     
+    def _export_trace(self):
+        """Write per-action step timings to the trace export file"""
+        if not self.tracer.enabled or not self.trace_export_path:
+            return
+            
+        try:
+            export_dir = os.path.dirname(self.trace_export_path)
+            if export_dir:
+                os.makedirs(export_dir, exist_ok=True)
+            self.tracer.export(self.trace_export_path)
+            self.logger.debug(f"Step timings exported to {self.trace_export_path}")
+        except OSError as e:
+            self.logger.error(f"Error exporting step timings: {e}")
+    
     def get_action_statuses(self):
         """
         Get status information for all actions
@@ -1,8 +1,13 @@
-import time
 import logging
 import functools
 from transitions import Machine
-from datetime import datetime, timedelta
+from gravrokbot.core.tracing import get_tracer
+from gravrokbot.core.metrics import get_registry
+from gravrokbot.core.clock import get_clock
+from gravrokbot.core.adaptive_delay import get_delay_tuner
+from gravrokbot.core.config_snapshot import (
+    ActionSettings, BUILTIN_DELAY_PROFILES, compile_action, resolve_asset_path
+)
 
 class ActionWorkflow:
     """Base class for game action workflows using state machine"""
@@ -23,38 +28,7 @@ class ActionWorkflow:
     ]
     
     # Default delay profiles for common actions
-    delay_profiles = {
-        'quick': {
-            'pre_delay_min': 0.2, 
-            'pre_delay_max': 0.5,
-            'post_delay_min': 0.3, 
-            'post_delay_max': 0.6
-        },
-        'normal': {
-            'pre_delay_min': 0.5, 
-            'pre_delay_max': 1.0,
-            'post_delay_min': 0.8, 
-            'post_delay_max': 1.2
-        },
-        'verification': {
-            'pre_delay_min': 0.5,
-            'pre_delay_max': 1.0,
-            'post_delay_min': 0.2, 
-            'post_delay_max': 0.4
-        },
-        'long_wait': {
-            'pre_delay_min': 0.3, 
-            'pre_delay_max': 0.6,
-            'post_delay_min': 2.0, 
-            'post_delay_max': 3.0
-        },
-        'menu_navigation': {
-            'pre_delay_min': 0.3, 
-            'pre_delay_max': 0.7,
-            'post_delay_min': 1.0, 
-            'post_delay_max': 1.5
-        }
-    }
+    delay_profiles = BUILTIN_DELAY_PROFILES
     
     def __init__(self, name, screen_interaction, config):
         """
@@ -63,22 +37,32 @@ class ActionWorkflow:
         Args:
             name (str): Name of the action
             screen_interaction (ScreenInteraction): Screen interaction instance
-            config (dict): Configuration dict with action settings
+            config (dict or ActionSettings): Action settings, compiled here if given as a dict
         """
         self.name = name
         self.screen = screen_interaction
         self.config = config
+        if isinstance(config, ActionSettings):
+            self.settings = config
+        else:
+            self.settings = compile_action(name.lower().replace(" ", "_"), config)
+        # Config key of the action, the registry key when created through the registry
+        self.key = self.settings.key
+        # Absolute template paths, one attribute per 'images' entry
+        self.images = self.settings.images
         self.logger = logging.getLogger(f"GravRokBot.{name}")
+        self.clock = get_clock()
+        self.delay_tuner = get_delay_tuner()
         
         # Initialize cooldown settings
+        self._executed_at = None
         self.last_execution_time = None
-        self.cooldown_minutes = self.config.get('cooldown_minutes', 30)
-        self.enabled = self.config.get('enabled', True)
-        self.max_retries = self.config.get('max_retries', 3)
+        self.cooldown_minutes = self.settings.cooldown_minutes
+        self.enabled = self.settings.enabled
+        self.max_retries = self.settings.max_retries
         self.retry_count = 0
-        
-        # Load custom delay profiles from config if available
-        self.custom_delay_profiles = self.config.get('delay_profiles', {})
+        # Outcome of the last execution, None before the first one
+        self.succeeded = None
         
         # Initialize state machine
         self.machine = Machine(
@@ -94,6 +78,20 @@ class ActionWorkflow:
         # Action specific setup function should be called by subclasses
         self.setup_transitions()
     
+    @property
+    def last_execution_time(self):
+        """datetime: Wall-clock time of the last execution, None if never executed"""
+        return self._last_execution_time
+    
+    @last_execution_time.setter
+    def last_execution_time(self, value):
+        self._last_execution_time = value
+        # Keep a monotonic copy so cooldown checks are plain float arithmetic
+        if value is None:
+            self._executed_at = None
+        else:
+            self._executed_at = self.clock.monotonic() - (self.clock.now() - value).total_seconds()
+    
     def _define_common_transitions(self):
         """Define transitions common to all actions"""
         # Basic flow transitions
@@ -120,25 +118,19 @@ class ActionWorkflow:
             profile_name (str): Name of the delay profile
             
         Returns:
-            dict: Delay profile settings
+            DelayProfile: Delay ranges, None if there is no such profile
         """
-        # First check custom profiles from config
-        if profile_name in self.custom_delay_profiles:
-            return self.custom_delay_profiles[profile_name]
-        
-        # Then check built-in profiles
-        if profile_name in self.delay_profiles:
-            return self.delay_profiles[profile_name]
-        
-        # Return empty dict if not found
-        self.logger.warning(f"Delay profile '{profile_name}' not found")
-        return {}
+        profile = self.settings.delay_profiles.get(profile_name)
+        if profile is None:
+            self.logger.warning(f"Delay profile '{profile_name}' not found")
+        return profile
     
     def add_transition_with_delays(self, trigger, source, dest, profile=None, 
                                  pre_delay_min=0, pre_delay_max=0,
                                  post_delay_min=0, post_delay_max=0, 
                                  conditions=None, unless=None,
-                                 before=None, after=None, prepare=None):
+                                 before=None, after=None, prepare=None, expect=None,
+                                 expect_region=None):
         """
         Add a transition with configurable pre and post delays
         
@@ -156,19 +148,23 @@ class ActionWorkflow:
             before (str or list): Callbacks to execute before the transition
             after (str or list): Callbacks to execute after the transition
             prepare (str or list): Callbacks to execute when the trigger is activated
+            expect (str or callable, optional): Element the after callback needs, as a key of
+                the 'images' config, an image path or a function returning True once shown.
+                The pre-delay then waits for it and is tuned to its observed response time
+            expect_region (tuple, optional): Screen region (left, top, width, height) the
+                expected image is searched in, the region stored in the template bundle if None
         """
         # Apply delay profile if specified
-        if profile:
-            delay_settings = self.get_delay_profile(profile)
-            
+        delay_settings = self.get_delay_profile(profile) if profile else None
+        if delay_settings is not None:
             # Only override if not explicitly specified
             if pre_delay_min == 0 and pre_delay_max == 0:
-                pre_delay_min = delay_settings.get('pre_delay_min', 0)
-                pre_delay_max = delay_settings.get('pre_delay_max', 0)
+                pre_delay_min = delay_settings.pre_delay_min
+                pre_delay_max = delay_settings.pre_delay_max
                 
             if post_delay_min == 0 and post_delay_max == 0:
-                post_delay_min = delay_settings.get('post_delay_min', 0)
-                post_delay_max = delay_settings.get('post_delay_max', 0)
+                post_delay_min = delay_settings.post_delay_min
+                post_delay_max = delay_settings.post_delay_max
         
         if after is not None:
             # If we have an after callback, wrap it with delays
@@ -176,10 +172,16 @@ class ActionWorkflow:
             
             # Create a wrapper function that adds delays
             def delayed_after_wrapper(self, *args, **kwargs):
-                # Pre-delay
-                if pre_delay_min > 0 or pre_delay_max > 0:
+                with get_tracer().span('transition', trigger):
+                    _run_delayed_after(self, *args, **kwargs)
+            
+            def _run_delayed_after(self, *args, **kwargs):
+                # Pre-delay, tuned to the response time when an element is expected
+                if expect is not None and self.delay_tuner.enabled:
+                    self._await_expected(trigger, expect, pre_delay_min, pre_delay_max, expect_region)
+                elif pre_delay_min > 0 or pre_delay_max > 0:
                     delay_time = self.screen.humanized_wait(pre_delay_min, pre_delay_max)
-                    self.logger.debug(f"Pre-delay: {delay_time:.2f}s before {original_after}")
+                    self.logger.debug("Pre-delay: %.2fs before %s", delay_time, original_after)
                 
                 # Call the original after callback
                 # Get the method from the instance
@@ -189,7 +191,7 @@ class ActionWorkflow:
                 # Post-delay
                 if post_delay_min > 0 or post_delay_max > 0:
                     delay_time = self.screen.humanized_wait(post_delay_min, post_delay_max)
-                    self.logger.debug(f"Post-delay: {delay_time:.2f}s after {original_after}")
+                    self.logger.debug("Post-delay: %.2fs after %s", delay_time, original_after)
             
             # Dynamically create a method name for the wrapper
             wrapper_name = f"_delayed_wrapper_{original_after}"
@@ -210,6 +212,76 @@ class ActionWorkflow:
             prepare=prepare
         )
     
+    def _expected_visible(self, expect, region=None):
+        """
+        Check whether the element a transition expects is shown
+        
+        Args:
+            expect (str or callable): Images config key, image path or check function
+            region (tuple, optional): Screen region to search the image in
+            
+        Returns:
+            bool: True if the element is shown
+        """
+        if callable(expect):
+            return bool(expect())
+        
+        if expect in self.images._fields:
+            image_path = getattr(self.images, expect)
+        else:
+            image_path = resolve_asset_path(expect)
+        if region is None:
+            region = self.screen.template_region(image_path)
+        return self.screen.find_image(image_path, region=region) is not None
+    
+    def _await_expected(self, trigger, expect, min_delay, max_delay, region=None):
+        """
+        Wait for the element a transition expects, then for the rest of the tuned delay
+        
+        The time until the element is shown is recorded for the transition,
+        and the wait ends within the delay range derived from the recorded
+        times, so it is short while the game responds quickly. Checks back
+        off from the poll interval, and an element that never shows is given
+        up on after the maximum delay until the transition is tuned.
+        
+        Args:
+            trigger (str): Transition trigger
+            expect (str or callable): Expected element
+            min_delay (float): Configured minimum delay
+            max_delay (float): Configured maximum delay
+            region (tuple, optional): Screen region to search an expected image in
+            
+        Returns:
+            float: Time until the element was shown, or until giving up
+        """
+        key = f"{self.name}.{trigger}"
+        low, high = self.delay_tuner.delay_range(key, min_delay, max_delay)
+        timeout = self.delay_tuner.timeout(key, max_delay)
+        
+        started_at = self.clock.monotonic()
+        intervals = self.delay_tuner.poll_intervals()
+        shown = self._expected_visible(expect, region)
+        while not shown:
+            remaining = timeout - (self.clock.monotonic() - started_at)
+            if remaining <= 0:
+                break
+            self.clock.sleep(min(next(intervals), remaining))
+            shown = self._expected_visible(expect, region)
+        response = self.clock.monotonic() - started_at
+        
+        if shown:
+            self.delay_tuner.record(key, response)
+            get_registry().observe('gravrokbot_ui_response_seconds', response, action=self.name, transition=trigger)
+            self.logger.debug("Element for '%s' shown after %.2fs", trigger, response)
+        else:
+            self.logger.debug("Element for '%s' not shown after %.2fs", trigger, response)
+        
+        # Humanized rest of the tuned delay
+        if high > response:
+            delay_time = self.screen.humanized_wait(max(low - response, 0), high - response)
+            self.logger.debug("Pre-delay: %.2fs before %s (range %.2f-%.2fs)", response + delay_time, trigger, low, high)
+        return response
+    
     def setup_transitions(self):
         """
         Setup action-specific transitions
@@ -218,10 +290,16 @@ class ActionWorkflow:
         """
         pass
     
-    def execute(self):
+    def execute(self, ignore_cooldown=False):
         """
         Execute the action workflow
         
+        Args:
+            ignore_cooldown (bool): Run even if the action is on cooldown, used
+                when a scheduler has decided the action is due
+        
+        The outcome of the run, after retries, is left in succeeded.
+        
         Returns:
             bool: True if action was executed, False if on cooldown
         """
@@ -231,17 +309,27 @@ class ActionWorkflow:
             return False
         
         # Check cooldown
-        if self.last_execution_time:
-            elapsed_minutes = (datetime.now() - self.last_execution_time).total_seconds() / 60
-            if elapsed_minutes < self.cooldown_minutes:
-                self.logger.info(f"Action '{self.name}' on cooldown for another {self.cooldown_minutes - elapsed_minutes:.1f} minutes")
-                return False
+        remaining = 0 if ignore_cooldown else self.get_cooldown_remaining()
+        if remaining > 0:
+            self.logger.info(f"Action '{self.name}' on cooldown for another {remaining:.1f} minutes")
+            return False
         
         self.logger.info(f"Executing action: {self.name}")
-        self.start()
+        
+        # Attribute traced steps on this thread to the action
+        tracer = get_tracer()
+        tracer.set_action(self.name)
+        self.succeeded = None
+        try:
+            self.start()
+        finally:
+            tracer.set_action(None)
+            if self.succeeded is None:
+                self.logger.warning(f"Action '{self.name}' ended without reaching success or failure")
+                self.succeeded = False
         
         # Record execution time
-        self.last_execution_time = datetime.now()
+        self.last_execution_time = self.clock.now()
         
         return True
     
@@ -260,7 +348,7 @@ class ActionWorkflow:
     
     def on_wait(self):
         """Handle waiting state"""
-        wait_time = self.config.get('default_wait_time', 1.0)
+        wait_time = self.settings.default_wait_time
         self.screen.humanized_wait(wait_time * 0.8, wait_time * 1.2)
     
     def on_verify(self):
@@ -271,6 +359,14 @@ class ActionWorkflow:
         """Handle text extraction state"""
         self.logger.debug("Extracting text from screen")
     
+    def on_enter_succeeded(self):
+        """Record a successful outcome, before the success callbacks of subclasses run"""
+        self.succeeded = True
+    
+    def on_enter_failed(self):
+        """Record a failed outcome, replaced if a retry succeeds"""
+        self.succeeded = False
+    
     def on_success(self):
         """Handle success state"""
         self.logger.info(f"Action '{self.name}' succeeded")
@@ -283,6 +379,7 @@ class ActionWorkflow:
         
         if self.retry_count < self.max_retries:
             self.logger.info(f"Retrying action '{self.name}'")
+            get_registry().inc('gravrokbot_action_retries_total', action=self.name)
             self.reset()
             self.start()
         else:
@@ -304,11 +401,7 @@ class ActionWorkflow:
         Returns:
             bool: True if action is on cooldown, False otherwise
         """
-        if not self.last_execution_time:
-            return False
-            
-        elapsed_minutes = (datetime.now() - self.last_execution_time).total_seconds() / 60
-        return elapsed_minutes < self.cooldown_minutes
+        return self.get_cooldown_remaining() > 0
     
     def get_cooldown_remaining(self):
         """
@@ -317,9 +410,8 @@ class ActionWorkflow:
         Returns:
             float: Remaining cooldown time in minutes, 0 if not on cooldown
         """
-        if not self.last_execution_time:
+        if self._executed_at is None:
             return 0
             
-        elapsed_minutes = (datetime.now() - self.last_execution_time).total_seconds() / 60
-        remaining = max(0, self.cooldown_minutes - elapsed_minutes)
-        return remaining 
\ No newline at end of file
+        deadline = self._executed_at + self.cooldown_minutes * 60
+        return max(0, deadline - self.clock.monotonic()) / 60 
\ No newline at end of file
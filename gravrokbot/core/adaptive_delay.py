@@ -0,0 +1,189 @@
+"""
+Adaptive delay tuning for GravRokBot.
+Keeps rolling percentiles of how long the game takes to show the element a
+transition expects, and narrows the transition delays to the observed
+response time within the configured bounds.
+"""
+
+import logging
+import threading
+from collections import deque
+from gravrokbot.utils.lazy_import import lazy_module
+
+np = lazy_module("numpy")
+
+class AdaptiveDelayTuner:
+    """Per-transition rolling response times and the delays derived from them"""
+
+    def __init__(self, enabled=True, window=50, percentile=90, min_samples=5,
+                 jitter=0.15, timeout_factor=2.0, poll_interval=0.1,
+                 poll_backoff=1.5, max_poll_interval=0.5):
+        """
+        Initialize the tuner
+
+        Args:
+            enabled (bool): Whether transitions with an expected element are tuned
+            window (int): Number of recent response times kept per transition
+            percentile (float): Percentile of the response times the delay is based on
+            min_samples (int): Samples needed before the configured delays are narrowed
+            jitter (float): Relative spread added above the percentile for humanized delays
+            timeout_factor (float): Multiple of the maximum delay to wait for the element,
+                once the transition has a tuned delay
+            poll_interval (float): Seconds before the second check for the expected element
+            poll_backoff (float): Factor the interval grows by after every check
+            max_poll_interval (float): Longest interval between checks
+        """
+        self.logger = logging.getLogger("GravRokBot.AdaptiveDelay")
+        self.enabled = enabled
+        self.window = window
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.jitter = jitter
+        self.timeout_factor = timeout_factor
+        self.poll_interval = poll_interval
+        self.poll_backoff = poll_backoff
+        self.max_poll_interval = max_poll_interval
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def configure(self, config):
+        """
+        Apply settings, keeping the samples collected so far
+
+        Args:
+            config (dict): Settings with the same names as the constructor arguments
+        """
+        self.enabled = config.get('enabled', self.enabled)
+        self.percentile = config.get('percentile', self.percentile)
+        self.min_samples = config.get('min_samples', self.min_samples)
+        self.jitter = config.get('jitter', self.jitter)
+        self.timeout_factor = config.get('timeout_factor', self.timeout_factor)
+        self.poll_interval = config.get('poll_interval', self.poll_interval)
+        self.poll_backoff = config.get('poll_backoff', self.poll_backoff)
+        self.max_poll_interval = config.get('max_poll_interval', self.max_poll_interval)
+
+        window = config.get('window', self.window)
+        if window != self.window:
+            self.window = window
+            with self._lock:
+                self._samples = {key: deque(samples, maxlen=window) for key, samples in self._samples.items()}
+
+    def record(self, key, seconds):
+        """
+        Record an observed response time
+
+        Args:
+            key (str): Transition key, e.g. 'Gather Resources.click_gather'
+            seconds (float): Time until the expected element was shown
+        """
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def observed(self, key):
+        """
+        Get the response time percentile of a transition
+
+        Args:
+            key (str): Transition key
+
+        Returns:
+            float: Percentile in seconds, None until enough samples are recorded
+        """
+        with self._lock:
+            samples = self._samples.get(key)
+            if not samples or len(samples) < self.min_samples:
+                return None
+            return float(np.percentile(samples, self.percentile))
+
+    def delay_range(self, key, min_delay, max_delay):
+        """
+        Get the delay range of a transition
+
+        The range starts at the observed percentile and spreads by the jitter
+        above it, clamped to the configured bounds, so the delay shrinks
+        towards the minimum while the game is responsive and grows towards
+        the maximum while it lags.
+
+        Args:
+            key (str): Transition key
+            min_delay (float): Configured minimum delay
+            max_delay (float): Configured maximum delay
+
+        Returns:
+            tuple: (min, max) delay in seconds, the configured bounds until enough samples are recorded
+        """
+        observed = self.observed(key)
+        if observed is None:
+            return min_delay, max_delay
+
+        low = min(max(observed, min_delay), max_delay)
+        high = min(max(observed * (1 + self.jitter), min_delay), max_delay)
+        return low, high
+
+    def timeout(self, key, max_delay):
+        """
+        Get how long to wait for the element a transition expects
+
+        Until the transition has a tuned delay, an element that never shows
+        costs no more than the configured maximum delay.
+
+        Args:
+            key (str): Transition key
+            max_delay (float): Configured maximum delay
+
+        Returns:
+            float: Timeout in seconds
+        """
+        if self.observed(key) is None:
+            return max_delay
+        return max_delay * self.timeout_factor
+
+    def poll_intervals(self):
+        """
+        Generate the intervals between checks for an expected element
+
+        Yields:
+            float: Seconds to wait, growing by the backoff up to the maximum interval
+        """
+        interval = self.poll_interval
+        while True:
+            yield interval
+            interval = min(interval * self.poll_backoff, max(self.max_poll_interval, self.poll_interval))
+
+    def summary(self):
+        """
+        Get the samples and percentile of every transition
+
+        Returns:
+            dict: Transition key -> {'samples': int, 'p50': float, 'percentile': float}
+        """
+        with self._lock:
+            snapshot = {key: list(samples) for key, samples in self._samples.items()}
+        return {
+            key: {
+                'samples': len(samples),
+                'p50': round(float(np.percentile(samples, 50)), 4),
+                'percentile': round(float(np.percentile(samples, self.percentile)), 4)
+            }
+            for key, samples in snapshot.items() if samples
+        }
+
+    def reset(self):
+        """Drop all recorded response times"""
+        with self._lock:
+            self._samples.clear()
+
+# Process-wide tuner, so response times outlive recreated actions
+tuner = AdaptiveDelayTuner()
+
+def get_delay_tuner():
+    """
+    Get the process-wide delay tuner
+
+    Returns:
+        AdaptiveDelayTuner: Shared tuner
+    """
+    return tuner
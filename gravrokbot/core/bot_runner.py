@@ -1,5 +1,6 @@
 import logging
 import threading
+from gravrokbot.core.clock import get_clock
 
 class BotRunner:
     """Base class defining common runner interface"""
@@ -7,11 +8,14 @@ class BotRunner:
     def __init__(self, main_window, config):
         self.main_window = main_window
         self.config = config
+        self.clock = get_clock()
         self.logger = logging.getLogger("GravRokBot.Runner")
         self.running = False
         self.paused = False
         self.actions = []
         self.interrupt_requested = False
+        # Set when the runner is stopped, wakes waits on the UI
+        self.stop_event = threading.Event()
         self.pause_event = threading.Event()
         self.pause_event.set()  # Start in non-paused state
     
@@ -87,6 +91,7 @@ class BotRunner:
         self.logger.info("Interrupt requested")
         self.interrupt_requested = True
         self.running = False
+        self.stop_event.set()
         self.resume()  # Make sure we're not blocked on pause
     
     def get_action_statuses(self):
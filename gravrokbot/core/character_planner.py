@@ -0,0 +1,111 @@
+"""
+Character switch planner for GravRokBot.
+Groups due actions by character and orders character switches so that
+each (slow) switch is followed by as many actions as possible.
+"""
+
+class CharacterPlanner:
+    """Plans which character to switch to based on cooldown deadlines"""
+
+    def __init__(self, cooldown_index, lookahead_seconds=0, min_batch_size=1, max_wait_seconds=None):
+        """
+        Initialize the planner
+
+        Args:
+            cooldown_index (CooldownIndex): Index with per-character cooldown deadlines
+            lookahead_seconds (float): Actions that become due within this window are
+                counted as due, they will be ready by the time the switch finishes
+            min_batch_size (int): Minimum number of due actions worth switching for
+            max_wait_seconds (float, optional): Switch anyway once a character's work
+                has been due for this long, even if its batch is small
+        """
+        self.cooldown_index = cooldown_index
+        self.lookahead_seconds = lookahead_seconds
+        self.min_batch_size = min_batch_size
+        self.max_wait_seconds = max_wait_seconds
+
+    def due_actions(self, character, actions, now=None):
+        """
+        Get the actions of a character that are due
+
+        Args:
+            character (str): Character name
+            actions (list): Enabled action keys of the character
+            now (float, optional): Current time on the cooldown index clock
+
+        Returns:
+            tuple: (due action keys, seconds the oldest due action has been waiting)
+        """
+        now = self.cooldown_index.clock() if now is None else now
+        horizon = now + self.lookahead_seconds
+
+        due = []
+        overdue_seconds = 0.0
+        for action in actions:
+            deadline = self.cooldown_index.deadline(character, action)
+            if deadline is None:
+                # Never run or cooldown cleared, waiting for an unknown time
+                due.append(action)
+                overdue_seconds = float('inf')
+            elif deadline <= horizon:
+                due.append(action)
+                overdue_seconds = max(overdue_seconds, now - deadline)
+        return due, overdue_seconds
+
+    def plan(self, actions_by_character, current_character=None, now=None):
+        """
+        Build the order in which characters should be visited
+
+        The current character comes first when it has due work, since staying
+        costs no switch. Other characters follow by batch size, largest first,
+        then by how long their work has been waiting.
+
+        Args:
+            actions_by_character (dict): Mapping of character to enabled action keys
+            current_character (str, optional): Character that is logged in now
+            now (float, optional): Current time on the cooldown index clock
+
+        Returns:
+            list: Batches as dicts with 'character', 'actions' and 'overdue_seconds'
+        """
+        now = self.cooldown_index.clock() if now is None else now
+
+        current_batch = []
+        other_batches = []
+        for character, actions in actions_by_character.items():
+            due, overdue_seconds = self.due_actions(character, actions, now)
+            if not due:
+                continue
+
+            batch = {'character': character, 'actions': due, 'overdue_seconds': overdue_seconds}
+            if character == current_character:
+                current_batch.append(batch)
+            elif self._worth_switching(batch):
+                other_batches.append(batch)
+
+        other_batches.sort(key=lambda batch: (-len(batch['actions']), -batch['overdue_seconds']))
+        return current_batch + other_batches
+
+    def next_switch(self, actions_by_character, current_character, now=None):
+        """
+        Get the character to switch to next
+
+        Args:
+            actions_by_character (dict): Mapping of character to enabled action keys
+            current_character (str): Character that is logged in now
+            now (float, optional): Current time on the cooldown index clock
+
+        Returns:
+            dict: Batch of the character to switch to, None if the current
+                character still has due work or no switch is worth it
+        """
+        batches = self.plan(actions_by_character, current_character, now)
+        if not batches or batches[0]['character'] == current_character:
+            return None
+        return batches[0]
+
+    def _worth_switching(self, batch):
+        """Check if a batch is large enough, or has waited long enough, for a switch"""
+        if len(batch['actions']) >= self.min_batch_size:
+            return True
+        return self.max_wait_seconds is not None and batch['overdue_seconds'] >= self.max_wait_seconds
@@ -0,0 +1,129 @@
+"""
+Clock abstraction for GravRokBot.
+All delays, cooldowns and schedules read time and sleep through a clock so
+that a simulated clock can replace real time, e.g. to run a full day of
+scheduling in seconds.
+"""
+
+import time
+import threading
+from datetime import datetime, timedelta
+
+class SystemClock:
+    """Clock backed by the real system time"""
+
+    # Real time passes, so interruptible waits poll in short steps
+    simulated = False
+    poll_interval = 0.1
+
+    def monotonic(self):
+        """
+        Get monotonic time for measuring intervals
+
+        Returns:
+            float: Seconds on the monotonic clock
+        """
+        return time.monotonic()
+
+    def time(self):
+        """
+        Get the current Unix timestamp
+
+        Returns:
+            float: Seconds since the epoch
+        """
+        return time.time()
+
+    def now(self):
+        """
+        Get the current local date and time
+
+        Returns:
+            datetime: Current time
+        """
+        return datetime.now()
+
+    def sleep(self, seconds):
+        """
+        Block for a number of seconds
+
+        Args:
+            seconds (float): Time to sleep
+        """
+        if seconds > 0:
+            time.sleep(seconds)
+
+class SimulatedClock:
+    """Clock whose time only moves when something sleeps or advances it"""
+
+    # Nothing happens while simulated time passes, so waits need no polling steps
+    simulated = True
+    poll_interval = float('inf')
+
+    def __init__(self, start=None):
+        """
+        Initialize the simulated clock
+
+        Args:
+            start (datetime, optional): Local time the clock starts at, now if None
+        """
+        self.start = start or datetime.now()
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        """Get simulated monotonic time, starting at 0"""
+        return self.elapsed
+
+    def time(self):
+        """Get the simulated Unix timestamp"""
+        return self.start.timestamp() + self.elapsed
+
+    def now(self):
+        """Get the simulated local date and time"""
+        return self.start + timedelta(seconds=self.elapsed)
+
+    def sleep(self, seconds):
+        """
+        Advance the clock instead of blocking
+
+        Args:
+            seconds (float): Time to sleep
+        """
+        if seconds > 0:
+            self.advance(seconds)
+
+    def advance(self, seconds):
+        """
+        Move simulated time forward
+
+        Args:
+            seconds (float): Seconds to add
+        """
+        with self._lock:
+            self.elapsed += seconds
+
+# Process-wide clock used when a component is not given its own
+_clock = SystemClock()
+
+def get_clock():
+    """
+    Get the process-wide clock
+
+    Returns:
+        SystemClock or SimulatedClock: Current clock
+    """
+    return _clock
+
+def set_clock(clock):
+    """
+    Replace the process-wide clock, e.g. with a SimulatedClock
+
+    Components read the clock when they are created, so set it before
+    creating screen interaction, actions and runners.
+
+    Args:
+        clock: Clock to use, SystemClock() to go back to real time
+    """
+    global _clock
+    _clock = clock
@@ -0,0 +1,560 @@
+"""
+Compiled configuration for GravRokBot.
+Settings are loaded and merged once, validated, and compiled into frozen
+snapshots: template paths are resolved to absolute paths and delay profiles
+are merged, so actions do no dict walking or path joining per step. A
+watcher reloads the files when they change and swaps in the new snapshot
+as a whole, keeping the previous one if the new files do not validate.
+"""
+
+import os
+import sys
+import json
+import logging
+import threading
+from types import MappingProxyType
+from collections import namedtuple
+from dataclasses import dataclass
+
+# Base directory relative template paths are resolved against
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_DIR = os.path.join(PACKAGE_DIR, "config")
+DEFAULT_SETTINGS_PATH = os.path.join(CONFIG_DIR, "default_settings.json")
+USER_SETTINGS_PATH = os.path.join(CONFIG_DIR, "settings.json")
+
+# Built-in delay profiles, overridden by the 'delay_profiles' settings
+BUILTIN_DELAY_PROFILES = {
+    'quick': {
+        'pre_delay_min': 0.2,
+        'pre_delay_max': 0.5,
+        'post_delay_min': 0.3,
+        'post_delay_max': 0.6
+    },
+    'normal': {
+        'pre_delay_min': 0.5,
+        'pre_delay_max': 1.0,
+        'post_delay_min': 0.8,
+        'post_delay_max': 1.2
+    },
+    'verification': {
+        'pre_delay_min': 0.5,
+        'pre_delay_max': 1.0,
+        'post_delay_min': 0.2,
+        'post_delay_max': 0.4
+    },
+    'long_wait': {
+        'pre_delay_min': 0.3,
+        'pre_delay_max': 0.6,
+        'post_delay_min': 2.0,
+        'post_delay_max': 3.0
+    },
+    'menu_navigation': {
+        'pre_delay_min': 0.3,
+        'pre_delay_max': 0.7,
+        'post_delay_min': 1.0,
+        'post_delay_max': 1.5
+    }
+}
+
+MOUSE_MOTIONS = ('linear', 'curved')
+MATCH_METHODS = ('ccoeff', 'edges', 'concordance')
+
+# Slotted dataclasses need Python 3.10
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+class ConfigError(ValueError):
+    """Settings that do not validate, with the list of problems"""
+
+    def __init__(self, problems):
+        """
+        Initialize the error
+
+        Args:
+            problems (list): Descriptions of the invalid settings
+        """
+        self.problems = list(problems)
+        super().__init__("Invalid settings: " + "; ".join(self.problems))
+
+@dataclass(frozen=True, **_SLOTS)
+class DelayProfile:
+    """Pre- and post-delay ranges of a transition, in seconds"""
+    pre_delay_min: float = 0.0
+    pre_delay_max: float = 0.0
+    post_delay_min: float = 0.0
+    post_delay_max: float = 0.0
+
+@dataclass(frozen=True, **_SLOTS)
+class ActionSettings:
+    """Compiled settings of one action"""
+    key: str
+    enabled: bool
+    cooldown_minutes: float
+    max_retries: int
+    default_wait_time: float
+    images: tuple
+    delay_profiles: MappingProxyType
+    raw: MappingProxyType
+
+    def get(self, name, default=None):
+        """Get a raw setting, e.g. 'game_path'"""
+        return self.raw.get(name, default)
+
+    def __getitem__(self, name):
+        return self.raw[name]
+
+    def __contains__(self, name):
+        return name in self.raw
+
+@dataclass(frozen=True, **_SLOTS)
+class ConfigSnapshot:
+    """Compiled, read-only view of all settings"""
+    settings: MappingProxyType
+    actions: MappingProxyType
+    delay_profiles: MappingProxyType
+    version: int = 0
+
+    def section(self, name):
+        """
+        Get a mutable copy of a settings section, e.g. 'runner' or 'screen'
+
+        Args:
+            name (str): Section name
+
+        Returns:
+            dict: Copy of the section
+        """
+        return thaw(self.settings.get(name, {}))
+
+    def to_dict(self):
+        """
+        Get a mutable copy of all settings
+
+        Returns:
+            dict: Merged settings
+        """
+        return thaw(self.settings)
+
+def freeze(value):
+    """
+    Make a read-only deep copy of parsed JSON
+
+    Args:
+        value: Dicts, lists and scalars
+
+    Returns:
+        Mapping proxies, tuples and scalars
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """
+    Make a mutable deep copy of a frozen value
+
+    Args:
+        value: Mapping proxies, tuples and scalars
+
+    Returns:
+        Dicts, lists and scalars
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+def merge_dicts(base, override):
+    """
+    Recursively merge override into base, in place
+
+    Args:
+        base (dict): Settings to update
+        override (dict): Settings that take precedence
+    """
+    for key, value in override.items():
+        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
+            merge_dicts(base[key], value)
+        else:
+            base[key] = value
+
+def load_settings(default_path=DEFAULT_SETTINGS_PATH, user_path=USER_SETTINGS_PATH):
+    """
+    Load the default settings merged with the user settings
+
+    Args:
+        default_path (str): Default settings file
+        user_path (str): User settings file, skipped if missing
+
+    Returns:
+        dict: Merged settings
+    """
+    with open(default_path, 'r') as f:
+        settings = json.load(f)
+    if user_path and os.path.exists(user_path):
+        with open(user_path, 'r') as f:
+            merge_dicts(settings, json.load(f))
+    return settings
+
+def resolve_asset_path(path, base_dir=PACKAGE_DIR):
+    """
+    Resolve a template path relative to the package directory
+
+    Args:
+        path (str): Absolute or package-relative path
+        base_dir (str): Directory relative paths are resolved against
+
+    Returns:
+        str: Absolute path
+    """
+    if os.path.isabs(path):
+        return path
+    return os.path.normpath(os.path.join(base_dir, path))
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _check_number(problems, where, value, minimum=0.0, maximum=None, integer=False):
+    """Record a problem unless value is a number within the bounds"""
+    valid = isinstance(value, int) and not isinstance(value, bool) if integer else _is_number(value)
+    if not valid:
+        problems.append(f"{where} must be {'an integer' if integer else 'a number'}, got {value!r}")
+    elif value < minimum or (maximum is not None and value > maximum):
+        bounds = f"between {minimum} and {maximum}" if maximum is not None else f"at least {minimum}"
+        problems.append(f"{where} must be {bounds}, got {value!r}")
+
+def compile_delay_profiles(profiles, where, problems, base=None):
+    """
+    Validate delay profiles and merge them over a base set
+
+    Args:
+        profiles (dict): Profile name to delay ranges
+        where (str): Settings path for problem messages
+        problems (list): Problems found so far, appended to
+        base (dict, optional): Compiled profiles the new ones override
+
+    Returns:
+        dict: Profile name to DelayProfile
+    """
+    compiled = dict(base or {})
+    if not isinstance(profiles, dict):
+        problems.append(f"{where} must be an object")
+        return compiled
+
+    for name, values in profiles.items():
+        if not isinstance(values, dict):
+            problems.append(f"{where}.{name} must be an object")
+            continue
+        for field in values:
+            if field not in DelayProfile.__dataclass_fields__:
+                problems.append(f"{where}.{name}.{field} is not a delay setting")
+        for field in DelayProfile.__dataclass_fields__:
+            if field in values:
+                _check_number(problems, f"{where}.{name}.{field}", values[field])
+        profile = DelayProfile(**{field: float(values[field]) for field in DelayProfile.__dataclass_fields__
+                                  if _is_number(values.get(field))})
+        if profile.pre_delay_min > profile.pre_delay_max or profile.post_delay_min > profile.post_delay_max:
+            problems.append(f"{where}.{name} has a minimum delay above its maximum")
+        compiled[name] = profile
+    return compiled
+
+def compile_images(images, where, problems, base_dir=PACKAGE_DIR):
+    """
+    Validate template paths and resolve them to absolute paths
+
+    Args:
+        images (dict): Template name to a path or a list of paths
+        where (str): Settings path for problem messages
+        problems (list): Problems found so far, appended to
+        base_dir (str): Directory relative paths are resolved against
+
+    Returns:
+        tuple: Named tuple with an attribute per template
+    """
+    if not isinstance(images, dict):
+        problems.append(f"{where} must be an object")
+        images = {}
+
+    resolved = {}
+    for name, path in images.items():
+        if not name.isidentifier() or name.startswith('_'):
+            problems.append(f"{where}.{name} is not a valid template name")
+            continue
+        if isinstance(path, str):
+            resolved[name] = resolve_asset_path(path, base_dir)
+        elif isinstance(path, (list, tuple)) and all(isinstance(item, str) for item in path):
+            resolved[name] = tuple(resolve_asset_path(item, base_dir) for item in path)
+        else:
+            problems.append(f"{where}.{name} must be a path or a list of paths")
+    return namedtuple('ImagePaths', resolved.keys())(**resolved)
+
+def compile_action(key, config, problems=None, shared_profiles=None, base_dir=PACKAGE_DIR):
+    """
+    Compile the settings of one action
+
+    Args:
+        key (str): Config key of the action
+        config (dict): Action settings
+        problems (list, optional): Problems found so far, appended to; raises if None
+        shared_profiles (dict, optional): Compiled profiles the action's own profiles override
+        base_dir (str): Directory relative template paths are resolved against
+
+    Returns:
+        ActionSettings: Compiled settings
+
+    Raises:
+        ConfigError: If problems is None and the settings do not validate
+    """
+    collected = [] if problems is None else problems
+    where = f"actions.{key}"
+    if not isinstance(config, dict):
+        collected.append(f"{where} must be an object")
+        config = {}
+
+    enabled = config.get('enabled', True)
+    if not isinstance(enabled, bool):
+        collected.append(f"{where}.enabled must be true or false")
+    cooldown_minutes = config.get('cooldown_minutes', 30)
+    _check_number(collected, f"{where}.cooldown_minutes", cooldown_minutes)
+    max_retries = config.get('max_retries', 3)
+    _check_number(collected, f"{where}.max_retries", max_retries, integer=True)
+    default_wait_time = config.get('default_wait_time', 1.0)
+    _check_number(collected, f"{where}.default_wait_time", default_wait_time)
+    character_images = config.get('character_images', {})
+    if not isinstance(character_images, dict) or not all(isinstance(path, str) for path in character_images.values()):
+        collected.append(f"{where}.character_images must map character names to paths")
+
+    profiles = shared_profiles
+    if profiles is None:
+        profiles = compile_delay_profiles(BUILTIN_DELAY_PROFILES, "delay_profiles", collected)
+    profiles = compile_delay_profiles(config.get('delay_profiles', {}), f"{where}.delay_profiles", collected, profiles)
+
+    settings = ActionSettings(
+        key=key,
+        enabled=bool(enabled),
+        cooldown_minutes=cooldown_minutes,
+        max_retries=max_retries,
+        default_wait_time=default_wait_time,
+        images=compile_images(config.get('images', {}), f"{where}.images", collected, base_dir),
+        delay_profiles=MappingProxyType(profiles),
+        raw=freeze(config)
+    )
+    if problems is None and collected:
+        raise ConfigError(collected)
+    return settings
+
+def validate_screen(screen, problems):
+    """
+    Validate the screen settings
+
+    Args:
+        screen (dict): Screen settings
+        problems (list): Problems found so far, appended to
+    """
+    if not isinstance(screen, dict):
+        problems.append("screen must be an object")
+        return
+    if 'default_confidence' in screen:
+        _check_number(problems, "screen.default_confidence", screen['default_confidence'], 0.0, 1.0)
+    for name in ('input_delay', 'click_randomize_range', 'move_duration_min', 'move_duration_max'):
+        if name in screen:
+            _check_number(problems, f"screen.{name}", screen[name])
+    duration_min, duration_max = screen.get('move_duration_min', 0), screen.get('move_duration_max', 0)
+    if _is_number(duration_min) and _is_number(duration_max) and duration_min > duration_max:
+        problems.append("screen.move_duration_min is above screen.move_duration_max")
+    if screen.get('mouse_motion', 'linear') not in MOUSE_MOTIONS:
+        problems.append(f"screen.mouse_motion must be one of {', '.join(MOUSE_MOTIONS)}")
+    if screen.get('match_method', 'ccoeff') not in MATCH_METHODS:
+        problems.append(f"screen.match_method must be one of {', '.join(MATCH_METHODS)}")
+    thresholds = screen.get('template_thresholds', {})
+    if not isinstance(thresholds, dict):
+        problems.append("screen.template_thresholds must be an object")
+    else:
+        for template, threshold in thresholds.items():
+            _check_number(problems, f"screen.template_thresholds.{template}", threshold, 0.0, 1.0)
+    telemetry = screen.get('score_telemetry', {})
+    if not isinstance(telemetry, dict):
+        problems.append("screen.score_telemetry must be an object")
+    elif 'near_miss_floor' in telemetry:
+        _check_number(problems, "screen.score_telemetry.near_miss_floor", telemetry['near_miss_floor'], 0.0, 1.0)
+    scales = screen.get('match_scales', [1.0])
+    if not isinstance(scales, list) or not scales or not all(_is_number(scale) and scale > 0 for scale in scales):
+        problems.append("screen.match_scales must be a non-empty list of positive numbers")
+
+def validate_runner(runner, problems):
+    """
+    Validate the runner settings
+
+    Args:
+        runner (dict): Runner settings
+        problems (list): Problems found so far, appended to
+    """
+    if not isinstance(runner, dict):
+        problems.append("runner must be an object")
+        return
+    if 'refresh_rate_seconds' in runner:
+        _check_number(problems, "runner.refresh_rate_seconds", runner['refresh_rate_seconds'], 1)
+    if 'coffee_break_chance' in runner:
+        _check_number(problems, "runner.coffee_break_chance", runner['coffee_break_chance'], 0.0, 1.0)
+
+def compile_settings(settings, version=0, base_dir=PACKAGE_DIR):
+    """
+    Validate merged settings and compile them into a snapshot
+
+    Args:
+        settings (dict): Merged settings
+        version (int): Number of the snapshot, increased on every reload
+        base_dir (str): Directory relative template paths are resolved against
+
+    Returns:
+        ConfigSnapshot: Compiled snapshot
+
+    Raises:
+        ConfigError: If the settings do not validate
+    """
+    problems = []
+    if not isinstance(settings, dict):
+        raise ConfigError(["settings must be an object"])
+
+    validate_screen(settings.get('screen', {}), problems)
+    validate_runner(settings.get('runner', {}), problems)
+
+    profiles = compile_delay_profiles(BUILTIN_DELAY_PROFILES, "delay_profiles", problems)
+    profiles = compile_delay_profiles(settings.get('delay_profiles', {}), "delay_profiles", problems, profiles)
+
+    actions = {}
+    action_settings = settings.get('actions', {})
+    if not isinstance(action_settings, dict):
+        problems.append("actions must be an object")
+        action_settings = {}
+    for key, config in action_settings.items():
+        actions[key] = compile_action(key, config, problems, profiles, base_dir)
+
+    if problems:
+        raise ConfigError(problems)
+
+    return ConfigSnapshot(
+        settings=freeze(settings),
+        actions=MappingProxyType(actions),
+        delay_profiles=MappingProxyType(profiles),
+        version=version
+    )
+
+def load_snapshot(default_path=DEFAULT_SETTINGS_PATH, user_path=USER_SETTINGS_PATH, version=0):
+    """
+    Load, validate and compile the settings files
+
+    Args:
+        default_path (str): Default settings file
+        user_path (str): User settings file, skipped if missing
+        version (int): Number of the snapshot
+
+    Returns:
+        ConfigSnapshot: Compiled snapshot
+
+    Raises:
+        ConfigError: If the settings do not validate
+        OSError, ValueError: If a file cannot be read or parsed
+    """
+    return compile_settings(load_settings(default_path, user_path), version)
+
+class ConfigWatcher:
+    """Reloads the settings files when they change and swaps in the new snapshot"""
+
+    def __init__(self, default_path=DEFAULT_SETTINGS_PATH, user_path=USER_SETTINGS_PATH,
+                 interval=1.0, on_change=None, snapshot=None):
+        """
+        Initialize the watcher
+
+        Args:
+            default_path (str): Default settings file
+            user_path (str): User settings file
+            interval (float): Seconds between checks of the file modification times
+            on_change (callable, optional): Called with each new snapshot, on the watcher thread
+            snapshot (ConfigSnapshot, optional): Current snapshot, loaded from the files if None
+        """
+        self.default_path = default_path
+        self.user_path = user_path
+        self.interval = interval
+        self.on_change = on_change
+        self.logger = logging.getLogger("GravRokBot.Config")
+        self._stamps = self._read_stamps()
+        self.snapshot = snapshot or load_snapshot(default_path, user_path)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _read_stamps(self):
+        """Get the modification time and size of each settings file"""
+        stamps = []
+        for path in (self.default_path, self.user_path):
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def current(self):
+        """
+        Get the current snapshot
+
+        Returns:
+            ConfigSnapshot: Snapshot in effect
+        """
+        return self.snapshot
+
+    def mark_current(self):
+        """Accept the files as they are now, e.g. after the UI saved the settings itself"""
+        self._stamps = self._read_stamps()
+
+    def check(self):
+        """
+        Reload the settings if a file changed
+
+        Returns:
+            ConfigSnapshot: New snapshot, or None if nothing changed or the new settings are invalid
+        """
+        stamps = self._read_stamps()
+        if stamps == self._stamps:
+            return None
+        self._stamps = stamps
+
+        try:
+            snapshot = load_snapshot(self.default_path, self.user_path, self.snapshot.version + 1)
+        except ConfigError as e:
+            self.logger.error(f"Settings not reloaded, keeping the previous ones: {e}")
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Settings not reloaded, could not read them: {e}")
+            return None
+
+        # A single reference assignment: readers see the old or the new snapshot
+        self.snapshot = snapshot
+        self.logger.info(f"Settings reloaded (version {snapshot.version})")
+        if self.on_change:
+            self.on_change(snapshot)
+        return snapshot
+
+    def start(self):
+        """Start checking the files on a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.error(f"Error checking settings files: {e}")
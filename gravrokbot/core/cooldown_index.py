@@ -0,0 +1,190 @@
+"""
+Cooldown index for GravRokBot.
+Keeps cooldown deadlines per character as monotonic-clock floats in sorted
+order, so readiness checks and "what expires next" need no date parsing.
+"""
+
+import time
+import bisect
+from datetime import datetime
+
+class CooldownIndex:
+    """Sorted index of cooldown deadlines for each character"""
+
+    def __init__(self, clock=time.monotonic, wall_clock=datetime.now):
+        """
+        Initialize an empty index
+
+        Args:
+            clock (callable): Monotonic time source returning seconds
+            wall_clock (callable): Local time source returning a datetime, used
+                to convert stored end times
+        """
+        self.clock = clock
+        self.wall_clock = wall_clock
+        # character -> {action: deadline}
+        self._deadlines = {}
+        # character -> sorted list of (deadline, action)
+        self._ordered = {}
+
+    def set_deadline(self, character, action, deadline):
+        """
+        Set the cooldown deadline of an action
+
+        Args:
+            character (str): Character name
+            action (str): Action key
+            deadline (float): Deadline on the index clock
+        """
+        self.clear(character, action)
+        self._deadlines.setdefault(character, {})[action] = deadline
+        bisect.insort(self._ordered.setdefault(character, []), (deadline, action))
+
+    def start(self, character, action, seconds):
+        """
+        Start a cooldown that ends a number of seconds from now
+
+        Args:
+            character (str): Character name
+            action (str): Action key
+            seconds (float): Cooldown length in seconds
+
+        Returns:
+            float: Deadline on the index clock
+        """
+        deadline = self.clock() + seconds
+        self.set_deadline(character, action, deadline)
+        return deadline
+
+    def set_wall_deadline(self, character, action, end_time):
+        """
+        Set a deadline given as a wall-clock time, e.g. loaded from disk
+
+        Args:
+            character (str): Character name
+            action (str): Action key
+            end_time (datetime or str): Wall-clock end time, ISO strings are parsed once here
+        """
+        if isinstance(end_time, str):
+            end_time = datetime.fromisoformat(end_time)
+        seconds_left = (end_time - self.wall_clock()).total_seconds()
+        self.set_deadline(character, action, self.clock() + seconds_left)
+
+    def clear(self, character, action):
+        """
+        Remove the cooldown of an action
+
+        Args:
+            character (str): Character name
+            action (str): Action key
+        """
+        deadline = self._deadlines.get(character, {}).pop(action, None)
+        if deadline is None:
+            return
+        ordered = self._ordered[character]
+        del ordered[bisect.bisect_left(ordered, (deadline, action))]
+
+    def clear_character(self, character):
+        """
+        Remove all cooldowns of a character
+
+        Args:
+            character (str): Character name
+        """
+        self._deadlines.pop(character, None)
+        self._ordered.pop(character, None)
+
+    def deadline(self, character, action):
+        """
+        Get the deadline of an action
+
+        Returns:
+            float: Deadline on the index clock, None if not on cooldown
+        """
+        return self._deadlines.get(character, {}).get(action)
+
+    def remaining(self, character, action, now=None):
+        """
+        Get the remaining cooldown time of an action
+
+        Args:
+            character (str): Character name
+            action (str): Action key
+            now (float, optional): Current time on the index clock
+
+        Returns:
+            float: Remaining seconds, 0 if ready
+        """
+        deadline = self.deadline(character, action)
+        if deadline is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        return max(0.0, deadline - now)
+
+    def is_ready(self, character, action, now=None):
+        """
+        Check whether an action is off cooldown
+
+        Returns:
+            bool: True if the action is not on cooldown
+        """
+        return self.remaining(character, action, now) == 0
+
+    def next_expiry(self, character=None):
+        """
+        Get the cooldown that expires next
+
+        Args:
+            character (str, optional): Limit to one character, all characters if None
+
+        Returns:
+            tuple: (deadline, character, action), None if nothing is on cooldown
+        """
+        characters = [character] if character is not None else self._ordered.keys()
+        earliest = None
+        for name in characters:
+            ordered = self._ordered.get(name)
+            if ordered and (earliest is None or ordered[0][0] < earliest[0]):
+                earliest = (ordered[0][0], name, ordered[0][1])
+        return earliest
+
+    def pop_expired(self, character, now=None):
+        """
+        Remove and return all cooldowns of a character that have expired
+
+        Args:
+            character (str): Character name
+            now (float, optional): Current time on the index clock
+
+        Returns:
+            list: Action keys whose cooldown expired
+        """
+        ordered = self._ordered.get(character)
+        if not ordered:
+            return []
+        now = self.clock() if now is None else now
+        split = bisect.bisect_right(ordered, (now, chr(0x10FFFF)))
+        expired = [action for _, action in ordered[:split]]
+        del ordered[:split]
+        deadlines = self._deadlines[character]
+        for action in expired:
+            del deadlines[action]
+        return expired
+
+    def cooldowns(self, character):
+        """
+        Get the active cooldowns of a character in expiry order
+
+        Returns:
+            list: (deadline, action) tuples sorted by deadline
+        """
+        return list(self._ordered.get(character, []))
+
+    def characters(self):
+        """
+        Get the characters that have cooldowns
+
+        Returns:
+            list: Character names
+        """
+        return [name for name, ordered in self._ordered.items() if ordered]
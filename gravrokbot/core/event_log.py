@@ -0,0 +1,140 @@
+"""
+Structured event log for GravRokBot.
+Appends one JSON object per line for each action run, transition, template
+match, OCR read, input and delay to a file per day, buffered in memory and
+written in batches, for analysis after the run.
+"""
+
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+from gravrokbot.core.clock import get_clock
+
+# Tracer categories forwarded as events, with their event kind; matches and
+# OCR reads are emitted by the screen interaction with their details
+TRACED_KINDS = {
+    'transition': 'transition',
+    'capture': 'capture',
+    'input': 'input',
+    'humanized_delay': 'delay',
+}
+
+class EventLog:
+    """Buffered append-only JSONL event stream"""
+
+    def __init__(self, directory="logs/events", enabled=False, flush_events=256, flush_seconds=5.0, clock=None):
+        """
+        Initialize the event log
+
+        Args:
+            directory (str): Directory of the daily event files
+            enabled (bool): Whether events are recorded
+            flush_events (int): Buffered events that trigger a write
+            flush_seconds (float): Age of the oldest buffered event that triggers a write
+            clock (optional): Clock for timestamps, the process-wide clock if None
+        """
+        self.directory = directory
+        self.enabled = enabled
+        self.flush_events = flush_events
+        self.flush_seconds = flush_seconds
+        self.clock = clock
+        self.logger = logging.getLogger("GravRokBot.EventLog")
+        self._buffer = []
+        self._buffer_started = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def configure(self, config):
+        """
+        Apply event log settings, writing out what was buffered before
+
+        Args:
+            config (dict): Settings with enabled, directory, flush_events and flush_seconds
+        """
+        self.flush()
+        self.enabled = config.get('enabled', self.enabled)
+        self.directory = config.get('directory', self.directory)
+        self.flush_events = config.get('flush_events', self.flush_events)
+        self.flush_seconds = config.get('flush_seconds', self.flush_seconds)
+
+    def emit(self, kind, action=None, **fields):
+        """
+        Record an event
+
+        Args:
+            kind (str): Event kind, e.g. 'action_finish' or 'match'
+            action (str, optional): Action the event belongs to
+            **fields: Event details, JSON serializable
+        """
+        if not self.enabled:
+            return
+
+        now = (self.clock or get_clock()).time()
+        event = {'ts': round(now, 3), 'kind': kind, 'action': action}
+        event.update(fields)
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started = now
+            self._buffer.append(event)
+            due = (len(self._buffer) >= self.flush_events
+                   or now - self._buffer_started >= self.flush_seconds)
+        if due:
+            self.flush()
+
+    def trace_sink(self, step):
+        """
+        Tracer sink recording transitions, captures, input and delays
+
+        Args:
+            step (tuple): (action, category, name, start_ns, duration_ns)
+        """
+        kind = TRACED_KINDS.get(step[1])
+        if kind:
+            self.emit(kind, step[0], name=step[2], ms=round(step[4] / 1e6, 3))
+
+    def path_for(self, timestamp):
+        """
+        Get the file events of a time are written to
+
+        Args:
+            timestamp (float): Unix timestamp
+
+        Returns:
+            str: Path of the daily event file
+        """
+        day = datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d')
+        return os.path.join(self.directory, f"events-{day}.jsonl")
+
+    def flush(self):
+        """Write the buffered events, one append per daily file"""
+        with self._lock:
+            events, self._buffer = self._buffer, []
+        if not events:
+            return
+
+        by_path = {}
+        for event in events:
+            by_path.setdefault(self.path_for(event['ts']), []).append(json.dumps(event, separators=(',', ':')))
+
+        with self._write_lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                for path, lines in by_path.items():
+                    with open(path, 'a', encoding='utf-8') as f:
+                        f.write('\n'.join(lines) + '\n')
+            except OSError as e:
+                self.logger.error(f"Error writing events: {e}")
+
+# Process-wide event log, enabled by the runner settings
+event_log = EventLog()
+
+def get_event_log():
+    """
+    Get the process-wide event log
+
+    Returns:
+        EventLog: Shared event log
+    """
+    return event_log
@@ -3,21 +3,90 @@ Human-like timing module for GravRokBot.
 Provides sophisticated randomization for delays and timing to simulate human behavior.
 """
 
-import random
-import time
-import numpy as np
-from datetime import datetime
+from gravrokbot.utils.lazy_import import lazy_module
+from gravrokbot.core.clock import get_clock
+from gravrokbot.core.rng import get_random_service
+
+np = lazy_module("numpy")
+
+# Chance of a longer pause that simulates human distraction
+DISTRACTION_CHANCE = 0.05
 
 class HumanTiming:
     """
     Sophisticated timing system that simulates human-like delays and variations
     """
     
-    def __init__(self):
-        self.last_action_time = datetime.now()
+    def __init__(self, clock=None, seed=None, block_size=256):
+        """
+        Initialize human timing
+        
+        Args:
+            clock (optional): Clock for the time of day and sleeping, the process-wide clock if None
+            seed (int, optional): Seed for reproducible delays, a stream of the session seed if None
+            block_size (int): Number of samples drawn at once per delay range
+        """
+        self.clock = clock or get_clock()
+        self.last_action_time = self.clock.now()
         self.action_count = 0
         self.fatigue_factor = 1.0
         
+        # Samples are drawn in vectorized blocks and served from buffers
+        if seed is None:
+            self.rng = get_random_service().generator('human_timing')
+        else:
+            self.rng = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._delay_buffers = {}
+        self._uniform_buffer = []
+        self._click_buffer = []
+    
+    def _truncated_normal(self, mean, std, low, high, count):
+        """
+        Draw samples from a normal distribution truncated to [low, high]
+        
+        Uses vectorized rejection: with the bounds at two standard deviations
+        about 95% of the draws are accepted, so one or two rounds fill a block.
+        
+        Returns:
+            numpy.ndarray: Samples
+        """
+        samples = np.empty(0)
+        while samples.size < count:
+            draws = self.rng.normal(mean, std, int(count * 1.1) + 8)
+            samples = np.concatenate((samples, draws[(draws >= low) & (draws <= high)]))
+        return samples[:count]
+    
+    def _refill_delays(self, min_delay, max_delay):
+        """
+        Draw a block of delays for a range, before state-dependent factors
+        
+        Returns:
+            list: Delays, served from the end
+        """
+        count = self.block_size
+        if max_delay > min_delay:
+            # Truncated normal distribution (more realistic than uniform)
+            mean = (min_delay + max_delay) / 2
+            std = (max_delay - min_delay) / 4
+            base = self._truncated_normal(mean, std, min_delay, max_delay, count)
+        else:
+            base = np.full(count, float(min_delay))
+        
+        # Occasional longer pauses (simulate human distraction)
+        distracted = self.rng.random(count) < DISTRACTION_CHANCE
+        base *= np.where(distracted, self.rng.uniform(2, 4, count), 1.0)
+        
+        # Micro-variations (simulate human imperfection)
+        base += self.rng.normal(0, 0.1, count)
+        return base.tolist()
+    
+    def _uniform(self, low, high):
+        """Get a uniform sample in [low, high) from the buffer"""
+        if not self._uniform_buffer:
+            self._uniform_buffer = self.rng.random(self.block_size).tolist()
+        return low + (high - low) * self._uniform_buffer.pop()
+        
     def get_random_delay(self, min_delay, max_delay):
         """
         Generate a random delay using various distributions and factors
@@ -29,37 +98,26 @@ class HumanTiming:
         Returns:
             float: Calculated delay in seconds
         """
-        # Base delay using truncated normal distribution (more realistic than uniform)
-        mean = (min_delay + max_delay) / 2
-        std = (max_delay - min_delay) / 4
-        base_delay = np.random.truncnorm(
-            (min_delay - mean) / std,
-            (max_delay - mean) / std,
-            loc=mean,
-            scale=std
-        ).item()
-        
-        # Add occasional longer pauses (simulate human distraction)
-        if random.random() < 0.05:  # 5% chance
-            base_delay *= random.uniform(2, 4)
-            
-        # Add micro-variations (simulate human imperfection)
-        micro_variation = random.gauss(0, 0.1)
-        base_delay += micro_variation
+        # Base delay with distraction and micro-variation, from the block of this range
+        key = (min_delay, max_delay)
+        buffer = self._delay_buffers.get(key)
+        if not buffer:
+            buffer = self._delay_buffers[key] = self._refill_delays(min_delay, max_delay)
+        base_delay = buffer.pop()
         
         # Apply time-of-day variation (humans are slower at night/early morning)
-        hour = datetime.now().hour
+        hour = self.clock.now().hour
         if 0 <= hour < 6:  # Late night/early morning
-            base_delay *= random.uniform(1.2, 1.5)
+            base_delay *= self._uniform(1.2, 1.5)
         
         # Apply fatigue factor (actions get slightly slower over time)
         self.action_count += 1
         if self.action_count > 50:  # Reset counter and randomize fatigue
             self.action_count = 0
-            self.fatigue_factor = random.uniform(0.8, 1.2)
+            self.fatigue_factor = self._uniform(0.8, 1.2)
         else:
             # Gradually increase fatigue
-            self.fatigue_factor += random.uniform(0.001, 0.005)
+            self.fatigue_factor += self._uniform(0.001, 0.005)
         
         base_delay *= self.fatigue_factor
         
@@ -74,15 +132,15 @@ class HumanTiming:
             float: Additional pause time in seconds, 0 if no pause
         """
         # Check time since last long pause
-        time_since_last = (datetime.now() - self.last_action_time).total_seconds()
+        time_since_last = (self.clock.now() - self.last_action_time).total_seconds()
         
         # Probability increases with time since last pause
         pause_probability = min(0.001 * (time_since_last / 60), 0.05)
         
-        if random.random() < pause_probability:
-            self.last_action_time = datetime.now()
+        if self._uniform(0, 1) < pause_probability:
+            self.last_action_time = self.clock.now()
             # Return a pause between 1 and 5 minutes
-            return random.uniform(60, 300)
+            return self._uniform(60, 300)
         
         return 0
     
@@ -94,7 +152,9 @@ class HumanTiming:
             float: Click delay in seconds
         """
         # Use Gamma distribution for click delays (better models quick human actions)
-        return np.random.gamma(shape=2, scale=0.1)
+        if not self._click_buffer:
+            self._click_buffer = self.rng.gamma(shape=2, scale=0.1, size=self.block_size).tolist()
+        return self._click_buffer.pop()
     
     def apply_delay_profile(self, profile_name, config):
         """
@@ -141,5 +201,5 @@ class HumanTiming:
             max_time = min_time * 1.5
             
         delay = self.get_random_delay(min_time, max_time)
-        time.sleep(delay)
+        self.clock.sleep(delay)
         return delay 
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Template match score telemetry for GravRokBot.
+Keeps a histogram of the best match scores per template, separately for
+hits and for near-misses (misses scoring above a floor), accumulated across
+sessions in a JSON file. gravrokbot-calibrate proposes per-template
+thresholds from these distributions.
+"""
+
+import os
+import json
+import atexit
+import logging
+import tempfile
+import threading
+
+# Histogram bins over scores from 0 to 1
+BINS = 100
+
+class MatchScores:
+    """Per-template score histograms of hits and near-misses"""
+
+    def __init__(self, path=os.path.join("logs", "match_scores.json"), enabled=False, near_miss_floor=0.5):
+        """
+        Initialize the telemetry
+
+        Args:
+            path (str): JSON file the histograms are accumulated in
+            enabled (bool): Whether scores are recorded
+            near_miss_floor (float): Lowest miss score recorded in the histogram,
+                lower misses are only counted
+        """
+        self.path = path
+        self.enabled = enabled
+        self.near_miss_floor = near_miss_floor
+        self.logger = logging.getLogger("GravRokBot.MatchScores")
+        self.templates = {}
+        self._lock = threading.Lock()
+        # Serializes flushes, so an older snapshot never replaces a newer file
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._loaded_path = None
+        atexit.register(self.flush)
+
+    def configure(self, config):
+        """
+        Apply telemetry settings, loading the histograms of earlier sessions
+
+        Args:
+            config (dict): Settings with enabled, path and near_miss_floor
+        """
+        self.enabled = config.get('enabled', self.enabled)
+        self.near_miss_floor = config.get('near_miss_floor', self.near_miss_floor)
+        path = config.get('path', self.path)
+        if self.enabled and path != self._loaded_path:
+            self.flush()
+            self.path = self._loaded_path = path
+            self.templates = {}
+            try:
+                if os.path.exists(path):
+                    with open(path, 'r') as f:
+                        self.load(json.load(f))
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Error loading match scores from {path}: {e}")
+
+    def _entry(self, template):
+        entry = self.templates.get(template)
+        if entry is None:
+            entry = self.templates[template] = {'hits': [0] * BINS, 'near_misses': [0] * BINS, 'far_misses': 0}
+        return entry
+
+    def record(self, template, score, found):
+        """
+        Record the best score of a match
+
+        Args:
+            template (str): Template key, see template_bundle.bundle_key
+            score (float): Best match score
+            found (bool): Whether the score reached the threshold
+        """
+        if not self.enabled or score is None:
+            return
+        with self._lock:
+            entry = self._entry(template)
+            if not found and score < self.near_miss_floor:
+                entry['far_misses'] += 1
+            else:
+                index = min(BINS - 1, max(0, int(score * BINS)))
+                entry['hits' if found else 'near_misses'][index] += 1
+            self._dirty = True
+
+    def load(self, data):
+        """
+        Add histograms, e.g. those saved by an earlier session
+
+        Args:
+            data (dict): Template key to {'hits', 'near_misses', 'far_misses'}
+        """
+        with self._lock:
+            for template, counts in data.items():
+                entry = self._entry(template)
+                for kind in ('hits', 'near_misses'):
+                    for index, count in enumerate(counts.get(kind, [])[:BINS]):
+                        entry[kind][index] += count
+                entry['far_misses'] += counts.get('far_misses', 0)
+
+    def to_dict(self):
+        """
+        Get a copy of the histograms
+
+        Returns:
+            dict: Template key to {'hits', 'near_misses', 'far_misses'}
+        """
+        with self._lock:
+            return {
+                template: {'hits': list(entry['hits']), 'near_misses': list(entry['near_misses']),
+                           'far_misses': entry['far_misses']}
+                for template, entry in self.templates.items()
+            }
+
+    def flush(self):
+        """
+        Write the histograms atomically if scores were recorded since the last write
+
+        A failed write leaves the histograms pending, so the next flush retries them.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty or self._loaded_path is None:
+                    return
+                self._dirty = False
+            try:
+                self._write_atomic(self.to_dict())
+            except OSError as e:
+                self._dirty = True
+                self.logger.error(f"Error writing match scores to {self.path}: {e}")
+
+    def _write_atomic(self, data):
+        """Write data to a temp file and rename it over the target"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+# Process-wide telemetry, configured from the screen settings
+match_scores = MatchScores()
+
+def get_match_scores():
+    """
+    Get the process-wide match score telemetry
+
+    Returns:
+        MatchScores: Shared telemetry
+    """
+    return match_scores
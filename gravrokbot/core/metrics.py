@@ -0,0 +1,255 @@
+"""
+Runner metrics for GravRokBot.
+Collects counters, gauges and histograms and serves them in the Prometheus
+text format from a local HTTP endpoint on a background thread.
+"""
+
+import bisect
+import logging
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Default histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Bucket upper bounds for template match scores
+SCORE_BUCKETS = (0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 0.99, 1.0)
+
+# Metrics fed by the runner, workflows and screen interaction
+METRICS = (
+    ('gravrokbot_actions_executed_total', 'counter', 'Actions executed per character', None),
+    ('gravrokbot_actions_failed_total', 'counter', 'Actions that failed after all retries per character', None),
+    ('gravrokbot_action_retries_total', 'counter', 'Action retries after a failed attempt', None),
+    ('gravrokbot_match_score', 'histogram', 'Best template match score', SCORE_BUCKETS),
+    ('gravrokbot_capture_seconds', 'histogram', 'Screen capture latency', DEFAULT_BUCKETS),
+    ('gravrokbot_match_seconds', 'histogram', 'Template match latency', DEFAULT_BUCKETS),
+    ('gravrokbot_ocr_seconds', 'histogram', 'OCR latency', DEFAULT_BUCKETS),
+    ('gravrokbot_ui_response_seconds', 'histogram', 'Time until the element a transition expects is shown', DEFAULT_BUCKETS),
+    ('gravrokbot_loop_duration_seconds', 'histogram', 'Runner loop duration', DEFAULT_BUCKETS),
+    ('gravrokbot_sleep_seconds_total', 'counter', 'Time spent asleep between actions, loops and breaks', None),
+    ('gravrokbot_loops_total', 'counter', 'Runner loops completed', None),
+)
+
+# Tracer step categories exported as latency histograms
+TRACED_CATEGORIES = {
+    'capture': 'gravrokbot_capture_seconds',
+    'match': 'gravrokbot_match_seconds',
+    'ocr': 'gravrokbot_ocr_seconds',
+}
+
+class MetricsRegistry:
+    """Registry of metrics updated from the bot threads and read by the HTTP endpoint"""
+
+    def __init__(self, enabled=False, fold_threshold=8192):
+        """
+        Initialize the registry
+
+        Updates are appended to an unbounded queue without taking a lock and
+        folded into the metric values when they are read, so the bot loop
+        never waits on a scrape. Without reads, the writer folds the queue
+        once it reaches the threshold, so it stays small and no update is lost.
+
+        Args:
+            enabled (bool): Whether updates are recorded
+            fold_threshold (int): Number of queued updates at which the writer folds them
+        """
+        self.enabled = enabled
+        self.logger = logging.getLogger("GravRokBot.Metrics")
+        self.fold_threshold = fold_threshold
+        self._pending = deque()
+        self._read_lock = threading.Lock()
+        self._definitions = {}
+        self._values = {}
+        self.server = None
+        self.server_thread = None
+
+        for name, kind, help_text, buckets in METRICS:
+            self.define(name, kind, help_text, buckets)
+
+    def define(self, name, kind, help_text, buckets=None):
+        """
+        Declare a metric
+
+        Args:
+            name (str): Metric name
+            kind (str): 'counter', 'gauge' or 'histogram'
+            help_text (str): Description shown in the export
+            buckets (tuple, optional): Histogram bucket upper bounds
+        """
+        self._definitions[name] = (kind, help_text, tuple(buckets or DEFAULT_BUCKETS))
+        self._values.setdefault(name, {})
+
+    def inc(self, name, amount=1, **labels):
+        """Increase a counter"""
+        if self.enabled:
+            self._queue(('inc', name, tuple(sorted(labels.items())), amount))
+
+    def set(self, name, value, **labels):
+        """Set a gauge"""
+        if self.enabled:
+            self._queue(('set', name, tuple(sorted(labels.items())), value))
+
+    def observe(self, name, value, **labels):
+        """Add an observation to a histogram"""
+        if self.enabled:
+            self._queue(('observe', name, tuple(sorted(labels.items())), value))
+
+    def _queue(self, update):
+        """Queue an update, folding the queue on the writer side at the threshold"""
+        self._pending.append(update)
+        # A reader holding the lock is folding already, so never wait for it
+        if len(self._pending) >= self.fold_threshold and self._read_lock.acquire(blocking=False):
+            try:
+                self._fold_pending()
+            finally:
+                self._read_lock.release()
+
+    def trace_sink(self, step):
+        """
+        Tracer sink turning traced steps into latency histograms
+
+        Args:
+            step (tuple): (action, category, name, start_ns, duration_ns)
+        """
+        name = TRACED_CATEGORIES.get(step[1])
+        if name:
+            self.observe(name, step[4] / 1e9)
+
+    def _fold_pending(self):
+        """Apply queued updates to the metric values, called with the read lock held"""
+        while self._pending:
+            try:
+                op, name, labels, value = self._pending.popleft()
+            except IndexError:
+                break
+            if name not in self._definitions:
+                continue
+            series = self._values[name]
+            if op == 'inc':
+                series[labels] = series.get(labels, 0) + value
+            elif op == 'set':
+                series[labels] = value
+            else:
+                buckets = self._definitions[name][2]
+                counts, total, count = series.get(labels, ([0] * len(buckets), 0.0, 0))
+                index = bisect.bisect_left(buckets, value)
+                if index < len(buckets):
+                    counts[index] += 1
+                series[labels] = (counts, total + value, count + 1)
+
+    def value(self, name, **labels):
+        """
+        Get the current value of a counter or gauge
+
+        Returns:
+            float: Value, 0 if never updated
+        """
+        with self._read_lock:
+            self._fold_pending()
+            return self._values.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def render(self):
+        """
+        Render all metrics in the Prometheus text format
+
+        Returns:
+            str: Exposition text
+        """
+        with self._read_lock:
+            self._fold_pending()
+            lines = []
+            for name, (kind, help_text, buckets) in self._definitions.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(self._values[name].items()):
+                    if kind != 'histogram':
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                        continue
+                    counts, total, count = value
+                    cumulative = 0
+                    for bound, bucket_count in zip(buckets, counts):
+                        cumulative += bucket_count
+                        bucket_labels = labels + (('le', _format_value(bound)),)
+                        lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+            return "\n".join(lines) + "\n"
+
+    def start_server(self, host='127.0.0.1', port=9464):
+        """
+        Serve the metrics over HTTP on a background thread
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free port
+
+        Returns:
+            int: Bound port
+        """
+        if self.server:
+            return self.server.server_address[1]
+
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self.server.daemon_threads = True
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+        bound_port = self.server.server_address[1]
+        self.logger.info(f"Metrics endpoint listening on http://{host}:{bound_port}/metrics")
+        return bound_port
+
+    def stop_server(self):
+        """Stop the HTTP endpoint if it is running"""
+        if not self.server:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        self.server_thread = None
+
+def _format_labels(labels):
+    """Format label pairs as {key="value",...}"""
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels)
+    return "{" + pairs + "}"
+
+def _escape_label(value):
+    """Escape a label value for the text format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value):
+    """Format a number without a trailing .0 for integers"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return str(value)
+
+# Process-wide registry shared by the runner, workflows and screen interaction
+registry = MetricsRegistry()
+
+def get_registry():
+    """
+    Get the process-wide metrics registry
+
+    Returns:
+        MetricsRegistry: Shared registry
+    """
+    return registry
@@ -0,0 +1,130 @@
+"""
+Human-like mouse motion for GravRokBot.
+Plans a curved cursor path with a minimum-jerk speed profile as one NumPy
+array of points and timestamps, then streams it to the input backend
+against a monotonic deadline so a gesture takes a predictable time.
+"""
+
+from gravrokbot.utils.lazy_import import lazy_module
+from gravrokbot.core.clock import get_clock
+from gravrokbot.core.rng import get_random_service
+
+np = lazy_module("numpy")
+
+def minimum_jerk(t):
+    """
+    Minimum-jerk position profile, the speed curve of a relaxed hand movement
+
+    Args:
+        t (numpy.ndarray): Normalized times in [0, 1]
+
+    Returns:
+        numpy.ndarray: Normalized positions in [0, 1]
+    """
+    return t ** 3 * (10 - 15 * t + 6 * t * t)
+
+def plan_path(start, end, duration, rng, rate=120, curvature=0.15):
+    """
+    Plan a curved path from start to end
+
+    The path is a cubic Bezier curve whose two control points are pushed a
+    random distance off the straight line, traversed with a minimum-jerk
+    profile so the cursor speeds up and slows down like a hand does.
+
+    Args:
+        start (tuple): (x, y) start position
+        end (tuple): (x, y) end position
+        duration (float): Movement time in seconds
+        rng (numpy.random.Generator): Random source for the curve
+        rate (int): Points per second
+        curvature (float): Maximum control point offset as a fraction of the distance
+
+    Returns:
+        tuple: (points, times) with an (n, 2) int array of positions, without
+            repeated positions, and the matching offsets in seconds from the start
+    """
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    count = max(2, int(duration * rate) + 1)
+    times = np.linspace(0.0, duration, count)
+    progress = minimum_jerk(np.linspace(0.0, 1.0, count))[:, None]
+
+    delta = end - start
+    distance = np.hypot(*delta)
+    normal = np.array([-delta[1], delta[0]]) / distance if distance else np.zeros(2)
+    offsets = rng.uniform(-curvature, curvature, 2) * distance
+    control1 = start + delta / 3 + normal * offsets[0]
+    control2 = start + delta * 2 / 3 + normal * offsets[1]
+
+    rest = 1 - progress
+    points = (rest ** 3 * start + 3 * rest ** 2 * progress * control1
+              + 3 * rest * progress ** 2 * control2 + progress ** 3 * end)
+    points = np.rint(points).astype(int)
+
+    # Moving to the same pixel twice only costs a backend call, so keep the
+    # last point of each run, which also lands the target at the full duration
+    changed = np.ones(count, dtype=bool)
+    changed[:-1] = np.any(points[1:] != points[:-1], axis=1)
+    return points[changed], times[changed]
+
+class MouseMotion:
+    """Streams planned mouse paths to an input backend"""
+
+    def __init__(self, move, position, clock=None, rng=None, rate=120, curvature=0.15):
+        """
+        Initialize mouse motion
+
+        Args:
+            move (callable): Moves the cursor to (x, y) without any pause
+            position (callable): Returns the current (x, y) cursor position
+            clock (optional): Clock for deadlines and sleeping, the process-wide clock if None
+            rng (numpy.random.Generator, optional): Random source, a stream of the session seed if None
+            rate (int): Points per second
+            curvature (float): Maximum control point offset as a fraction of the distance
+        """
+        self.move = move
+        self.position = position
+        self.clock = clock or get_clock()
+        self.rng = rng if rng is not None else get_random_service().generator('mouse_motion')
+        self.rate = rate
+        self.curvature = curvature
+
+    def move_to(self, x, y, duration):
+        """
+        Move the cursor along a curved path
+
+        Points whose deadline has already passed by more than a frame are
+        dropped, so a slow backend shortens the path instead of stretching
+        the gesture. The last point is always sent.
+
+        Args:
+            x (int): Target X coordinate
+            y (int): Target Y coordinate
+            duration (float): Movement time in seconds
+
+        Returns:
+            int: Number of points sent to the backend
+        """
+        # A simulated clock takes the movement time, the cursor jumps
+        if self.clock.simulated:
+            self.clock.sleep(duration)
+            self.move(x, y)
+            return 1
+
+        points, times = plan_path(self.position(), (x, y), duration, self.rng, self.rate, self.curvature)
+        frame = 1.0 / self.rate
+        last = len(points) - 1
+        sent = 0
+
+        started_at = self.clock.monotonic()
+        for index, (point_x, point_y) in enumerate(points.tolist()):
+            if index == 0:
+                continue
+            remaining = started_at + times[index] - self.clock.monotonic()
+            if remaining > 0:
+                self.clock.sleep(remaining)
+            elif remaining < -frame and index < last:
+                continue
+            self.move(point_x, point_y)
+            sent += 1
+        return sent
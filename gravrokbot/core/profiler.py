@@ -0,0 +1,220 @@
+"""
+Loop profiler for GravRokBot.
+Profiles a number of runner loops with a statistical stack sampler or
+cProfile, writes the result to the logs directory and logs the functions
+with the most self time.
+"""
+
+import os
+import sys
+import time
+import logging
+import cProfile
+import pstats
+import threading
+from collections import Counter
+from datetime import datetime
+
+PROFILE_MODES = ('sampling', 'cprofile')
+
+class StackSampler:
+    """Statistical profiler sampling the stack of one thread at a fixed interval"""
+
+    def __init__(self, thread_id, interval=0.005):
+        """
+        Initialize the sampler
+
+        Args:
+            thread_id (int): Identifier of the thread to sample
+            interval (float): Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.self_samples = Counter()
+        self.sample_count = 0
+        # Cleared between loops so the wait for the next loop is not sampled
+        self.active = True
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sampling on a background thread"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _sample_loop(self):
+        """Take samples until stopped"""
+        while not self._stop_event.wait(self.interval):
+            if not self.active:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.sample(frame)
+
+    def sample(self, frame):
+        """
+        Record one stack sample
+
+        Args:
+            frame: Innermost frame of the sampled thread
+        """
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if not names:
+            return
+        self.self_samples[names[0]] += 1
+        self.stacks[";".join(reversed(names))] += 1
+        self.sample_count += 1
+
+    def write_collapsed(self, path):
+        """
+        Write the samples as collapsed stacks, readable by speedscope and flamegraph tools
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+    def top_functions(self, limit=15):
+        """
+        Get the functions with the most self time
+
+        Args:
+            limit (int): Number of functions
+
+        Returns:
+            list: (function, self seconds, share of samples) tuples
+        """
+        total = self.sample_count or 1
+        return [
+            (name, count * self.interval, count / total)
+            for name, count in self.self_samples.most_common(limit)
+        ]
+
+class LoopProfiler:
+    """Profiles a fixed number of runner loops"""
+
+    def __init__(self, loops, mode='sampling', output_dir='logs', interval=0.005, top=15):
+        """
+        Initialize the profiler
+
+        Args:
+            loops (int): Number of loops to profile
+            mode (str): 'sampling' or 'cprofile'
+            output_dir (str): Directory for the profile files
+            interval (float): Sampling interval in seconds
+            top (int): Number of top self-time functions to log
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode: {mode}")
+
+        self.loops = loops
+        self.mode = mode
+        self.output_dir = output_dir
+        self.interval = interval
+        self.top = top
+        self.loops_done = 0
+        self.finished = False
+        self.output_path = None
+        self.logger = logging.getLogger("GravRokBot.Profiler")
+        self._sampler = None
+        self._profile = None
+        self._started_at = None
+
+    def begin_loop(self):
+        """Start profiling a loop, called from the runner thread"""
+        if self.finished:
+            return
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+            self.logger.info(f"Profiling {self.loops} loops with {self.mode}")
+
+        if self.mode == 'cprofile':
+            if self._profile is None:
+                self._profile = cProfile.Profile()
+            self._profile.enable()
+        elif self._sampler is None:
+            self._sampler = StackSampler(threading.get_ident(), self.interval)
+            self._sampler.start()
+        else:
+            self._sampler.active = True
+
+    def end_loop(self):
+        """
+        Stop profiling a loop, called from the runner thread
+
+        Returns:
+            bool: True once all loops are profiled and the results are written
+        """
+        if self.finished:
+            return True
+        if self._profile is not None:
+            self._profile.disable()
+        if self._sampler is not None:
+            self._sampler.active = False
+
+        self.loops_done += 1
+        if self.loops_done >= self.loops:
+            self.finish()
+        return self.finished
+
+    def finish(self):
+        """
+        Stop profiling and write the results
+
+        Returns:
+            str: Path of the written profile, None if nothing was profiled
+        """
+        if self.finished:
+            return self.output_path
+        self.finished = True
+
+        if self._sampler:
+            self._sampler.stop()
+        if self._profile:
+            self._profile.disable()
+        if self._sampler is None and self._profile is None:
+            self.logger.info("Profiling stopped before any loop ran")
+            return None
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if self.mode == 'cprofile':
+            self.output_path = os.path.join(self.output_dir, f"profile_{stamp}.prof")
+            self._profile.dump_stats(self.output_path)
+            top_functions = self._cprofile_top_functions()
+        else:
+            self.output_path = os.path.join(self.output_dir, f"profile_{stamp}.collapsed")
+            self._sampler.write_collapsed(self.output_path)
+            top_functions = self._sampler.top_functions(self.top)
+
+        elapsed = time.perf_counter() - self._started_at
+        self.logger.info(f"Profiled {self.loops_done} loops in {elapsed:.1f}s, written to {self.output_path}")
+        self.logger.info("Top functions by self time:")
+        for name, seconds, share in top_functions:
+            self.logger.info(f"  {seconds:8.3f}s {share:6.1%}  {name}")
+        return self.output_path
+
+    def _cprofile_top_functions(self):
+        """Get the top self-time functions from the cProfile stats"""
+        stats = pstats.Stats(self._profile)
+        total = stats.total_tt or 1
+        rows = []
+        for (filename, line, function), (_, _, self_time, _, _) in stats.stats.items():
+            rows.append((f"{function} ({os.path.basename(filename)}:{line})", self_time, self_time / total))
+        rows.sort(key=lambda row: row[1], reverse=True)
+        return rows[:self.top]
@@ -0,0 +1,97 @@
+"""
+Seeded randomness for GravRokBot.
+One seed per session, logged at startup, from which every subsystem gets
+its own independent random stream. Re-running with the same seed repeats
+the same click offsets, delays and breaks.
+"""
+
+import zlib
+import random
+import logging
+from gravrokbot.utils.lazy_import import lazy_module
+
+np = lazy_module("numpy")
+
+class RandomService:
+    """Hands out independent random streams derived from one session seed"""
+
+    def __init__(self, seed=None):
+        """
+        Initialize the service
+
+        Args:
+            seed (int, optional): Session seed, drawn from OS entropy if None
+        """
+        self.seed = int(seed) if seed is not None else int(np.random.SeedSequence().entropy) % (2 ** 63)
+        self._counts = {}
+        self.logger = logging.getLogger("GravRokBot.Random")
+
+    def _child(self, name):
+        """
+        Derive the seed sequence of the next stream with a name
+
+        Each call with the same name gets a new stream, so instances of the
+        same class do not share draws; the order of creation decides which.
+        """
+        index = self._counts.get(name, 0)
+        self._counts[name] = index + 1
+        return np.random.SeedSequence(self.seed, spawn_key=(zlib.crc32(name.encode('utf-8')), index))
+
+    def generator(self, name):
+        """
+        Get a NumPy generator for a subsystem
+
+        Args:
+            name (str): Subsystem name, e.g. 'human_timing'
+
+        Returns:
+            numpy.random.Generator: Independent generator
+        """
+        return np.random.default_rng(self._child(name))
+
+    def random(self, name):
+        """
+        Get a standard library random stream for a subsystem
+
+        Args:
+            name (str): Subsystem name, e.g. 'screen' or 'runner'
+
+        Returns:
+            random.Random: Independent random stream
+        """
+        state = self._child(name).generate_state(4, np.uint64)
+        return random.Random(int.from_bytes(state.tobytes(), 'little'))
+
+# Process-wide service, replaced by seed_session at startup; created on
+# first use so importing this module does not load NumPy
+_service = None
+
+def get_random_service():
+    """
+    Get the process-wide random service
+
+    Returns:
+        RandomService: Current service
+    """
+    global _service
+    if _service is None:
+        _service = RandomService()
+    return _service
+
+def seed_session(seed=None):
+    """
+    Start a new random session and log its seed
+
+    Components take their streams when they are created, so seed the
+    session before creating screen interaction, actions and runners.
+
+    Args:
+        seed (int, optional): Seed to reproduce an earlier session, random if None
+
+    Returns:
+        RandomService: New process-wide service
+    """
+    global _service
+    _service = RandomService(seed)
+    _service.logger.info(f"Random seed: {_service.seed}")
+    return _service
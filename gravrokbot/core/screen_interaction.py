@@ -1,12 +1,24 @@
 import os
 import time
-import random
 import logging
-import pyautogui
-import cv2
-import numpy as np
-import pytesseract
-from PIL import Image
+from gravrokbot.utils.lazy_import import lazy_module
+from gravrokbot.core.vision_pool import get_shared_pool
+from gravrokbot.core.tracing import get_tracer
+from gravrokbot.core.metrics import get_registry
+from gravrokbot.core.clock import get_clock
+from gravrokbot.core.rng import get_random_service
+from gravrokbot.core.mouse_motion import MouseMotion
+from gravrokbot.core.event_log import get_event_log
+from gravrokbot.core.match_scores import get_match_scores
+from gravrokbot.core.template_bundle import get_template_bundle, bundle_key
+from gravrokbot.core.template_matcher import TemplateMatcher
+
+# Imported on first use: PyAutoGUI when the first instance is created,
+# Tesseract on the first OCR read
+pyautogui = lazy_module("pyautogui")
+pytesseract = lazy_module("pytesseract")
+np = lazy_module("numpy")
+Image = lazy_module("PIL.Image")
 
 class ScreenInteraction:
     """Base class for screen interaction with human-like behavior"""
@@ -19,15 +31,84 @@ class ScreenInteraction:
             config (dict): Configuration dictionary with settings
         """
         self.config = config
-        self.screen_width, self.screen_height = pyautogui.size()
-        self.last_action_time = time.time()
+        self.clock = get_clock()
+        self.random = get_random_service().random('screen')
+        self.last_action_time = self.clock.time()
+        
+        # Configure logger
+        self.logger = logging.getLogger("GravRokBot")
+        
+        # Screen size and input backend
+        self.screen_width, self.screen_height = self._setup_input()
+        
+        # Step latency tracer and metrics
+        self.tracer = get_tracer()
+        self.metrics = get_registry()
+        self.events = get_event_log()
+        self._template_sizes = {}
+        
+        # Pre-decoded templates, mapped once per process
+        self.template_bundle = get_template_bundle()
+        
+        # Per-template thresholds, the default confidence for the other templates
+        self.default_confidence = self.config.get('default_confidence', 0.8)
+        self.template_thresholds = self.config.get('template_thresholds', {})
+        self._template_keys = {}
         
-        # Initialize PyAutoGUI settings
+        # Score distributions per template, for gravrokbot-calibrate
+        self.match_scores = get_match_scores()
+        self.match_scores.configure(self.config.get('score_telemetry', {}))
+        
+        # Match method and template scales, see TemplateMatcher
+        self.match_method = self.config.get('match_method', 'ccoeff')
+        self.match_scales = tuple(self.config.get('match_scales', [1.0]))
+        
+        # Process pool or in-process matcher, None to match with PyAutoGUI
+        self.vision_pool = self._create_vision_pool()
+    
+    def _setup_input(self):
+        """
+        Configure PyAutoGUI and the mouse motion
+        
+        Overridden by screen interactions that do not send input to the screen.
+        
+        Returns:
+            tuple: (width, height) of the screen
+        """
         pyautogui.PAUSE = self.config.get('input_delay', 0.1)
         pyautogui.FAILSAFE = True
         
-        # Configure logger
-        self.logger = logging.getLogger("GravRokBot")
+        # Curved mouse paths streamed without PyAutoGUI's pause, linear tween otherwise
+        if self.config.get('mouse_motion', 'linear') == 'curved':
+            self.mouse_motion = MouseMotion(
+                self._move_cursor, pyautogui.position, self.clock,
+                rate=self.config.get('mouse_motion_rate', 120),
+                curvature=self.config.get('mouse_curvature', 0.15)
+            )
+        else:
+            self.mouse_motion = None
+        return pyautogui.size()
+    
+    def _create_vision_pool(self):
+        """
+        Create the template matcher find_image and find_all_images use
+        
+        Returns:
+            Shared vision pool if vision_workers are configured, a TemplateMatcher
+            if the settings need one, None to match with PyAutoGUI
+        """
+        vision_workers = self.config.get('vision_workers', 0)
+        if vision_workers > 0:
+            return get_shared_pool(vision_workers)
+        if self.match_method != 'ccoeff' or self.match_scales != (1.0,) or self.match_scores.enabled:
+            # PyAutoGUI only matches the correlation coefficient at the template's size and
+            # does not report scores, TemplateMatcher has the find/find_all interface of the vision pool
+            return TemplateMatcher()
+        return None
+    
+    def _move_cursor(self, x, y):
+        """Move the cursor in one step, skipping PyAutoGUI's pause after the call"""
+        pyautogui.moveTo(x, y, _pause=False)
     
     def take_screenshot(self, region=None):
         """
@@ -39,73 +120,189 @@ class ScreenInteraction:
         Returns:
             PIL.Image: Screenshot image
         """
-        self.logger.debug(f"Taking screenshot{f' of region {region}' if region else ''}")
-        return pyautogui.screenshot(region=region)
+        self.logger.debug("Taking screenshot of region %s", region)
+        with self.tracer.span('capture'):
+            return pyautogui.screenshot(region=region)
+    
+    def _offset_location(self, location, region):
+        """Translate a location inside a captured region to screen coordinates"""
+        if region is None:
+            return location
+        return (location[0] + region[0], location[1] + region[1])
+    
+    def _find_with_pool(self, screenshot, image_path, confidence, grayscale):
+        """Match a captured frame in the vision pool, returning (location, score) in the frame"""
+        location, score = self.vision_pool.find(np.asarray(screenshot), image_path, confidence, grayscale,
+                                                self.match_method, self.match_scales)
+        template = os.path.basename(image_path)
+        self.logger.debug("Best match score for %s: %.3f", template, score)
+        self.metrics.observe('gravrokbot_match_score', score, template=template)
+        return location, score
+    
+    def _template_size(self, image_path):
+        """Get the (width, height) of a template, read from the image header once"""
+        size = self._template_sizes.get(image_path)
+        if size is None and self.template_bundle is not None:
+            size = self.template_bundle.size(image_path)
+        if size is None:
+            with Image.open(image_path) as image:
+                size = self._template_sizes[image_path] = image.size
+        return size
+    
+    def _emit_match(self, image_path, template, location, score, started_ns):
+        """Record a template match in the event log"""
+        bbox = None
+        if location:
+            width, height = self._template_size(image_path)
+            bbox = [int(location[0]) - width // 2, int(location[1]) - height // 2, width, height]
+        self.events.emit(
+            'match', self.tracer.current_action(),
+            template=template,
+            found=location is not None,
+            score=None if score is None else round(float(score), 4),
+            bbox=bbox,
+            ms=round((time.perf_counter_ns() - started_ns) / 1e6, 3)
+        )
     
-    def find_image(self, image_path, confidence=0.8, region=None, grayscale=True):
+    def template_key(self, image_path):
+        """Get the package-relative key of a template, as used in the settings"""
+        key = self._template_keys.get(image_path)
+        if key is None:
+            key = self._template_keys[image_path] = bundle_key(image_path)
+        return key
+    
+    def confidence_for(self, image_path):
+        """
+        Get the match threshold of a template
+        
+        Args:
+            image_path (str): Path to image file
+            
+        Returns:
+            float: Threshold from screen.template_thresholds, or the default confidence
+        """
+        return self.template_thresholds.get(self.template_key(image_path), self.default_confidence)
+    
+    def template_region(self, image_path):
+        """
+        Get the screen region a template is shown in
+        
+        Args:
+            image_path (str): Path to image file
+            
+        Returns:
+            tuple: (left, top, width, height) stored in the template bundle, None if not known
+        """
+        metadata = self.template_bundle.metadata(image_path) if self.template_bundle is not None else None
+        roi = metadata and metadata.get('roi')
+        return tuple(roi) if roi else None
+    
+    def _available(self, image_path):
+        """Whether a template can be matched, from its file or the bundle"""
+        return os.path.exists(image_path) or (self.template_bundle is not None and image_path in self.template_bundle)
+    
+    def _needle(self, image_path, grayscale):
+        """Get the template to pass to PyAutoGUI, the packed array when bundled"""
+        if self.template_bundle is not None:
+            template = self.template_bundle.get(image_path, grayscale)
+            if template is not None:
+                return template
+        return image_path
+    
+    
+    def find_image(self, image_path, confidence=None, region=None, grayscale=True):
         """
         Find an image on screen
         
+        The screen is captured before matching on both the vision pool and
+        the PyAutoGUI path, so 'capture' steps and spans time the screenshot
+        and 'match' steps, spans and events time the matching alone.
+        
         Args:
             image_path (str): Path to image file to find
-            confidence (float): Match confidence threshold (0-1)
+            confidence (float, optional): Match confidence threshold (0-1), the
+                template's calibrated threshold or the default confidence if None
             region (tuple, optional): Region to search in (left, top, width, height)
             grayscale (bool): Whether to search in grayscale
             
         Returns:
             tuple: (x, y) position of center if found, None otherwise
         """
-        if not os.path.exists(image_path):
+        if not self._available(image_path):
             self.logger.error(f"Image not found: {image_path}")
             return None
             
-        self.logger.debug(f"Searching for image: {os.path.basename(image_path)}")
+        if confidence is None:
+            confidence = self.confidence_for(image_path)
+        template = os.path.basename(image_path)
+        self.logger.debug("Searching for image: %s", template)
+        score = None
         try:
-            location = pyautogui.locateCenterOnScreen(
-                image_path, 
-                confidence=confidence,
-                region=region,
-                grayscale=grayscale
-            )
+            screenshot = self.take_screenshot(region)
+            started_ns = time.perf_counter_ns()
+            with self.tracer.span('match', template):
+                if self.vision_pool:
+                    location, score = self._find_with_pool(screenshot, image_path, confidence, grayscale)
+                else:
+                    box = pyautogui.locate(
+                        self._needle(image_path, grayscale), 
+                        screenshot,
+                        confidence=confidence,
+                        grayscale=grayscale
+                    )
+                    location = pyautogui.center(box) if box else None
+            location = self._offset_location(location, region) if location else None
             
             if location:
-                self.logger.debug(f"Found image at {location}")
+                self.logger.debug("Found image at %s", location)
             else:
-                self.logger.debug(f"Image not found: {os.path.basename(image_path)}")
-                
+                self.logger.debug("Image not found: %s", template)
+            
+            if self.events.enabled:
+                self._emit_match(image_path, template, location, score, started_ns)
+            if self.match_scores.enabled:
+                self.match_scores.record(self.template_key(image_path), score, location is not None)
             return location
         except Exception as e:
             self.logger.error(f"Error finding image: {e}")
             return None
     
-    def find_all_images(self, image_path, confidence=0.8, region=None, grayscale=True):
+    def find_all_images(self, image_path, confidence=None, region=None, grayscale=True):
         """
         Find all instances of an image on screen
         
         Args:
             image_path (str): Path to image file to find
-            confidence (float): Match confidence threshold (0-1)
+            confidence (float, optional): Match confidence threshold (0-1), the
+                template's calibrated threshold or the default confidence if None
             region (tuple, optional): Region to search in (left, top, width, height)
             grayscale (bool): Whether to search in grayscale
             
         Returns:
             list: List of (x, y) positions of matches
         """
-        if not os.path.exists(image_path):
+        if not self._available(image_path):
             self.logger.error(f"Image not found: {image_path}")
             return []
             
-        self.logger.debug(f"Searching for all instances of image: {os.path.basename(image_path)}")
+        if confidence is None:
+            confidence = self.confidence_for(image_path)
+        self.logger.debug("Searching for all instances of image: %s", os.path.basename(image_path))
         try:
-            locations = list(pyautogui.locateAllOnScreen(
-                image_path, 
-                confidence=confidence,
-                region=region,
-                grayscale=grayscale
-            ))
-            
-            positions = [pyautogui.center(loc) for loc in locations]
-            self.logger.debug(f"Found {len(positions)} instances")
+            screenshot = self.take_screenshot(region)
+            with self.tracer.span('match', os.path.basename(image_path)):
+                if self.vision_pool:
+                    locations = self.vision_pool.find_all(np.asarray(screenshot), image_path, confidence, grayscale,
+                                                          self.match_method, self.match_scales)
+                else:
+                    locations = [pyautogui.center(box) for box in pyautogui.locateAll(
+                        self._needle(image_path, grayscale), 
+                        screenshot,
+                        confidence=confidence,
+                        grayscale=grayscale
+                    )]
+            positions = [self._offset_location(location, region) for location in locations]
+            self.logger.debug("Found %d instances", len(positions))
             return positions
         except Exception as e:
             self.logger.error(f"Error finding images: {e}")
@@ -121,12 +318,21 @@ class ScreenInteraction:
         Returns:
             str: Extracted text
         """
-        self.logger.debug(f"Extracting text from region {region}")
+        self.logger.debug("Extracting text from region %s", region)
         try:
             screenshot = self.take_screenshot(region)
-            text = pytesseract.image_to_string(screenshot)
-            self.logger.debug(f"Extracted text: {text.strip()}")
-            return text.strip()
+            started_ns = time.perf_counter_ns()
+            with self.tracer.span('ocr'):
+                text = pytesseract.image_to_string(screenshot)
+            text = text.strip()
+            self.logger.debug("Extracted text: %s", text)
+            self.events.emit(
+                'ocr', self.tracer.current_action(),
+                region=list(region) if region else None,
+                text=text,
+                ms=round((time.perf_counter_ns() - started_ns) / 1e6, 3)
+            )
+            return text
         except Exception as e:
             self.logger.error(f"Error extracting text: {e}")
             return ""
@@ -144,35 +350,49 @@ class ScreenInteraction:
         """
         # Add random offset to make it look more human-like
         if randomize:
-            x += random.randint(-randomize_range, randomize_range)
-            y += random.randint(-randomize_range, randomize_range)
+            x += self.random.randint(-randomize_range, randomize_range)
+            y += self.random.randint(-randomize_range, randomize_range)
         
         # Ensure coordinates are within screen bounds
         x = max(0, min(x, self.screen_width - 1))
         y = max(0, min(y, self.screen_height - 1))
         
         # Random duration for mouse movement (human-like)
-        move_duration = random.uniform(0.3, 0.7)
+        move_duration = self.random.uniform(0.3, 0.7)
         
-        self.logger.debug(f"Moving mouse to ({x}, {y})")
-        pyautogui.moveTo(x, y, duration=move_duration)
+        # A simulated clock takes the movement time, the mouse jumps
+        if self.clock.simulated and not self.mouse_motion:
+            self.clock.sleep(move_duration)
+            move_duration = 0
         
-        # Random delay before clicking
-        time.sleep(random.uniform(0.1, 0.3))
-        
-        self.logger.debug(f"Clicking {button} mouse button")
-        pyautogui.click(button=button)
+        with self.tracer.span('input', 'click'):
+            self.logger.debug("Moving mouse to (%d, %d)", x, y)
+            if self.mouse_motion:
+                self.mouse_motion.move_to(x, y, move_duration)
+            else:
+                pyautogui.moveTo(x, y, duration=move_duration)
+            
+            # Random delay before clicking
+            self.clock.sleep(self.random.uniform(0.1, 0.3))
+            
+            self.logger.debug("Clicking %s mouse button", button)
+            if self.mouse_motion:
+                # The humanized delays replace PyAutoGUI's pause after the click
+                pyautogui.click(button=button, _pause=False)
+            else:
+                pyautogui.click(button=button)
         
         # Update last action time
-        self.last_action_time = time.time()
+        self.last_action_time = self.clock.time()
     
-    def find_and_click_image(self, image_path, confidence=0.8, region=None, grayscale=True):
+    def find_and_click_image(self, image_path, confidence=None, region=None, grayscale=True):
         """
         Find an image on screen and click it
         
         Args:
             image_path (str): Path to image file to find
-            confidence (float): Match confidence threshold (0-1)
+            confidence (float, optional): Match confidence threshold (0-1), the
+                template's calibrated threshold or the default confidence if None
             region (tuple, optional): Region to search in (left, top, width, height)
             grayscale (bool): Whether to search in grayscale
             
@@ -195,13 +415,14 @@ class ScreenInteraction:
         """
         if interval is None:
             # Random typing speed
-            interval = random.uniform(0.05, 0.15)
+            interval = self.random.uniform(0.05, 0.15)
         
-        self.logger.debug(f"Typing text: {text}")
-        pyautogui.typewrite(text, interval=interval)
+        self.logger.debug("Typing text: %s", text)
+        with self.tracer.span('input', 'type'):
+            pyautogui.typewrite(text, interval=interval)
         
         # Update last action time
-        self.last_action_time = time.time()
+        self.last_action_time = self.clock.time()
     
     def humanized_wait(self, min_seconds, max_seconds):
         """
@@ -214,9 +435,10 @@ class ScreenInteraction:
         Returns:
             float: Actual time waited in seconds
         """
-        wait_time = random.uniform(min_seconds, max_seconds)
-        self.logger.debug(f"Waiting for {wait_time:.2f} seconds")
-        time.sleep(wait_time)
+        wait_time = self.random.uniform(min_seconds, max_seconds)
+        self.logger.debug("Waiting for %.2f seconds", wait_time)
+        with self.tracer.span('humanized_delay'):
+            self.clock.sleep(wait_time)
         return wait_time
     
     def press_key(self, key):
@@ -226,8 +448,9 @@ class ScreenInteraction:
         Args:
             key (str): Key to press
         """
-        self.logger.debug(f"Pressing key: {key}")
-        pyautogui.press(key)
+        self.logger.debug("Pressing key: %s", key)
+        with self.tracer.span('input', 'key'):
+            pyautogui.press(key)
         
         # Update last action time
-        self.last_action_time = time.time() 
\ No newline at end of file
+        self.last_action_time = self.clock.time() 
\ No newline at end of file
@@ -0,0 +1,528 @@
+"""
+SQLite state store for GravRokBot.
+Keeps characters, per-action settings, cooldown deadlines and execution
+history in a single embedded database so updates are single-row writes.
+"""
+
+import os
+import json
+import time
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    is_current INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS character_actions (
+    character_id INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    action_key TEXT NOT NULL,
+    enabled INTEGER NOT NULL DEFAULT 0,
+    cooldown_minutes REAL NOT NULL,
+    PRIMARY KEY (character_id, action_key)
+);
+
+CREATE TABLE IF NOT EXISTS cooldowns (
+    character_id INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    action_key TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    deadline REAL NOT NULL,
+    PRIMARY KEY (character_id, action_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_cooldowns_deadline ON cooldowns(deadline);
+
+CREATE TABLE IF NOT EXISTS execution_history (
+    id INTEGER PRIMARY KEY,
+    character_id INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    action_key TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    succeeded INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_history_character_action
+    ON execution_history(character_id, action_key, started_at);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Meta key set once the JSON state files were imported
+JSON_MIGRATED_KEY = 'json_migrated_at'
+
+ACTION_SETTINGS_UPSERT = (
+    "INSERT INTO character_actions (character_id, action_key, enabled, cooldown_minutes) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (character_id, action_key) DO UPDATE SET "
+    "enabled = excluded.enabled, cooldown_minutes = excluded.cooldown_minutes"
+)
+
+class SQLiteStateStore:
+    """Embedded SQLite database holding bot state across characters"""
+
+    def __init__(self, path):
+        """
+        Open (and create if needed) the state database
+
+        Args:
+            path (str): Path to the database file, or ':memory:'
+        """
+        self.path = path
+        self.logger = logging.getLogger("GravRokBot.SQLiteStore")
+
+        # The runner thread records history while the UI thread updates cooldowns
+        self._lock = threading.Lock()
+        self._character_ids = {}
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
+
+    def _execute(self, sql, params=()):
+        """Run a single write statement in its own transaction"""
+        with self._lock, self.conn:
+            return self.conn.execute(sql, params)
+
+    def _query(self, sql, params=()):
+        """Run a read query and return all rows"""
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _insert_character(self, name):
+        """Insert a character in the open transaction if needed and return its id"""
+        self.conn.execute("INSERT OR IGNORE INTO characters (name) VALUES (?)", (name,))
+        return self.conn.execute("SELECT id FROM characters WHERE name = ?", (name,)).fetchone()['id']
+
+    def _character_id(self, name):
+        """Get the id of a character, creating the character if needed"""
+        character_id = self._character_ids.get(name)
+        if character_id is None:
+            with self._lock, self.conn:
+                character_id = self._insert_character(name)
+            self._character_ids[name] = character_id
+        return character_id
+
+    def is_empty(self):
+        """
+        Check whether the database has no characters yet
+
+        Returns:
+            bool: True if no characters are stored
+        """
+        return not self._query("SELECT 1 FROM characters LIMIT 1")
+
+    def get_meta(self, key):
+        """
+        Get a database metadata value
+
+        Args:
+            key (str): Metadata key
+
+        Returns:
+            str: Value, None if not set
+        """
+        rows = self._query("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0]['value'] if rows else None
+
+    def set_meta(self, key, value):
+        """
+        Set a database metadata value
+
+        Args:
+            key (str): Metadata key
+            value (str): Value
+        """
+        self._execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    # --- Characters ---
+
+    def add_character(self, name):
+        """
+        Add a character if it does not exist yet
+
+        Args:
+            name (str): Character name
+        """
+        self._character_id(name)
+
+    def get_characters(self):
+        """
+        Get all character names
+
+        Returns:
+            list: Character names in insertion order
+        """
+        rows = self._query("SELECT name FROM characters ORDER BY id")
+        return [row['name'] for row in rows]
+
+    def set_current_character(self, name):
+        """
+        Mark a character as the current one
+
+        Args:
+            name (str): Character name
+        """
+        character_id = self._character_id(name)
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE characters SET is_current = (id = ?)", (character_id,))
+
+    def remove_character(self, name):
+        """
+        Delete a character with its settings, cooldowns and history
+
+        Args:
+            name (str): Character name
+        """
+        self._execute("DELETE FROM characters WHERE name = ?", (name,))
+        self._character_ids.pop(name, None)
+
+    def save_character_settings(self, character_settings):
+        """
+        Store the settings of all characters in one transaction
+
+        Every character's action settings are upserted and characters that are
+        no longer in the settings are deleted.
+
+        Args:
+            character_settings (dict): {'characters': {...}, 'current_character': name}
+        """
+        characters = character_settings.get("characters", {})
+        with self._lock, self.conn:
+            for name, settings in characters.items():
+                character_id = self._insert_character(name)
+                self.conn.executemany(ACTION_SETTINGS_UPSERT, [
+                    (character_id, action_key, int(bool(action_settings.get("enabled", False))),
+                     action_settings.get("cooldown_minutes", 30))
+                    for action_key, action_settings in settings.get("actions", {}).items()
+                ])
+
+            removed = [row['name'] for row in self.conn.execute("SELECT name FROM characters")
+                       if row['name'] not in characters]
+            self.conn.executemany("DELETE FROM characters WHERE name = ?", [(name,) for name in removed])
+            self.conn.execute("UPDATE characters SET is_current = (name = ?)",
+                              (character_settings.get("current_character"),))
+
+        for name in removed:
+            self._character_ids.pop(name, None)
+        if removed:
+            self.logger.info(f"Removed characters: {', '.join(removed)}")
+
+    def get_current_character(self):
+        """
+        Get the current character
+
+        Returns:
+            str: Current character name, None if not set
+        """
+        rows = self._query("SELECT name FROM characters WHERE is_current = 1")
+        return rows[0]['name'] if rows else None
+
+    def set_action_settings(self, character, action_key, enabled, cooldown_minutes):
+        """
+        Store settings of one action for a character
+
+        Args:
+            character (str): Character name
+            action_key (str): Action config key, e.g. 'gather_resources'
+            enabled (bool): Whether the action is enabled
+            cooldown_minutes (float): Action cooldown in minutes
+        """
+        character_id = self._character_id(character)
+        self._execute(ACTION_SETTINGS_UPSERT, (character_id, action_key, int(bool(enabled)), cooldown_minutes))
+
+    def get_action_settings(self, character):
+        """
+        Get settings of all actions for a character
+
+        Args:
+            character (str): Character name
+
+        Returns:
+            dict: Mapping of action key to {'enabled', 'cooldown_minutes'}
+        """
+        rows = self._query(
+            "SELECT a.action_key, a.enabled, a.cooldown_minutes FROM character_actions a "
+            "JOIN characters c ON c.id = a.character_id WHERE c.name = ?",
+            (character,)
+        )
+        return {
+            row['action_key']: {
+                "enabled": bool(row['enabled']),
+                "cooldown_minutes": row['cooldown_minutes']
+            }
+            for row in rows
+        }
+
+    # --- Cooldowns ---
+
+    def start_cooldown(self, character, action_key, duration_seconds, now=None):
+        """
+        Start a cooldown for an action
+
+        Args:
+            character (str): Character name
+            action_key (str): Action config key
+            duration_seconds (float): Cooldown length in seconds
+            now (float, optional): Start time as a Unix timestamp, defaults to now
+        """
+        now = time.time() if now is None else now
+        character_id = self._character_id(character)
+        self._execute(
+            "INSERT OR REPLACE INTO cooldowns (character_id, action_key, started_at, deadline) "
+            "VALUES (?, ?, ?, ?)",
+            (character_id, action_key, now, now + duration_seconds)
+        )
+
+    def clear_cooldown(self, character, action_key):
+        """
+        Remove the cooldown of an action
+
+        Args:
+            character (str): Character name
+            action_key (str): Action config key
+        """
+        self._execute(
+            "DELETE FROM cooldowns WHERE action_key = ? AND character_id = "
+            "(SELECT id FROM characters WHERE name = ?)",
+            (action_key, character)
+        )
+
+    def get_cooldown_deadline(self, character, action_key):
+        """
+        Get the cooldown deadline of an action
+
+        Args:
+            character (str): Character name
+            action_key (str): Action config key
+
+        Returns:
+            float: Deadline as a Unix timestamp, None if not on cooldown
+        """
+        rows = self._query(
+            "SELECT cd.deadline FROM cooldowns cd JOIN characters c ON c.id = cd.character_id "
+            "WHERE c.name = ? AND cd.action_key = ?",
+            (character, action_key)
+        )
+        return rows[0]['deadline'] if rows else None
+
+    def next_due(self, limit=1):
+        """
+        Get the enabled actions that become due first across all characters
+
+        Actions without a cooldown are due immediately and sort first.
+
+        Args:
+            limit (int): Maximum number of rows to return
+
+        Returns:
+            list: (character, action_key, deadline) tuples ordered by deadline,
+                deadline is 0 for actions that are not on cooldown
+        """
+        rows = self._query(
+            "SELECT c.name, a.action_key, COALESCE(cd.deadline, 0) AS due "
+            "FROM character_actions a "
+            "JOIN characters c ON c.id = a.character_id "
+            "LEFT JOIN cooldowns cd ON cd.character_id = a.character_id AND cd.action_key = a.action_key "
+            "WHERE a.enabled = 1 "
+            "ORDER BY due LIMIT ?",
+            (limit,)
+        )
+        return [(row['name'], row['action_key'], row['due']) for row in rows]
+
+    def due_actions(self, now=None):
+        """
+        Get all enabled actions whose cooldown has expired
+
+        Args:
+            now (float, optional): Current Unix timestamp, defaults to now
+
+        Returns:
+            list: (character, action_key, deadline) tuples ordered by deadline
+        """
+        now = time.time() if now is None else now
+        rows = self._query(
+            "SELECT c.name, a.action_key, COALESCE(cd.deadline, 0) AS due "
+            "FROM character_actions a "
+            "JOIN characters c ON c.id = a.character_id "
+            "LEFT JOIN cooldowns cd ON cd.character_id = a.character_id AND cd.action_key = a.action_key "
+            "WHERE a.enabled = 1 AND COALESCE(cd.deadline, 0) <= ? "
+            "ORDER BY due",
+            (now,)
+        )
+        return [(row['name'], row['action_key'], row['due']) for row in rows]
+
+    # --- Execution history ---
+
+    def record_execution(self, character, action_key, started_at, finished_at, succeeded):
+        """
+        Append an action execution to the history
+
+        Args:
+            character (str): Character name
+            action_key (str): Action config key
+            started_at (float): Start time as a Unix timestamp
+            finished_at (float): Finish time as a Unix timestamp
+            succeeded (bool): Whether the action succeeded
+        """
+        character_id = self._character_id(character)
+        self._execute(
+            "INSERT INTO execution_history (character_id, action_key, started_at, finished_at, succeeded) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (character_id, action_key, started_at, finished_at, int(bool(succeeded)))
+        )
+
+    def get_history(self, character, action_key=None, since=None):
+        """
+        Get execution history of a character
+
+        Args:
+            character (str): Character name
+            action_key (str, optional): Only return runs of this action
+            since (float, optional): Only return runs started at or after this Unix timestamp
+
+        Returns:
+            list: Dicts with action_key, started_at, finished_at and succeeded
+        """
+        sql = (
+            "SELECT h.action_key, h.started_at, h.finished_at, h.succeeded FROM execution_history h "
+            "JOIN characters c ON c.id = h.character_id WHERE c.name = ?"
+        )
+        params = [character]
+        if action_key is not None:
+            sql += " AND h.action_key = ?"
+            params.append(action_key)
+        if since is not None:
+            sql += " AND h.started_at >= ?"
+            params.append(since)
+        rows = self._query(sql + " ORDER BY h.started_at", params)
+        return [{**dict(row), "succeeded": bool(row['succeeded'])} for row in rows]
+
+    # --- JSON compatibility ---
+
+    def export_character_settings(self):
+        """
+        Build a dict in the character_settings.json format
+
+        Returns:
+            dict: {'characters': {...}, 'current_character': name}
+        """
+        return {
+            "characters": {
+                name: {"actions": self.get_action_settings(name)}
+                for name in self.get_characters()
+            },
+            "current_character": self.get_current_character()
+        }
+
+    def export_cooldown_states(self):
+        """
+        Build a dict in the cooldown_states.json format
+
+        Returns:
+            dict: Mapping of character to action key to cooldown state
+        """
+        states = {}
+        for name in self.get_characters():
+            states[name] = {
+                action_key: {"is_active": False, "start_time": None, "end_time": None}
+                for action_key in self.get_action_settings(name)
+            }
+
+        rows = self._query(
+            "SELECT c.name, cd.action_key, cd.started_at, cd.deadline FROM cooldowns cd "
+            "JOIN characters c ON c.id = cd.character_id"
+        )
+        for row in rows:
+            states.setdefault(row['name'], {})[row['action_key']] = {
+                "is_active": True,
+                "start_time": datetime.fromtimestamp(row['started_at']).isoformat(),
+                "end_time": datetime.fromtimestamp(row['deadline']).isoformat()
+            }
+        return states
+
+    def migrate_from_json(self, character_settings_path, cooldown_states_path):
+        """
+        Import character settings and cooldown states from the JSON files, once
+
+        The import is recorded in the database and later calls do nothing, so
+        the JSON files, which are no longer written, never overwrite newer
+        state. Databases that already hold characters are only marked.
+        Missing files are skipped, as are cooldown entries that are not keyed
+        by a known character (game-level actions like start_game). The
+        import and its record are written in one transaction, so a malformed
+        entry rolls everything back and the next start retries it.
+
+        Args:
+            character_settings_path (str): Path to character_settings.json
+            cooldown_states_path (str): Path to cooldown_states.json
+
+        Returns:
+            bool: True if the files were imported now
+        """
+        if self.get_meta(JSON_MIGRATED_KEY) is not None:
+            return False
+        if not self.is_empty():
+            self.set_meta(JSON_MIGRATED_KEY, time.time())
+            return False
+
+        character_settings = {}
+        if os.path.exists(character_settings_path):
+            with open(character_settings_path, 'r') as f:
+                character_settings = json.load(f)
+        cooldown_states = {}
+        if os.path.exists(cooldown_states_path):
+            with open(cooldown_states_path, 'r') as f:
+                cooldown_states = json.load(f)
+
+        # One transaction, so a malformed entry leaves the database empty and unmarked
+        with self._lock, self.conn:
+            character_ids = {}
+            for name, settings in character_settings.get("characters", {}).items():
+                character_ids[name] = self._insert_character(name)
+                self.conn.executemany(ACTION_SETTINGS_UPSERT, [
+                    (character_ids[name], action_key, int(bool(action_settings.get("enabled", False))),
+                     action_settings.get("cooldown_minutes", 30))
+                    for action_key, action_settings in settings.get("actions", {}).items()
+                ])
+
+            current = character_settings.get("current_character")
+            if current:
+                self._insert_character(current)
+                self.conn.execute("UPDATE characters SET is_current = (name = ?)", (current,))
+
+            cooldowns = []
+            for name, actions in cooldown_states.items():
+                if name not in character_ids:
+                    continue
+                for action_key, state in actions.items():
+                    if state.get("is_active") and state.get("end_time"):
+                        started_at = datetime.fromisoformat(state["start_time"]).timestamp()
+                        deadline = datetime.fromisoformat(state["end_time"]).timestamp()
+                        cooldowns.append((character_ids[name], action_key, started_at, deadline))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO cooldowns (character_id, action_key, started_at, deadline) "
+                "VALUES (?, ?, ?, ?)",
+                cooldowns
+            )
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (JSON_MIGRATED_KEY, str(time.time()))
+            )
+
+        self.logger.info(f"Migrated JSON state into {self.path}")
+        return True
@@ -0,0 +1,106 @@
+"""
+JSON state persistence for GravRokBot.
+Coalesces frequent saves into a single debounced, atomic file write.
+"""
+
+import os
+import json
+import atexit
+import logging
+import tempfile
+import threading
+
+def _timer_scheduler(delay, callback):
+    """Run a callback after a delay on a daemon timer thread"""
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+
+class JsonStateStore:
+    """JSON file store with debounced, atomic writes"""
+
+    def __init__(self, path, debounce_seconds=1.0, scheduler=None):
+        """
+        Initialize the state store
+
+        Args:
+            path (str): Path to the JSON file
+            debounce_seconds (float): Time to wait for more changes before writing
+            scheduler (callable, optional): Function taking (delay, callback) used to
+                schedule the deferred write. Defaults to a background timer; UI code
+                should pass its event loop scheduler so writes happen on the UI thread.
+        """
+        self.path = path
+        self.debounce_seconds = debounce_seconds
+        self.scheduler = scheduler or _timer_scheduler
+        self.logger = logging.getLogger("GravRokBot.StateStore")
+
+        self._lock = threading.Lock()
+        # Serializes flushes, so an older snapshot never replaces a newer file
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._write_scheduled = False
+        self.write_count = 0
+
+        # Make sure pending changes are not lost if the process exits
+        atexit.register(self.flush)
+
+    def load(self, default=None):
+        """
+        Load the stored data
+
+        Args:
+            default: Value returned if the file does not exist
+
+        Returns:
+            Parsed JSON data, or default if the file does not exist
+        """
+        if not os.path.exists(self.path):
+            return default
+        with open(self.path, 'r') as f:
+            return json.load(f)
+
+    def save(self, data):
+        """
+        Request that data be written, coalescing with other recent requests
+
+        Args:
+            data: JSON serializable data to persist. The latest object passed
+                before the write happens is the one written.
+        """
+        with self._lock:
+            self._pending = data
+            if self._write_scheduled:
+                return
+            self._write_scheduled = True
+        self.scheduler(self.debounce_seconds, self.flush)
+
+    def flush(self):
+        """Write pending data immediately, if any"""
+        with self._write_lock:
+            with self._lock:
+                data = self._pending
+                self._pending = None
+                self._write_scheduled = False
+            if data is None:
+                return
+            try:
+                self._write_atomic(data)
+            except Exception as e:
+                self.logger.error(f"Error writing {os.path.basename(self.path)}: {e}")
+
+    def _write_atomic(self, data):
+        """Write data to a temp file and rename it over the target"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.write_count += 1
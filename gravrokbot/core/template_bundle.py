@@ -0,0 +1,295 @@
+"""
+Template asset bundle for GravRokBot.
+Packs the referenced template images, decoded to grayscale and BGR, into one
+file that is memory-mapped at startup. Templates are then read as array views
+of the mapping instead of decoding a PNG each, and bot processes and vision
+workers mapping the same bundle share its pages in the OS page cache.
+
+Layout: an 8-byte magic, the length of a JSON index as a little-endian uint32,
+the index, then the pixel data of each template at 64-byte aligned offsets.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import logging
+import argparse
+import threading
+from gravrokbot.utils.lazy_import import lazy_module
+from gravrokbot.core.config_snapshot import PACKAGE_DIR, load_snapshot
+
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+MAGIC = b"GRTBNDL1"
+HEADER = struct.Struct("<8sI")
+ALIGNMENT = 64
+
+# Built by gravrokbot-build-templates, used when present
+DEFAULT_BUNDLE_PATH = os.path.join(PACKAGE_DIR, "assets", "templates.bundle")
+
+logger = logging.getLogger("GravRokBot.TemplateBundle")
+
+def bundle_key(image_path, base_dir=PACKAGE_DIR):
+    """
+    Get the index key of a template, relative to the package so bundles are portable
+
+    Args:
+        image_path (str): Template path
+        base_dir (str): Directory keys are relative to
+
+    Returns:
+        str: Key with forward slashes
+    """
+    path = os.path.abspath(image_path)
+    try:
+        relative = os.path.relpath(path, base_dir)
+    except ValueError:
+        # Another drive on Windows
+        return path.replace(os.sep, '/')
+    if relative.startswith(os.pardir):
+        return path.replace(os.sep, '/')
+    return relative.replace(os.sep, '/')
+
+def _source_stamp(image_path):
+    """Get the (mtime_ns, size) of a template file, None if it does not exist"""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def referenced_templates(snapshot):
+    """
+    Collect the template paths referenced by the action settings
+
+    Args:
+        snapshot (ConfigSnapshot): Compiled settings
+
+    Returns:
+        list: Absolute template paths, without duplicates, in settings order
+    """
+    paths = []
+    for action in snapshot.actions.values():
+        for value in action.images:
+            for path in (value if isinstance(value, tuple) else (value,)):
+                if path not in paths:
+                    paths.append(path)
+    return paths
+
+def build_bundle(image_paths, output_path=DEFAULT_BUNDLE_PATH, metadata=None, base_dir=PACKAGE_DIR):
+    """
+    Decode templates and write them into a bundle
+
+    The bundle is written to a temporary file and moved into place, so a bot
+    mapping the previous bundle keeps a consistent view.
+
+    Args:
+        image_paths (list): Template paths
+        output_path (str): Bundle file to write
+        metadata (dict, optional): Template path to extra metadata, e.g.
+            {'roi': [left, top, width, height], 'scale': 1.0}
+        base_dir (str): Directory index keys are relative to
+
+    Returns:
+        list: Keys of the packed templates
+    """
+    metadata = metadata or {}
+    entries = {}
+    blobs = []
+    offset = 0
+    for image_path in image_paths:
+        if not os.path.exists(image_path):
+            logger.warning(f"Skipping missing template: {image_path}")
+            continue
+        # Decoded like the image files are read, so matches score the same
+        bgr = cv2.imread(image_path, cv2.IMREAD_COLOR)
+        gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if bgr is None or gray is None:
+            logger.warning(f"Skipping template that could not be loaded: {image_path}")
+            continue
+        height, width = gray.shape
+        extra = metadata.get(image_path, {})
+
+        entry = {
+            'width': width,
+            'height': height,
+            'roi': extra.get('roi'),
+            'scale': extra.get('scale', 1.0),
+            'source': _source_stamp(image_path)
+        }
+        for name, array in (('gray', gray), ('bgr', bgr)):
+            offset = _align(offset)
+            entry[name] = offset
+            blobs.append((offset, np.ascontiguousarray(array).tobytes()))
+            offset += array.nbytes
+        entries[bundle_key(image_path, base_dir)] = entry
+
+    index = json.dumps({'templates': entries}, separators=(',', ':')).encode('utf-8')
+    data_start = _align(HEADER.size + len(index))
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        for blob_offset, blob in blobs:
+            f.seek(data_start + blob_offset)
+            f.write(blob)
+    os.replace(temp_path, output_path)
+
+    logger.info(f"Packed {len(entries)} templates into {output_path}")
+    return list(entries)
+
+class TemplateBundle:
+    """Read-only, memory-mapped template bundle"""
+
+    def __init__(self, path, base_dir=PACKAGE_DIR):
+        """
+        Map a bundle file
+
+        Args:
+            path (str): Bundle file
+            base_dir (str): Directory index keys are relative to
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a template bundle
+        """
+        self.path = path
+        self.base_dir = base_dir
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Not a template bundle: {path}")
+        index = json.loads(self._mmap[HEADER.size:HEADER.size + index_length].decode('utf-8'))
+        self._data_start = _align(HEADER.size + index_length)
+        self.entries = index['templates']
+
+        # Keys whose source file was checked against the packed stamp
+        self._checked = {}
+
+    def __contains__(self, image_path):
+        return bundle_key(image_path, self.base_dir) in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _entry(self, image_path):
+        """
+        Get the index entry of a template if it is packed and current
+
+        A template whose file changed after the bundle was built is treated as
+        missing, so edits are picked up without rebuilding. Deployments without
+        the loose files use the packed copy.
+        """
+        key = bundle_key(image_path, self.base_dir)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        current = self._checked.get(key)
+        if current is None:
+            stamp = _source_stamp(image_path)
+            current = self._checked[key] = stamp is None or stamp == entry['source']
+            if not current:
+                logger.debug("Template changed since the bundle was built: %s", key)
+        return entry if current else None
+
+    def get(self, image_path, grayscale=True):
+        """
+        Get a decoded template as a read-only view of the mapping
+
+        Args:
+            image_path (str): Template path
+            grayscale (bool): Grayscale instead of BGR
+
+        Returns:
+            numpy.ndarray: Template, None if it is not packed or is out of date
+        """
+        entry = self._entry(image_path)
+        if entry is None:
+            return None
+        shape = (entry['height'], entry['width']) if grayscale else (entry['height'], entry['width'], 3)
+        offset = self._data_start + entry['gray' if grayscale else 'bgr']
+        count = shape[0] * shape[1] * (1 if grayscale else 3)
+        return np.frombuffer(self._mmap, dtype=np.uint8, count=count, offset=offset).reshape(shape)
+
+    def size(self, image_path):
+        """
+        Get the (width, height) of a packed template
+
+        Args:
+            image_path (str): Template path
+
+        Returns:
+            tuple: (width, height), None if it is not packed or is out of date
+        """
+        entry = self._entry(image_path)
+        return (entry['width'], entry['height']) if entry else None
+
+    def metadata(self, image_path):
+        """
+        Get the region of interest and scale stored for a template
+
+        Args:
+            image_path (str): Template path
+
+        Returns:
+            dict: {'roi': list or None, 'scale': float}, None if not packed
+        """
+        entry = self.entries.get(bundle_key(image_path, self.base_dir))
+        return {'roi': entry['roi'], 'scale': entry['scale']} if entry else None
+
+    def close(self):
+        """Unmap the bundle, views returned by get must no longer be used"""
+        self._mmap.close()
+
+_bundles = {}
+_bundles_lock = threading.Lock()
+
+def get_template_bundle(path=DEFAULT_BUNDLE_PATH):
+    """
+    Get the process-wide mapping of a bundle, opened on first use
+
+    Args:
+        path (str): Bundle file
+
+    Returns:
+        TemplateBundle: Mapped bundle, None if the file is missing or invalid
+    """
+    with _bundles_lock:
+        if path not in _bundles:
+            bundle = None
+            if os.path.exists(path):
+                try:
+                    bundle = TemplateBundle(path)
+                    logger.info(f"Mapped {len(bundle)} templates from {path}")
+                except (OSError, ValueError) as e:
+                    logger.error(f"Could not map template bundle {path}: {e}")
+            _bundles[path] = bundle
+        return _bundles[path]
+
+def main(argv=None):
+    """Build the template bundle from the settings files"""
+    parser = argparse.ArgumentParser(description="Pack the GravRokBot templates into one bundle")
+    parser.add_argument("--output", default=DEFAULT_BUNDLE_PATH, help="bundle file to write")
+    parser.add_argument("--images", nargs="*", help="templates to pack instead of those in the settings")
+    args = parser.parse_args(argv)
+
+    image_paths = args.images or referenced_templates(load_snapshot())
+    keys = build_bundle(image_paths, args.output)
+    print(f"Packed {len(keys)} of {len(image_paths)} templates into {args.output}")
+    return 0 if keys or not image_paths else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
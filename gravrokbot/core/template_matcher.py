@@ -0,0 +1,248 @@
+"""
+Template matching for GravRokBot.
+Matches template images against captured frames using OpenCV.
+Templates are read from the memory-mapped template bundle when one is built,
+and decoded from their image files otherwise. Variants derived from a
+template for the other match methods and scales are computed once and cached.
+"""
+
+import os
+import logging
+from gravrokbot.utils.lazy_import import lazy_module
+from gravrokbot.core.template_bundle import get_template_bundle
+from gravrokbot.core.config_snapshot import MATCH_METHODS
+
+cv2 = lazy_module("cv2")
+np = lazy_module("numpy")
+
+# Canny hysteresis thresholds of the edge maps matched by the 'edges' method
+EDGE_THRESHOLDS = (50, 150)
+
+class TemplateMatcher:
+    """Finds template images inside captured screen frames"""
+
+    def __init__(self, bundle=None):
+        """
+        Initialize the matcher with an empty template cache
+
+        Args:
+            bundle (TemplateBundle, optional): Template bundle, the default bundle if None
+        """
+        self.templates = {}
+        self.variants = {}
+        self.bundle = bundle if bundle is not None else get_template_bundle()
+        self.logger = logging.getLogger("GravRokBot.TemplateMatcher")
+
+    def load_template(self, image_path, grayscale=True):
+        """
+        Load a template image, caching the decoded result
+
+        Args:
+            image_path (str): Path to template image file
+            grayscale (bool): Whether to load the template in grayscale
+
+        Returns:
+            numpy.ndarray: Decoded template, None if it could not be loaded
+        """
+        key = (image_path, grayscale)
+        template = self.templates.get(key)
+        if template is None and self.bundle is not None:
+            template = self.bundle.get(image_path, grayscale)
+            if template is not None:
+                self.templates[key] = template
+        if template is None:
+            flags = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+            template = cv2.imread(image_path, flags)
+            if template is None:
+                self.logger.error(f"Could not load template: {image_path}")
+                return None
+            self.templates[key] = template
+        return template
+
+    def prepare_frame(self, frame, grayscale=True):
+        """
+        Convert an RGB frame to the color space used for matching
+
+        Args:
+            frame (numpy.ndarray): RGB frame as returned by a screenshot
+            grayscale (bool): Whether to convert to grayscale
+
+        Returns:
+            numpy.ndarray: Frame ready for matching
+        """
+        if frame.ndim == 2:
+            return frame
+        if grayscale:
+            return cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        return cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+
+    def template_variant(self, image_path, variant, scale=1.0):
+        """
+        Get a template prepared for a match method, computing it once
+
+        Variants are 'gray' and 'bgr' (the decoded template), 'zero_mean'
+        (grayscale as float32 minus its mean) and 'edges' (Canny edge map).
+        Scaled variants are derived from the template resized to the scale.
+
+        Args:
+            image_path (str): Path to template image file
+            variant (str): Variant name
+            scale (float): Factor the template is resized by
+
+        Returns:
+            numpy.ndarray: Template variant, None if the template could not be loaded
+        """
+        key = (image_path, variant, scale)
+        template = self.variants.get(key)
+        if template is not None:
+            return template
+
+        if variant in ('gray', 'bgr'):
+            template = self.load_template(image_path, variant == 'gray')
+            if template is not None and scale != 1.0:
+                height, width = template.shape[:2]
+                size = (max(1, round(width * scale)), max(1, round(height * scale)))
+                template = cv2.resize(template, size, interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR)
+        else:
+            template = self.template_variant(image_path, 'gray', scale)
+            if template is not None and variant == 'edges':
+                template = cv2.Canny(template, *EDGE_THRESHOLDS)
+            elif template is not None:
+                template = template.astype(np.float32)
+                template -= template.mean()
+                # Energy of the zero-mean template, the template half of the concordance denominator
+                self.variants[(image_path, 'energy', scale)] = float(np.dot(template.ravel(), template.ravel()))
+
+        if template is not None:
+            self.variants[key] = template
+        return template
+
+    def _prepare(self, frame, grayscale, match_method):
+        """Convert a frame for a match method, once per call for all scales"""
+        if match_method == 'ccoeff':
+            return self.prepare_frame(frame, grayscale)
+        gray = self.prepare_frame(frame, True)
+        if match_method == 'edges':
+            return cv2.Canny(gray, *EDGE_THRESHOLDS)
+        return gray.astype(np.float32)
+
+    def _concordance(self, haystack, template, energy):
+        """
+        Score every window by the concordance of its pixels with the template
+
+        2 * cov(window, template) / (var(window) + var(template)) is 1 only
+        for identical windows up to a brightness offset, and unlike the
+        correlation coefficient also drops when the contrast differs.
+        """
+        height, width = template.shape
+        count = height * width
+        # Sum of window * zero-mean template equals the window's covariance sum
+        cross = cv2.matchTemplate(haystack, template, cv2.TM_CCORR)
+        sums, squares = cv2.integral2(haystack, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        window_sums = sums[height:, width:] - sums[:-height, width:] - sums[height:, :-width] + sums[:-height, :-width]
+        window_squares = (squares[height:, width:] - squares[:-height, width:]
+                          - squares[height:, :-width] + squares[:-height, :-width])
+        denominator = window_squares - window_sums * window_sums / count + energy
+        scores = np.zeros(cross.shape, dtype=np.float32)
+        np.divide(2.0 * cross, denominator, out=scores, where=denominator > 1e-6, casting='unsafe')
+        return scores
+
+    def _match_scores(self, haystack, image_path, grayscale, match_method, scale):
+        """
+        Run template matching and return the score map with template size
+
+        Returns:
+            tuple: (scores, width, height), or (None, 0, 0) if matching is impossible
+        """
+        if match_method == 'ccoeff':
+            variant = 'gray' if grayscale else 'bgr'
+        elif match_method in MATCH_METHODS:
+            variant = 'edges' if match_method == 'edges' else 'zero_mean'
+        else:
+            raise ValueError(f"Unknown match method: {match_method}")
+
+        template = self.template_variant(image_path, variant, scale)
+        if template is None:
+            return None, 0, 0
+
+        height, width = template.shape[:2]
+        if haystack.shape[0] < height or haystack.shape[1] < width:
+            self.logger.debug("Frame smaller than template: %s", os.path.basename(image_path))
+            return None, 0, 0
+
+        if match_method == 'concordance':
+            scores = self._concordance(haystack, template, self.variants[(image_path, 'energy', scale)])
+        elif match_method == 'edges':
+            # Overlap of binary edge maps, zero for windows without edges
+            scores = cv2.matchTemplate(haystack, template, cv2.TM_CCORR_NORMED)
+        else:
+            scores = cv2.matchTemplate(haystack, template, cv2.TM_CCOEFF_NORMED)
+        return scores, width, height
+
+    def find(self, frame, image_path, confidence=0.8, grayscale=True, match_method='ccoeff', scales=(1.0,)):
+        """
+        Find the best match of a template in a frame
+
+        Args:
+            frame (numpy.ndarray): RGB frame to search in
+            image_path (str): Path to template image file
+            confidence (float): Match confidence threshold (0-1)
+            grayscale (bool): Whether to match in grayscale, 'ccoeff' only
+            match_method (str): 'ccoeff', 'edges' or 'concordance'
+            scales (tuple): Factors to resize the template by, the best match wins
+
+        Returns:
+            tuple: ((x, y) center of the match or None, best score)
+        """
+        haystack = self._prepare(frame, grayscale, match_method)
+        best_score, best_center = 0.0, None
+        for scale in scales:
+            scores, width, height = self._match_scores(haystack, image_path, grayscale, match_method, scale)
+            if scores is None:
+                continue
+            _, max_score, _, max_loc = cv2.minMaxLoc(scores)
+            if best_center is None or max_score > best_score:
+                best_score = max_score
+                best_center = (max_loc[0] + width // 2, max_loc[1] + height // 2)
+
+        if best_center is None or best_score < confidence:
+            return None, float(best_score)
+        return best_center, float(best_score)
+
+    def find_all(self, frame, image_path, confidence=0.8, grayscale=True, match_method='ccoeff', scales=(1.0,)):
+        """
+        Find all non-overlapping matches of a template in a frame
+
+        Args:
+            frame (numpy.ndarray): RGB frame to search in
+            image_path (str): Path to template image file
+            confidence (float): Match confidence threshold (0-1)
+            grayscale (bool): Whether to match in grayscale, 'ccoeff' only
+            match_method (str): 'ccoeff', 'edges' or 'concordance'
+            scales (tuple): Factors to resize the template by
+
+        Returns:
+            list: List of (x, y) centers of matches, best scores first
+        """
+        haystack = self._prepare(frame, grayscale, match_method)
+        candidates = []
+        for scale in scales:
+            scores, width, height = self._match_scores(haystack, image_path, grayscale, match_method, scale)
+            if scores is None:
+                continue
+            ys, xs = np.where(scores >= confidence)
+            candidates.extend(zip(scores[ys, xs], xs, ys, [width] * len(xs), [height] * len(xs)))
+        if not candidates:
+            return []
+
+        order = np.argsort([candidate[0] for candidate in candidates])[::-1]
+
+        # Keep the strongest match in each template-sized neighbourhood
+        accepted = []
+        for i in order:
+            _, x, y, width, height = candidates[i]
+            x, y = int(x), int(y)
+            if all(abs(x - ax) >= aw or abs(y - ay) >= ah for ax, ay, aw, ah in accepted):
+                accepted.append((x, y, width, height))
+
+        return [(x + width // 2, y + height // 2) for x, y, width, height in accepted]
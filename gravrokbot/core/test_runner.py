@@ -2,11 +2,9 @@
 Test runner for simulating action execution
 """
 
-import random
 import logging
 import threading
-import time
-from datetime import datetime, timedelta
+from datetime import timedelta
 from gravrokbot.core.bot_runner import BotRunner
 
 class TestRunner(BotRunner):
@@ -49,6 +47,7 @@ class TestRunner(BotRunner):
         self.logger.info("Starting test runner")
         self.running = True
         self.interrupt_requested = False
+        self.stop_event.clear()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
     
@@ -72,11 +71,11 @@ class TestRunner(BotRunner):
     
     def _interruptible_sleep(self, seconds):
         """Sleep function that can be interrupted"""
-        self.current_sleep_start = time.time()
+        self.current_sleep_start = self.clock.time()
         self.current_sleep_duration = seconds
         
-        end_time = time.time() + seconds
-        while time.time() < end_time:
+        end_time = self.clock.time() + seconds
+        while self.clock.time() < end_time:
             # Check if interrupted
             if self.interrupt_requested:
                 self.logger.debug("Sleep interrupted")
@@ -87,7 +86,7 @@ class TestRunner(BotRunner):
                 return True
                 
             # Sleep in small increments to allow interruption
-            time.sleep(0.1)
+            self.clock.sleep(min(self.clock.poll_interval, end_time - self.clock.time()))
             
         self.current_sleep_start = None
         self.current_sleep_duration = 0
@@ -102,14 +101,14 @@ class TestRunner(BotRunner):
             while self.running and not self.interrupt_requested:
                 self.loop_counter += 1
                 self.logger.info(f"Start loop number {self.loop_counter}")
-                self.main_window.add_log(f"Start loop number {self.loop_counter}")
+                self.main_window.add_log(f"Start loop number {self.loop_counter}", kind='loop')
                 
                 # Refresh action list at the start of each loop - log added by the refresh method
-                self.main_window.refresh_runner_actions()
+                self.main_window.refresh_runner_actions(stop_event=self.stop_event)
                 
                 # Add log message for resetting action statuses to Waiting
                 self.logger.info("Reset actions status to Waiting")
-                self.main_window.add_log("Reset actions status to Waiting")
+                self.main_window.add_log("Reset actions status to Waiting", kind='loop')
                 
                 # Set enabled actions to "Waiting" status
                 for action in self.actions:
@@ -122,7 +121,7 @@ class TestRunner(BotRunner):
                 
                 # Log the start of action execution
                 self.logger.info("Start Actions Execution")
-                self.main_window.add_log("Start Actions Execution")
+                self.main_window.add_log("Start Actions Execution", kind='loop')
                 
                 # Process each action
                 for action in self.actions:
@@ -141,7 +140,7 @@ class TestRunner(BotRunner):
                         self.main_window.update_action_status(action.name, "Working")
                         
                         # Log action start
-                        start_time = datetime.now().strftime("%H:%M:%S")
+                        start_time = self.clock.now().strftime("%H:%M:%S")
                         self.logger.info(f"[{start_time}] Testing Action: {action.name} - Starting (Simulating {self.dummy_execution_seconds}s)")
                         
                         # Simulate action execution with interruptible sleep
@@ -152,7 +151,7 @@ class TestRunner(BotRunner):
                         # If we're still running (not interrupted), complete the action
                         if self.running and not self.interrupt_requested:
                             # Log action completion
-                            end_time = datetime.now().strftime("%H:%M:%S")
+                            end_time = self.clock.now().strftime("%H:%M:%S")
                             self.logger.info(f"[{end_time}] Testing Action: {action.name} - Completed")
                             
                             # Update UI status
@@ -169,7 +168,7 @@ class TestRunner(BotRunner):
                 
                 # Log loop completion
                 self.logger.info(f"Completed loop number {self.loop_counter}")
-                self.main_window.add_log(f"Completed loop number {self.loop_counter}")
+                self.main_window.add_log(f"Completed loop number {self.loop_counter}", kind='loop')
                 
                 # Check if we should continue running
                 if not self.continuous_running:
@@ -178,10 +177,10 @@ class TestRunner(BotRunner):
                     break
                 
                 # Calculate and log when the next loop will start
-                next_loop_time = datetime.now() + timedelta(seconds=self.refresh_rate)
+                next_loop_time = self.clock.now() + timedelta(seconds=self.refresh_rate)
                 next_loop_time_str = next_loop_time.strftime("%H:%M:%S")
                 self.logger.info(f"Next loop will start in {self.refresh_rate} seconds, at {next_loop_time_str}")
-                self.main_window.add_log(f"Next loop will start in {self.refresh_rate} seconds, at {next_loop_time_str}")
+                self.main_window.add_log(f"Next loop will start in {self.refresh_rate} seconds, at {next_loop_time_str}", kind='loop')
                 
                 # Wait for next cycle with interruptible sleep
                 self.logger.info(f"Waiting {self.refresh_rate} seconds for next cycle...")
@@ -193,6 +192,7 @@ class TestRunner(BotRunner):
                 
         except Exception as e:
             self.logger.error(f"Error in test runner loop: {e}")
+            self.main_window.add_log(f"Error in test runner loop: {e}", kind='error')
         finally:
             self.logger.info("Test runner loop stopped")
             self.running = False
@@ -0,0 +1,217 @@
+"""
+Step latency tracing for GravRokBot.
+Records how long captures, template matches, OCR, input and humanized
+delays take for each action, into a fixed-size ring buffer.
+
+Steps record their exclusive time: the time of the steps nested in them is
+subtracted, so a transition only counts its own work and the categories of
+an action add up to the time spent in traced steps.
+"""
+
+import json
+import time
+import bisect
+import threading
+from collections import deque
+
+# Step categories recorded by the screen interaction and workflow layers
+CATEGORIES = ('transition', 'capture', 'match', 'ocr', 'input', 'humanized_delay')
+
+# Upper bounds of the histogram buckets in milliseconds
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float('inf'))
+
+class _Span:
+    """Times one step and records its exclusive time in the tracer on exit"""
+
+    __slots__ = ('tracer', 'category', 'name', 'start_ns', 'child_ns', 'parent')
+
+    def __init__(self, tracer, category, name):
+        self.tracer = tracer
+        self.category = category
+        self.name = name
+
+    def __enter__(self):
+        context = self.tracer._context
+        self.parent = getattr(context, 'span', None)
+        context.span = self
+        self.child_ns = 0
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        self.tracer._context.span = self.parent
+        if self.parent is not None:
+            self.parent.child_ns += end_ns - self.start_ns
+        self.tracer.record(self.category, self.name, self.start_ns, end_ns, self.child_ns)
+        return False
+
+class _NullSpan:
+    """Span used when tracing is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class StepTracer:
+    """Low-overhead recorder of step timings grouped by action"""
+
+    def __init__(self, capacity=4096, enabled=True):
+        """
+        Initialize the tracer
+
+        Args:
+            capacity (int): Number of steps kept, older steps are dropped
+            enabled (bool): Whether steps are recorded
+        """
+        self.enabled = enabled
+        self.steps = deque(maxlen=capacity)
+        self._context = threading.local()
+        self.sinks = []
+
+    def set_capacity(self, capacity):
+        """
+        Resize the ring buffer, keeping the most recent steps
+
+        Args:
+            capacity (int): Number of steps kept
+        """
+        self.steps = deque(self.steps, maxlen=capacity)
+
+    def set_action(self, action_name):
+        """
+        Set the action that steps on the current thread belong to
+
+        Args:
+            action_name (str): Action name, None outside of actions
+        """
+        self._context.action = action_name
+
+    def current_action(self):
+        """
+        Get the action that steps on the current thread belong to
+
+        Returns:
+            str: Action name, None outside of actions
+        """
+        return getattr(self._context, 'action', None)
+
+    def span(self, category, name=None):
+        """
+        Time a step with a context manager
+
+        Args:
+            category (str): Step category, one of CATEGORIES
+            name (str, optional): Step detail, e.g. template or trigger name
+
+        Returns:
+            Context manager recording the step on exit
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, category, name)
+
+    def record(self, category, name, start_ns, end_ns, child_ns=0):
+        """
+        Record a finished step
+
+        Args:
+            category (str): Step category
+            name (str): Step detail
+            start_ns (int): perf_counter_ns at start
+            end_ns (int): perf_counter_ns at end
+            child_ns (int): Time of the steps nested in this one, not counted
+        """
+        step = (self.current_action(), category, name, start_ns, end_ns - start_ns - child_ns)
+        self.steps.append(step)
+        for sink in self.sinks:
+            sink(step)
+
+    def add_sink(self, sink):
+        """
+        Forward every recorded step to a callable
+
+        Args:
+            sink (callable): Called with (action, category, name, start_ns, duration_ns),
+                where duration_ns is the exclusive time of the step
+        """
+        self.sinks.append(sink)
+
+    def clear(self):
+        """Drop all recorded steps"""
+        self.steps.clear()
+
+    def summary(self):
+        """
+        Total time per category for each action
+
+        Returns:
+            dict: {action: {'capture_ms': float, 'match_ms': float, ...}}
+        """
+        totals = {}
+        for action, category, _, _, duration_ns in list(self.steps):
+            action_totals = totals.setdefault(action or 'runner', dict.fromkeys(
+                (f"{name}_ms" for name in CATEGORIES), 0.0
+            ))
+            key = f"{category}_ms"
+            action_totals[key] = action_totals.get(key, 0.0) + duration_ns / 1e6
+        return totals
+
+    def histograms(self):
+        """
+        Step duration histograms per action and category
+
+        Returns:
+            dict: {action: {category: {'count', 'buckets', 'p50_ms', 'p90_ms', 'max_ms'}}}
+        """
+        durations = {}
+        for action, category, _, _, duration_ns in list(self.steps):
+            durations.setdefault(action or 'runner', {}).setdefault(category, []).append(duration_ns / 1e6)
+
+        result = {}
+        for action, categories in durations.items():
+            result[action] = {}
+            for category, values in categories.items():
+                values.sort()
+                counts = [0] * len(HISTOGRAM_BUCKETS_MS)
+                for value in values:
+                    counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, value)] += 1
+                result[action][category] = {
+                    'count': len(values),
+                    'buckets': {
+                        ('+Inf' if bound == float('inf') else str(bound)): count
+                        for bound, count in zip(HISTOGRAM_BUCKETS_MS, counts)
+                    },
+                    'p50_ms': values[int(0.5 * (len(values) - 1))],
+                    'p90_ms': values[int(0.9 * (len(values) - 1))],
+                    'max_ms': values[-1]
+                }
+        return result
+
+    def export(self, path):
+        """
+        Write per-action totals and histograms to a JSON file
+
+        Args:
+            path (str): Output file path
+        """
+        with open(path, 'w') as f:
+            json.dump({'summary': self.summary(), 'histograms': self.histograms()}, f, indent=4)
+
+# Process-wide tracer shared by screen interaction, workflows and runners
+tracer = StepTracer()
+
+def get_tracer():
+    """
+    Get the process-wide step tracer
+
+    Returns:
+        StepTracer: Shared tracer
+    """
+    return tracer
@@ -0,0 +1,200 @@
+"""
+Process-pool vision service for GravRokBot.
+Runs template matching in worker processes so it scales across cores
+instead of contending on the GIL with the runner threads. Frames are
+handed to workers through shared memory rather than being pickled.
+"""
+
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from gravrokbot.utils.lazy_import import lazy_module
+from gravrokbot.core.template_matcher import TemplateMatcher
+
+np = lazy_module("numpy")
+
+# Matcher owned by each worker process, keeps its template cache between calls
+_worker_matcher = None
+
+def _init_worker():
+    """Create the per-process template matcher"""
+    global _worker_matcher
+    _worker_matcher = TemplateMatcher()
+
+def _match_in_worker(shm_name, shape, dtype, method, image_path, confidence, grayscale, match_method, scales):
+    """
+    Attach to a shared frame and run a matcher method on it
+
+    Returns:
+        Result of TemplateMatcher.find or TemplateMatcher.find_all
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frame = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        result = getattr(_worker_matcher, method)(frame, image_path, confidence, grayscale, match_method, scales)
+        # Drop the view before closing, the buffer cannot be released while exported
+        del frame
+        return result
+    finally:
+        shm.close()
+
+class SharedFrame:
+    """A captured frame published in shared memory for the worker processes"""
+
+    def __init__(self, frame):
+        """
+        Copy a frame into a new shared memory block
+
+        Args:
+            frame (numpy.ndarray): Frame to publish
+        """
+        frame = np.ascontiguousarray(frame)
+        self.shape = frame.shape
+        self.dtype = frame.dtype.str
+        self.shm = shared_memory.SharedMemory(create=True, size=max(frame.nbytes, 1))
+        view = np.ndarray(frame.shape, dtype=frame.dtype, buffer=self.shm.buf)
+        view[...] = frame
+        del view
+
+    @property
+    def name(self):
+        """Name of the shared memory block"""
+        return self.shm.name
+
+    def release(self):
+        """Free the shared memory block"""
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+class VisionPool:
+    """Pool of worker processes answering template match requests"""
+
+    def __init__(self, workers=2):
+        """
+        Start the worker pool
+
+        Args:
+            workers (int): Number of worker processes
+        """
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        self.logger = logging.getLogger("GravRokBot.VisionPool")
+        self.logger.info(f"Vision pool started with {workers} workers")
+
+    def _submit(self, shared_frame, method, image_path, confidence, grayscale, match_method, scales):
+        return self.executor.submit(
+            _match_in_worker,
+            shared_frame.name,
+            shared_frame.shape,
+            shared_frame.dtype,
+            method,
+            image_path,
+            confidence,
+            grayscale,
+            match_method,
+            tuple(scales)
+        )
+
+    def find(self, frame, image_path, confidence=0.8, grayscale=True, match_method='ccoeff', scales=(1.0,)):
+        """
+        Find the best match of a template in a frame
+
+        Args:
+            frame (numpy.ndarray): RGB frame to search in
+            image_path (str): Path to template image file
+            confidence (float): Match confidence threshold (0-1)
+            grayscale (bool): Whether to match in grayscale
+            match_method (str): 'ccoeff', 'edges' or 'concordance'
+            scales (tuple): Factors to resize the template by
+
+        Returns:
+            tuple: ((x, y) center of the match or None, best score)
+        """
+        with SharedFrame(frame) as shared_frame:
+            return self._submit(shared_frame, 'find', image_path, confidence, grayscale,
+                                match_method, scales).result()
+
+    def find_all(self, frame, image_path, confidence=0.8, grayscale=True, match_method='ccoeff', scales=(1.0,)):
+        """
+        Find all matches of a template in a frame
+
+        Args:
+            frame (numpy.ndarray): RGB frame to search in
+            image_path (str): Path to template image file
+            confidence (float): Match confidence threshold (0-1)
+            grayscale (bool): Whether to match in grayscale
+            match_method (str): 'ccoeff', 'edges' or 'concordance'
+            scales (tuple): Factors to resize the template by
+
+        Returns:
+            list: List of (x, y) centers of matches
+        """
+        with SharedFrame(frame) as shared_frame:
+            return self._submit(shared_frame, 'find_all', image_path, confidence, grayscale,
+                                match_method, scales).result()
+
+    def find_many(self, frame, image_paths, confidence=0.8, grayscale=True, match_method='ccoeff', scales=(1.0,)):
+        """
+        Match several templates against one frame in parallel
+
+        The frame is copied into shared memory once and all workers read it.
+
+        Args:
+            frame (numpy.ndarray): RGB frame to search in
+            image_paths (list): Paths to template image files
+            confidence (float): Match confidence threshold (0-1)
+            grayscale (bool): Whether to match in grayscale
+            match_method (str): 'ccoeff', 'edges' or 'concordance'
+            scales (tuple): Factors to resize the template by
+
+        Returns:
+            dict: Mapping of image path to ((x, y) or None, best score)
+        """
+        with SharedFrame(frame) as shared_frame:
+            futures = {
+                path: self._submit(shared_frame, 'find', path, confidence, grayscale, match_method, scales)
+                for path in image_paths
+            }
+            return {path: future.result() for path, future in futures.items()}
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self.executor.shutdown(wait=True)
+        self.logger.info("Vision pool stopped")
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+def get_shared_pool(workers):
+    """
+    Get the process-wide vision pool, starting it on first use
+
+    Screen interaction instances are recreated often, so they share one
+    pool instead of each spawning its own workers.
+
+    Args:
+        workers (int): Number of worker processes if the pool has to be started
+
+    Returns:
+        VisionPool: Shared vision pool
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = VisionPool(workers)
+        return _shared_pool
+
+def shutdown_shared_pool():
+    """Stop the process-wide vision pool if it was started"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.shutdown()
+            _shared_pool = None
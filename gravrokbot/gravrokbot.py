@@ -8,9 +8,7 @@ using computer vision and simulated human-like inputs.
 
 import os
 import sys
-import json
 import logging
-import colorlog
 from PyQt6.QtWidgets import QApplication, QTreeWidgetItem
 from PyQt6.QtCore import Qt
 
@@ -18,121 +16,51 @@ from PyQt6.QtCore import Qt
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from gravrokbot.ui.main_window import MainWindow
-from gravrokbot.core.screen_interaction import ScreenInteraction
-from gravrokbot.core.action_runner import ActionRunner
-from gravrokbot.actions.gather_resources import GatherResourcesAction
-from gravrokbot.actions.collect_city_resources import CollectCityResourcesAction
-from gravrokbot.actions.change_character import ChangeCharacterAction
-from gravrokbot.actions.close_game import CloseGameAction
-from gravrokbot.actions.start_game import StartGameAction
+from gravrokbot.utils.log_pipeline import setup_logging
 
 # Configure logger
 def setup_logger():
     """Configure the application logger"""
-    logger = logging.getLogger("GravRokBot")
-    logger.setLevel(logging.DEBUG)
-    
-    # Console handler with colors
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
-    
-    # Color formatter
-    color_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s[%(asctime)s] %(levelname)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
-    console_handler.setFormatter(color_formatter)
-    
-    # File handler
-    os.makedirs("logs", exist_ok=True)
-    file_handler = logging.FileHandler("logs/gravrokbot.log")
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter("[%(asctime)s] %(levelname)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-    file_handler.setFormatter(file_formatter)
-    
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    
-    return logger
+    setup_logging(level=logging.DEBUG, console_level=logging.DEBUG)
+    return logging.getLogger("GravRokBot")
 
 def load_config():
     """
-    Load configuration from JSON file
+    Load, validate and compile configuration from the JSON files
     
     Returns:
-        dict: Configuration dictionary
+        ConfigSnapshot: Compiled configuration
     """
-    config_path = os.path.join(os.path.dirname(__file__), "config", "default_settings.json")
-    user_config_path = os.path.join(os.path.dirname(__file__), "config", "settings.json")
-    
-    # Load default config
-    with open(config_path, 'r') as f:
-        config = json.load(f)
-    
-    # Merge with user config if exists
-    if os.path.exists(user_config_path):
-        try:
-            with open(user_config_path, 'r') as f:
-                user_config = json.load(f)
-                
-            # Recursive merge function
-            def merge_dicts(d1, d2):
-                for k, v in d2.items():
-                    if k in d1 and isinstance(d1[k], dict) and isinstance(v, dict):
-                        merge_dicts(d1[k], v)
-                    else:
-                        d1[k] = v
-            
-            merge_dicts(config, user_config)
-        except Exception as e:
-            logger.error(f"Error loading user config: {e}")
-    
-    return config
+    from gravrokbot.core.config_snapshot import load_snapshot
+    return load_snapshot()
 
 def initialize_bot(config):
     """
     Initialize bot components
     
     Args:
-        config (dict): Configuration dictionary
+        config (ConfigSnapshot): Compiled configuration
         
     Returns:
         tuple: (ScreenInteraction, ActionRunner) instances
     """
+    # Bot modules and the vision stack are imported once the UI is up
+    from gravrokbot.core.screen_interaction import ScreenInteraction
+    from gravrokbot.core.action_runner import ActionRunner
+    from gravrokbot.core.action_registry import get_action_registry
+    
     # Initialize screen interaction
-    screen = ScreenInteraction(config['screen'])
+    screen = ScreenInteraction(config.section('screen'))
     
     # Initialize action runner
-    runner = ActionRunner(config['runner'])
-    
-    # Create and add actions
-    if 'gather_resources' in config['actions']:
-        gather_action = GatherResourcesAction(screen, config['actions']['gather_resources'])
-        runner.add_action(gather_action)
+    runner = ActionRunner(config.section('runner'))
     
-    if 'collect_city_resources' in config['actions']:
-        collect_action = CollectCityResourcesAction(screen, config['actions']['collect_city_resources'])
-        runner.add_action(collect_action)
-    
-    if 'change_character' in config['actions']:
-        change_character_action = ChangeCharacterAction(screen, config['actions']['change_character'])
-        runner.add_action(change_character_action)
-    
-    if 'close_game' in config['actions']:
-        close_game_action = CloseGameAction(screen, config['actions']['close_game'])
-        runner.add_action(close_game_action)
-    
-    if 'start_game' in config['actions']:
-        start_game_action = StartGameAction(screen, config['actions']['start_game'])
-        runner.add_action(start_game_action)
+    # Create and add the enabled actions, importing only their modules
+    actions = get_action_registry()
+    for spec in actions.specs():
+        action_settings = config.actions.get(spec.key)
+        if action_settings is not None and action_settings.enabled:
+            runner.add_action(actions.create(spec.key, screen, action_settings))
     
     return screen, runner
 
@@ -219,6 +147,10 @@ def main():
         logger.critical(f"Error loading configuration: {e}")
         return 1
     
+    # Seed the session before anything takes a random stream, the seed is logged
+    from gravrokbot.core.rng import seed_session
+    seed_session(config.section('runner').get('random_seed'))
+    
     # High DPI support
     try:
         # Try newer PyQt6 approach
@@ -237,6 +169,11 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("GravRokBot")
     
+    # Create and show the main window before the vision stack is loaded
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    
     # Initialize bot
     try:
         screen, runner = initialize_bot(config)
@@ -245,15 +182,9 @@ def main():
         logger.critical(f"Error initializing bot: {e}")
         return 1
     
-    # Create main window
-    window = MainWindow()
-    
     # Connect UI to bot
     connect_ui_to_bot(window, screen, runner)
     
-    # Show window
-    window.show()
-    
     # Run application
     return app.exec()
 
@@ -5,40 +5,44 @@ Entry point for the GravRokBot UI
 
 import os
 import sys
+import argparse
 import logging
-import colorlog
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 def setup_logging():
-    """Configure logging with colors"""
-    handler = colorlog.StreamHandler()
-    handler.setFormatter(colorlog.ColoredFormatter(
-        '%(log_color)s%(asctime)s [%(levelname)s] %(message)s',
-        datefmt='%H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    ))
+    """Configure console and rotating file logging on a background thread"""
+    from gravrokbot.utils.log_pipeline import setup_logging as start_log_pipeline
+    start_log_pipeline(level=logging.DEBUG, console_level=logging.INFO)
+    return logging.getLogger('gravrokbot')
 
-    logger = logging.getLogger('gravrokbot')
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
-    return logger
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="GravRokBot UI")
+    parser.add_argument(
+        "--profile-loops",
+        type=int,
+        default=0,
+        help="profile this many runner loops after the bot starts and write the profile to logs/"
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=["sampling", "cprofile"],
+        default=None,
+        help="statistical stack sampling or cProfile (default from settings)"
+    )
+    return parser.parse_args()
 
 def main():
     """Main entry point"""
+    args = parse_args()
     logger = setup_logging()
     logger.info("Starting GravRokBot UI...")
     
     try:
         from gravrokbot.ui.main_window import MainWindow
-        app = MainWindow()
+        app = MainWindow(profile_loops=args.profile_loops, profile_mode=args.profile_mode)
         app.run()
     except Exception as e:
         logger.error(f"Failed to start UI: {str(e)}")
@@ -0,0 +1,298 @@
+"""
+Recorded-session replay for GravRokBot.
+Runs the real actions against recorded screenshot sequences with input
+stubbed out and delays zeroed, and reports wall time, capture and match
+counts and whether each action ended as recorded.
+
+A session is a directory with a session.json file:
+
+    {
+        "action": "gather_resources",
+        "frames": ["000.png", "001.png", "002.png", "003.png"],
+        "images": {"resource_icon": "templates/resource_icon.png"},
+        "expect": {"succeeded": true, "clicks": 3}
+    }
+
+Frames advance after every click, key press or typed text, the way the
+game screen changes in response to input. "images" and "config" are
+optional overrides of the action settings, image paths are relative to
+the session directory.
+
+Usage:
+    python -m gravrokbot.testing.replay SESSION_DIR [SESSION_DIR ...] [--repeat N] [--output report.json]
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import statistics
+from PIL import Image
+
+from gravrokbot.core.screen_interaction import ScreenInteraction
+from gravrokbot.core.template_matcher import TemplateMatcher
+from gravrokbot.core.tracing import get_tracer
+from gravrokbot.core.rng import seed_session
+from gravrokbot.core.action_registry import get_action_registry
+
+DEFAULT_SETTINGS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config", "default_settings.json"
+)
+
+class ReplayScreenInteraction(ScreenInteraction):
+    """Screen interaction that captures from recorded frames and records input instead of sending it"""
+
+    def __init__(self, config, frames):
+        """
+        Initialize replay screen interaction
+
+        Args:
+            config (dict): Screen settings
+            frames (list): Recorded frames as PIL images, in order
+        """
+        if not frames:
+            raise ValueError("A replay needs at least one frame")
+
+        self.frames = frames
+        self.frame_index = 0
+        self.inputs = []
+        super().__init__(config)
+        self.logger = logging.getLogger("GravRokBot.Replay")
+
+    def _setup_input(self):
+        """Take the screen size from the frames, input is recorded instead of sent"""
+        self.mouse_motion = None
+        return self.frames[0].size
+
+    def _create_vision_pool(self):
+        """Match in-process, TemplateMatcher has the find/find_all interface of the vision pool"""
+        return TemplateMatcher()
+
+    def _advance(self):
+        """Move to the next recorded frame, staying on the last one"""
+        self.frame_index = min(self.frame_index + 1, len(self.frames) - 1)
+
+    def take_screenshot(self, region=None):
+        """
+        Get the current recorded frame
+
+        Args:
+            region (tuple, optional): Region to capture (left, top, width, height)
+
+        Returns:
+            PIL.Image: Recorded frame, cropped to the region
+        """
+        with self.tracer.span('capture'):
+            frame = self.frames[self.frame_index]
+            if region:
+                left, top, width, height = region
+                frame = frame.crop((left, top, left + width, top + height))
+            return frame
+
+    def humanized_click(self, x, y, button='left', randomize=True, randomize_range=10):
+        """Record a click at the exact target and advance the frame"""
+        self.inputs.append(('click', (int(x), int(y)), button))
+        self._advance()
+
+    def humanized_type(self, text, interval=None):
+        """Record typed text and advance the frame"""
+        self.inputs.append(('type', text, None))
+        self._advance()
+
+    def press_key(self, key):
+        """Record a key press and advance the frame"""
+        self.inputs.append(('key', key, None))
+        self._advance()
+
+    def humanized_wait(self, min_seconds, max_seconds):
+        """Skip the wait, delays are zeroed during replay"""
+        return 0.0
+
+    def clicks(self):
+        """
+        Get the recorded clicks
+
+        Returns:
+            list: (x, y) click positions in order
+        """
+        return [target for kind, target, _ in self.inputs if kind == 'click']
+
+def load_session(session_dir):
+    """
+    Load a recorded session
+
+    Args:
+        session_dir (str): Directory containing session.json and the frames
+
+    Returns:
+        dict: Session settings with decoded 'frame_images'
+    """
+    with open(os.path.join(session_dir, "session.json"), 'r') as f:
+        session = json.load(f)
+
+    session['name'] = session.get('name', os.path.basename(os.path.normpath(session_dir)))
+    session['dir'] = session_dir
+    session['frame_images'] = [
+        Image.open(os.path.join(session_dir, frame)).convert('RGB') for frame in session['frames']
+    ]
+    return session
+
+def build_action(session, settings):
+    """
+    Create the action of a session with its settings overrides applied
+
+    Args:
+        session (dict): Loaded session
+        settings (dict): Bot settings with 'screen' and 'actions'
+
+    Returns:
+        tuple: (ActionWorkflow, ReplayScreenInteraction)
+    """
+    action_key = session['action']
+    actions = get_action_registry()
+    if action_key not in actions:
+        raise ValueError(f"Unknown action in session {session['name']}: {action_key}")
+
+    config = json.loads(json.dumps(settings['actions'].get(action_key, {})))
+    config.update(session.get('config', {}))
+    images = config.setdefault('images', {})
+    for key, path in session.get('images', {}).items():
+        images[key] = os.path.abspath(os.path.join(session['dir'], path))
+
+    screen = ReplayScreenInteraction(settings['screen'], session['frame_images'])
+    return actions.create(action_key, screen, config), screen
+
+def replay_session(session, settings, repeat=1):
+    """
+    Replay a session and measure it
+
+    Args:
+        session (dict): Loaded session
+        settings (dict): Bot settings
+        repeat (int): Number of runs, wall times are reported as median and max
+
+    Returns:
+        dict: Report with timings, counts and correctness
+    """
+    tracer = get_tracer()
+    tracer.enabled = True
+    wall_times = []
+    error = None
+
+    for _ in range(repeat):
+        action, screen = build_action(session, settings)
+        tracer.clear()
+
+        started = time.perf_counter()
+        try:
+            action.execute(ignore_cooldown=True)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        wall_times.append((time.perf_counter() - started) * 1000)
+
+    categories = [step[1] for step in tracer.steps]
+    summary = tracer.summary().get(action.name, {})
+    succeeded = error is None and bool(action.succeeded)
+
+    report = {
+        'session': session['name'],
+        'action': action.name,
+        'runs': repeat,
+        'wall_ms_median': statistics.median(wall_times),
+        'wall_ms_max': max(wall_times),
+        'captures': categories.count('capture'),
+        'matches': categories.count('match'),
+        'capture_ms': summary.get('capture_ms', 0.0),
+        'match_ms': summary.get('match_ms', 0.0),
+        'ocr_ms': summary.get('ocr_ms', 0.0),
+        'clicks': screen.clicks(),
+        'frames_used': screen.frame_index + 1,
+        'frames_total': len(session['frame_images']),
+        'succeeded': succeeded,
+        'error': error
+    }
+
+    expect = session.get('expect', {})
+    correct = error is None
+    if 'succeeded' in expect:
+        correct = correct and succeeded == expect['succeeded']
+    if 'clicks' in expect:
+        expected_clicks = expect['clicks']
+        if isinstance(expected_clicks, int):
+            correct = correct and len(report['clicks']) == expected_clicks
+        else:
+            tolerance = expect.get('click_tolerance', 5)
+            correct = correct and len(report['clicks']) == len(expected_clicks) and all(
+                abs(x - ex) <= tolerance and abs(y - ey) <= tolerance
+                for (x, y), (ex, ey) in zip(report['clicks'], expected_clicks)
+            )
+    report['correct'] = correct
+    return report
+
+def load_settings():
+    """
+    Load the default bot settings
+
+    Returns:
+        dict: Settings dictionary
+    """
+    with open(DEFAULT_SETTINGS_PATH, 'r') as f:
+        return json.load(f)
+
+def find_sessions(paths):
+    """
+    Find session directories
+
+    Args:
+        paths (list): Session directories or directories containing sessions
+
+    Returns:
+        list: Session directories in sorted order
+    """
+    sessions = []
+    for path in paths:
+        if os.path.exists(os.path.join(path, "session.json")):
+            sessions.append(path)
+            continue
+        for name in sorted(os.listdir(path)):
+            if os.path.exists(os.path.join(path, name, "session.json")):
+                sessions.append(os.path.join(path, name))
+    return sessions
+
+def main(argv=None):
+    """Replay sessions from the command line and print the report"""
+    parser = argparse.ArgumentParser(description="Replay recorded GravRokBot sessions")
+    parser.add_argument("paths", nargs='+', help="session directories or directories of sessions")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per session")
+    parser.add_argument("--output", help="write the report as JSON to this file")
+    parser.add_argument("--seed", type=int, default=0, help="random seed, fixed so runs are comparable")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    seed_session(args.seed)
+    settings = load_settings()
+    reports = [
+        replay_session(load_session(session_dir), settings, args.repeat)
+        for session_dir in find_sessions(args.paths)
+    ]
+
+    for report in reports:
+        status = "OK  " if report['correct'] else "FAIL"
+        print(
+            f"{status} {report['session']:<30} {report['action']:<24} "
+            f"{report['wall_ms_median']:8.1f} ms  captures={report['captures']:<3} "
+            f"matches={report['matches']:<3} match={report['match_ms']:.1f} ms"
+        )
+        if report['error']:
+            print(f"     {report['error']}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=4)
+
+    return 0 if all(report['correct'] for report in reports) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
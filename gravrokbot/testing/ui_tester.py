@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QProgressBar, QComboBox)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread
 from pathlib import Path
+from gravrokbot.core.action_registry import get_action_registry
 
 class ActionWorkerThread(QThread):
     """Worker thread to run actions without blocking UI"""
@@ -54,13 +55,7 @@ class UITester(QMainWindow):
         
         # Action selector
         self.action_combo = QComboBox()
-        self.action_combo.addItems([
-            "Gather Resources",
-            "Collect City Resources",
-            "Change Character",
-            "Close Game",
-            "Start Game"
-        ])
+        self.action_combo.addItems([spec.name for spec in get_action_registry().specs()])
         left_layout.addWidget(QLabel("Select Action:"))
         left_layout.addWidget(self.action_combo)
         
@@ -126,24 +121,12 @@ class UITester(QMainWindow):
         
         try:
             # Create appropriate action instance
-            if action_name == "Gather Resources":
-                from gravrokbot.actions.gather_resources import GatherResourcesAction
-                action = GatherResourcesAction(self.screen_interaction, self.config['actions']['gather_resources'])
-            elif action_name == "Collect City Resources":
-                from gravrokbot.actions.collect_city_resources import CollectCityResourcesAction
-                action = CollectCityResourcesAction(self.screen_interaction, self.config['actions']['collect_city_resources'])
-            elif action_name == "Change Character":
-                from gravrokbot.actions.change_character import ChangeCharacterAction
-                action = ChangeCharacterAction(self.screen_interaction, self.config['actions']['change_character'])
-            elif action_name == "Close Game":
-                from gravrokbot.actions.close_game import CloseGameAction
-                action = CloseGameAction(self.screen_interaction, self.config['actions']['close_game'])
-            elif action_name == "Start Game":
-                from gravrokbot.actions.start_game import StartGameAction
-                action = StartGameAction(self.screen_interaction, self.config['actions']['start_game'])
-            else:
+            actions = get_action_registry()
+            action_key = actions.key_for_name(action_name)
+            if action_key is None:
                 self.log_display.append(f"Error: Unknown action {action_name}")
                 return
+            action = actions.create(action_key, self.screen_interaction, self.config['actions'][action_key])
             
             if action:
                 # Create and start worker thread
@@ -2,6 +2,8 @@
 GravRokBot UI package
 """
 
-from .main_window import MainWindow
+from gravrokbot.utils.lazy_import import lazy_exports
+
+__getattr__ = lazy_exports(__name__, {'MainWindow': '.main_window'})
 
 __all__ = ['MainWindow']
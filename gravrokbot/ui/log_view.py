@@ -0,0 +1,86 @@
+"""
+Bounded activity log for GravRokBot.
+Keeps the most recent log lines in a ring buffer and trims the Text widget
+in bulk, so memory and the cost per line stay flat however long the bot runs.
+"""
+
+from collections import deque
+
+# Log kinds and the Text tag and color they are shown with, None for the default color
+LOG_KINDS = {
+    'info': None,
+    'loop': ('light_green', '#90EE90'),
+    'error': ('error_red', '#FF6666'),
+}
+
+# Tag per kind, looked up once per line
+KIND_TAGS = {kind: style[0] if style else () for kind, style in LOG_KINDS.items()}
+
+class LogView:
+    """Ring-buffered log model shown in a Tk Text widget"""
+
+    def __init__(self, text, max_lines=5000, trim_lines=500):
+        """
+        Initialize the log view
+
+        Args:
+            text (tkinter.Text): Widget the log is shown in
+            max_lines (int): Number of lines kept
+            trim_lines (int): Lines the widget may grow past max_lines before
+                the oldest are deleted in one operation
+        """
+        self.text = text
+        self.max_lines = max_lines
+        self.trim_lines = trim_lines
+        self.entries = deque(maxlen=max_lines)
+        self.shown_lines = 0
+
+        for style in LOG_KINDS.values():
+            if style:
+                self.text.tag_configure(style[0], foreground=style[1])
+
+    def append(self, entries):
+        """
+        Add log lines in one widget operation
+
+        Args:
+            entries (list): (datetime, message, kind) tuples, kind being a key of LOG_KINDS
+        """
+        if not entries:
+            return
+
+        # Text.insert takes alternating text and tag arguments
+        chunks = []
+        for logged_at, message, kind in entries:
+            line = f"{logged_at.strftime('[%H:%M:%S]')} {message}\n"
+            chunks.append(line)
+            chunks.append(KIND_TAGS.get(kind, ()))
+            self.entries.append(line)
+            self.shown_lines += line.count('\n')
+
+        # Only follow new lines while the view is scrolled to the end
+        follow = self.text.yview()[1] >= 1.0
+        self.text.insert('end', *chunks)
+
+        if self.shown_lines > self.max_lines + self.trim_lines:
+            excess = self.shown_lines - self.max_lines
+            self.text.delete('1.0', f"{excess + 1}.0")
+            self.shown_lines -= excess
+
+        if follow:
+            self.text.see('end')
+
+    def lines(self):
+        """
+        Get the kept log lines
+
+        Returns:
+            list: Formatted lines, oldest first
+        """
+        return list(self.entries)
+
+    def clear(self):
+        """Remove all log lines"""
+        self.entries.clear()
+        self.shown_lines = 0
+        self.text.delete('1.0', 'end')
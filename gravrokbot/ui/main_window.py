@@ -11,15 +11,48 @@ import os
 import logging
 import json
 from gravrokbot.core.runner_factory import create_runner
+from gravrokbot.core.state_store import JsonStateStore
+from gravrokbot.core.sqlite_store import SQLiteStateStore
+from gravrokbot.core.cooldown_index import CooldownIndex
+from gravrokbot.core.character_planner import CharacterPlanner
+from gravrokbot.core.clock import get_clock
+from gravrokbot.core.action_registry import get_action_registry
+from gravrokbot.core.config_snapshot import ConfigError, ConfigWatcher, compile_settings, load_settings
+from gravrokbot.ui.ui_event_bus import UIEventBus
+from gravrokbot.ui.log_view import LogView
+from gravrokbot.utils.lazy_import import preload
+
+# Modules imported in the background once the window is shown, so starting
+# the bot does not wait for the vision stack
+PRELOAD_MODULES = (
+    "numpy",
+    "cv2",
+    "PIL.Image",
+    "pytesseract",
+    "gravrokbot.core.screen_interaction",
+)
+PRELOAD_DELAY_MS = 500
 
 class MainWindow:
-    def __init__(self):
+    def __init__(self, profile_loops=0, profile_mode=None):
+        """
+        Initialize the main window
+        
+        Args:
+            profile_loops (int): Number of runner loops to profile once the bot starts, 0 for none
+            profile_mode (str, optional): 'sampling' or 'cprofile', from settings if None
+        """
+        # Profiling requested on the command line
+        self.profile_loops = profile_loops
+        self.profile_mode = profile_mode
+        
         # Define status types and their styles
         self.ACTION_STATUSES = {
             "N/A": "secondary-inverse",  # Gray background
             "Waiting": "warning-inverse",  # Orange background
             "Working": "info-inverse",    # Blue background
-            "Done": "success-inverse"     # Green background
+            "Done": "success-inverse",    # Green background
+            "Failed": "danger-inverse"    # Red background
         }
         
         self.root = ttk.Window(
@@ -37,8 +70,12 @@ class MainWindow:
         self.current_character = None
         
         # Load default settings
+        self.config_snapshot = None
         self.load_default_settings()
         
+        # Open state database if configured
+        self.open_state_database()
+        
         # Load character settings
         self.load_character_settings()
         
@@ -67,6 +104,14 @@ class MainWindow:
         # Track selected action
         self.selected_action = None
         
+        # Runner threads publish UI updates here, the Tk loop applies them
+        self.ui_bus = UIEventBus(self)
+        self.ui_bus.start()
+        
+        # Reload the settings when the files are edited
+        self.config_watcher = ConfigWatcher(on_change=self.ui_bus.apply_config_snapshot, snapshot=self.config_snapshot)
+        self.config_watcher.start()
+        
         # Register cleanup handler
         self.root.protocol("WM_DELETE_WINDOW", self.cleanup_and_exit)
         
@@ -77,28 +122,8 @@ class MainWindow:
     def load_default_settings(self):
         """Load settings from file, falling back to defaults if needed"""
         try:
-            # First load default settings
-            default_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "default_settings.json")
-            with open(default_path, 'r') as f:
-                self.settings = json.load(f)
-                
-            # Then try to load and merge user settings
-            settings_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "settings.json")
-            if os.path.exists(settings_path):
-                with open(settings_path, 'r') as f:
-                    user_settings = json.load(f)
-                    
-                # Recursive merge function
-                def merge_dicts(base, override):
-                    for key, value in override.items():
-                        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                            merge_dicts(base[key], value)
-                        else:
-                            base[key] = value
-                            
-                # Merge user settings into default settings
-                merge_dicts(self.settings, user_settings)
-                    
+            # Default settings merged with the user settings
+            self.settings = load_settings()
         except Exception as e:
             self.logger.error(f"Error loading settings: {e}")
             # Fallback to hardcoded defaults if both files fail
@@ -120,15 +145,72 @@ class MainWindow:
                     }
                 }
             }
+
+        self.compile_settings()
+        
+    def compile_settings(self):
+        """Validate the settings and compile the snapshot actions are created from"""
+        try:
+            version = self.config_snapshot.version + 1 if self.config_snapshot else 0
+            self.config_snapshot = compile_settings(self.settings, version)
+        except ConfigError as e:
+            if self.config_snapshot is None:
+                # Nothing to keep at startup: run on the default settings
+                self.logger.error(f"Invalid settings, using the defaults: {e}")
+                self.settings = load_settings(user_path=None)
+                self.config_snapshot = compile_settings(self.settings)
+            else:
+                self.logger.error(f"Invalid settings, keeping the previous ones: {e}")
+                
+    def apply_config_snapshot(self, snapshot):
+        """
+        Take over settings reloaded from the settings files
+        
+        Args:
+            snapshot (ConfigSnapshot): Validated snapshot of the changed files
+        """
+        self.settings = snapshot.to_dict()
+        self.config_snapshot = snapshot
+        # Character cooldowns override the file settings
+        self.apply_character_settings()
+        self.add_log("Settings reloaded from file, applied from the next loop")
+        
+    def open_state_database(self):
+        """Open the SQLite state database when it is the configured storage backend"""
+        self.state_db = None
+        storage = self.settings.get("storage", {})
+        if storage.get("backend") != "sqlite":
+            return
+            
+        config_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config")
+        db_path = storage.get("sqlite_path", "state.db")
+        if not os.path.isabs(db_path):
+            db_path = os.path.join(config_dir, db_path)
+            
+        try:
+            self.state_db = SQLiteStateStore(db_path)
+            # Imports the existing JSON state on the first run with the database only
+            self.state_db.migrate_from_json(
+                os.path.join(config_dir, "character_settings.json"),
+                os.path.join(config_dir, "cooldown_states.json")
+            )
+        except Exception as e:
+            self.logger.error(f"Error opening state database: {e}")
+            self.state_db = None
         
     def load_character_settings(self):
         """Load character-specific settings"""
         try:
             path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "character_settings.json")
-            if os.path.exists(path):
+            if self.state_db and not self.state_db.is_empty():
+                self.character_settings = self.state_db.export_character_settings()
+            elif os.path.exists(path):
                 with open(path, 'r') as f:
                     self.character_settings = json.load(f)
-                    
+            else:
+                self.character_settings = None
+                
+            if self.character_settings is not None:
                 # Validate current character
                 self.current_character = self.character_settings.get("current_character")
                 if self.current_character not in self.character_settings.get("characters", {}):
@@ -173,6 +255,13 @@ class MainWindow:
 
     def save_character_settings(self):
         """Save character-specific settings"""
+        if self.state_db:
+            try:
+                self.state_db.save_character_settings(self.character_settings)
+            except Exception as e:
+                self.logger.error(f"Error saving character settings: {e}")
+            return
+            
         try:
             path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "character_settings.json")
             with open(path, 'w') as f:
@@ -204,6 +293,8 @@ class MainWindow:
                 if action_key in self.settings["actions"]:
                     self.settings["actions"][action_key]["cooldown_minutes"] = action_settings["cooldown_minutes"]
                     
+        self.compile_settings()
+                    
         # Update character name in UI if it exists
         if hasattr(self, 'character_name'):
             self.character_name.configure(text=self.current_character)
@@ -225,11 +316,17 @@ class MainWindow:
 
     def load_cooldown_states(self):
         """Load cooldown states from JSON file"""
+        config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "cooldown_states.json")
+        # Cooldown changes are written in batches on the Tk thread
+        self.cooldown_store = JsonStateStore(
+            config_path,
+            scheduler=lambda delay, callback: self.root.after(int(delay * 1000), callback)
+        )
         try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "cooldown_states.json")
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    self.cooldown_states = json.load(f)
+            if self.state_db:
+                self.cooldown_states = self.state_db.export_cooldown_states()
+            elif os.path.exists(config_path):
+                self.cooldown_states = self.cooldown_store.load()
             else:
                 self.cooldown_states = {}
                 # Initialize cooldown states for first character
@@ -238,6 +335,17 @@ class MainWindow:
         except Exception as e:
             self.logger.error(f"Error loading cooldown states: {e}")
             self.cooldown_states = {}
+            
+        self.build_cooldown_index()
+
+    def build_cooldown_index(self):
+        """Index active cooldowns by monotonic deadline, parsing stored times once"""
+        clock = get_clock()
+        self.cooldown_index = CooldownIndex(clock=clock.monotonic, wall_clock=clock.now)
+        for character, actions in self.cooldown_states.items():
+            for action_key, state in actions.items():
+                if isinstance(state, dict) and state.get("is_active") and state.get("end_time"):
+                    self.cooldown_index.set_wall_deadline(character, action_key, state["end_time"])
 
     def initialize_cooldown_states(self, character_name):
         """Initialize cooldown states for a character"""
@@ -257,32 +365,32 @@ class MainWindow:
             }
 
     def save_cooldown_states(self):
-        """Save cooldown states to JSON file"""
-        try:
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "cooldown_states.json")
-            with open(config_path, 'w') as f:
-                json.dump(self.cooldown_states, f, indent=4)
-        except Exception as e:
-            self.logger.error(f"Error saving cooldown states: {e}")
+        """Schedule a write of cooldown states to JSON file"""
+        # The state database is updated row by row as cooldowns change
+        if self.state_db:
+            return
+        self.cooldown_store.save(self.cooldown_states)
         
     def update_cooldowns(self):
         """Update cooldown timers and UI"""
         if not self.current_character:
             return
             
-        current_time = datetime.now()
-        updated = False
+        expired = self.cooldown_index.pop_expired(self.current_character)
         
         char_cooldowns = self.cooldown_states.get(self.current_character, {})
-        for action_key, state in char_cooldowns.items():
-            if state["is_active"] and state["end_time"]:
-                end_time = datetime.fromisoformat(state["end_time"])
-                if current_time >= end_time:
-                    state["is_active"] = False
-                    state["start_time"] = None
-                    state["end_time"] = None
-                    self.save_cooldown_states()
-                    updated = True
+        for action_key in expired:
+            state = char_cooldowns.get(action_key)
+            if state:
+                state["is_active"] = False
+                state["start_time"] = None
+                state["end_time"] = None
+            if self.state_db:
+                self.state_db.clear_cooldown(self.current_character, action_key)
+        
+        # Persist all expired cooldowns with a single write
+        if expired:
+            self.save_cooldown_states()
         
         # Update UI if config tab is showing cooldowns
         if self.selected_action:
@@ -324,13 +432,26 @@ class MainWindow:
             else:
                 reset_button.pack_forget()
                 
-    def start_cooldown(self, action_key):
-        """Start cooldown for an action"""
+    def start_cooldown(self, action_key, cooldown_minutes=None):
+        """
+        Start cooldown for an action
+        
+        Args:
+            action_key (str): Config key of the action
+            cooldown_minutes (float, optional): Cooldown used when the settings have
+                no entry for the action, e.g. a plugin action
+        """
         if not self.current_character:
             return
             
-        current_time = datetime.now()
-        cooldown_minutes = self.settings["actions"][action_key]["cooldown_minutes"]
+        action_settings = self.settings["actions"].get(action_key)
+        if action_settings is not None:
+            cooldown_minutes = action_settings["cooldown_minutes"]
+        elif cooldown_minutes is None:
+            self.logger.warning(f"No cooldown configured for action '{action_key}'")
+            return
+            
+        current_time = get_clock().now()
         end_time = current_time + timedelta(minutes=cooldown_minutes)
         
         if self.current_character not in self.cooldown_states:
@@ -341,6 +462,11 @@ class MainWindow:
             "start_time": current_time.isoformat(),
             "end_time": end_time.isoformat()
         }
+        self.cooldown_index.start(self.current_character, action_key, cooldown_minutes * 60)
+        if self.state_db:
+            self.state_db.start_cooldown(
+                self.current_character, action_key, cooldown_minutes * 60, now=current_time.timestamp()
+            )
         self.save_cooldown_states()
         
     def reset_cooldown(self, action_key):
@@ -356,28 +482,85 @@ class MainWindow:
             "start_time": None,
             "end_time": None
         }
+        self.cooldown_index.clear(self.current_character, action_key)
+        if self.state_db:
+            self.state_db.clear_cooldown(self.current_character, action_key)
         self.save_cooldown_states()
         self.update_config_tab()
         
+    def plan_character_switch(self, characters=None):
+        """
+        Pick the character with the most due work to switch to
+        
+        Args:
+            characters (list, optional): Characters a switch can select, all if None
+            
+        Returns:
+            dict: Batch with 'character', 'actions' and 'overdue_seconds', None if
+                the current character still has due actions or no switch is worth it
+        """
+        switch_settings = self.settings["runner"].get("character_switch", {})
+        planner = CharacterPlanner(
+            self.cooldown_index,
+            lookahead_seconds=switch_settings.get("lookahead_seconds", 0),
+            min_batch_size=switch_settings.get("min_batch_size", 1),
+            max_wait_seconds=switch_settings.get("max_wait_seconds")
+        )
+        
+        # Switching itself is not work that a switch should be planned for
+        actions_by_character = {
+            name: [
+                action_key for action_key, action_settings in settings.get("actions", {}).items()
+                if action_settings.get("enabled") and action_key != "change_character"
+            ]
+            for name, settings in self.character_settings.get("characters", {}).items()
+            if characters is None or name in characters or name == self.current_character
+        }
+        return planner.next_switch(actions_by_character, self.current_character)
+        
+    def record_execution(self, action_key, started_at, finished_at, succeeded):
+        """
+        Record an action run in the execution history
+        
+        Args:
+            action_key (str): Config key of the action
+            started_at (float): Start time as a Unix timestamp
+            finished_at (float): Finish time as a Unix timestamp
+            succeeded (bool): Whether the action succeeded
+        """
+        if not self.state_db or not self.current_character:
+            return
+            
+        try:
+            self.state_db.record_execution(self.current_character, action_key, started_at, finished_at, succeeded)
+        except Exception as e:
+            self.logger.error(f"Error recording execution of {action_key}: {e}")
+        
+    def is_action_ready(self, action_key):
+        """
+        Check whether an action is off cooldown for the current character
+        
+        Args:
+            action_key (str): Config key of the action
+            
+        Returns:
+            bool: True if the action is not on cooldown
+        """
+        if not self.current_character:
+            return True
+        return self.cooldown_index.is_ready(self.current_character, action_key)
+        
     def get_cooldown_remaining(self, action_key):
         """Get remaining cooldown time in minutes and seconds"""
         if not self.current_character:
             return 0, 0
             
-        char_cooldowns = self.cooldown_states.get(self.current_character, {})
-        state = char_cooldowns.get(action_key)
-        
-        if not state or not state["is_active"] or not state["end_time"]:
-            return 0, 0
-            
-        end_time = datetime.fromisoformat(state["end_time"])
-        remaining = end_time - datetime.now()
-        
-        if remaining.total_seconds() <= 0:
+        remaining = self.cooldown_index.remaining(self.current_character, action_key)
+        if remaining <= 0:
             return 0, 0
             
-        minutes = int(remaining.total_seconds() // 60)
-        seconds = int(remaining.total_seconds() % 60)
+        minutes = int(remaining // 60)
+        seconds = int(remaining % 60)
         return minutes, seconds
         
     def create_header(self):
@@ -494,14 +677,8 @@ class MainWindow:
         self.action_buttons = {}  # Store action buttons
         self.action_status_labels = {}  # Store status labels
         
-        actions = [
-            "Gather Resources",
-            "Collect City Resources",
-            "Material Production",
-            "Open Mails",
-            "Claim Daily VIP Gifts",
-            "Change Character"
-        ]
+        # Schedulable actions from the registry, built-in and plugins
+        actions = [spec.name for spec in get_action_registry().specs(activities_only=True)]
         
         for action in actions:
             action_frame = ttk.Frame(activities_frame)
@@ -606,6 +783,7 @@ class MainWindow:
             font=('Consolas', 14)
         )
         self.log_text.pack(fill=BOTH, expand=True)
+        self.log_view = LogView(self.log_text, max_lines=self.settings.get("ui", {}).get("log_max_lines", 5000))
         
         # Config tab
         self.config_frame = ttk.Frame(self.right_tabs)
@@ -778,6 +956,31 @@ class MainWindow:
         self.char_switch_max.insert(0, str(self.settings["runner"]["character_switch"]["max_seconds"]))
         self.char_switch_max.pack(side=LEFT, padx=5)
         
+        # Profiling Frame
+        profile_frame = ttk.LabelFrame(misc_frame, text="Profiling", padding=10)
+        profile_frame.pack(fill=X, padx=5, pady=5)
+        
+        # Runtime toggle, profiles the next loops of the running bot
+        self.profiling_var = tk.BooleanVar(value=self.profile_loops > 0)
+        ttk.Checkbutton(
+            profile_frame,
+            text="Profile Next Loops",
+            variable=self.profiling_var,
+            command=self.toggle_profiling,
+            bootstyle="round-toggle"
+        ).pack(fill=X, pady=2)
+        
+        loops_frame = ttk.Frame(profile_frame)
+        loops_frame.pack(fill=X, pady=2)
+        ttk.Label(loops_frame, text="Loops to profile:").pack(side=LEFT)
+        self.profile_loops_entry = ttk.Entry(
+            loops_frame,
+            width=10
+        )
+        default_loops = self.settings["runner"].get("profiling", {}).get("loops", 3)
+        self.profile_loops_entry.insert(0, str(self.profile_loops or default_loops))
+        self.profile_loops_entry.pack(side=LEFT, padx=5)
+        
         # Test Mode Settings Frame
         test_frame = ttk.LabelFrame(misc_frame, text="Test Mode", padding=10)
         test_frame.pack(fill=X, padx=5, pady=5)
@@ -836,61 +1039,24 @@ class MainWindow:
         )
         self.status_label.pack(side=LEFT)
         
-    def add_log(self, message):
-        """Add a message to the log with timestamp"""
-        timestamp = datetime.now().strftime('[%H:%M:%S]')
-        
-        # Define messages that should be displayed in light green
-        green_prefixes = [
-            "Start loop number",
-            "Refresh action list",
-            "Reset actions status to Waiting",
-            "Start Actions Execution",
-            "Completed loop number",
-            "Next loop will start in"
-        ]
+    def add_log(self, message, kind='info'):
+        """
+        Add a message to the log with timestamp
         
-        # Define error messages that should be displayed in red
-        error_keywords = [
-            "Error",
-            "Failed",
-            "Exception",
-            "Timeout"
-        ]
+        Args:
+            message (str): Log message
+            kind (str): 'info', 'loop' or 'error', selects the color
+        """
+        self.add_logs([(datetime.now(), message, kind)])
+    
+    def add_logs(self, entries):
+        """
+        Add log messages in one widget operation
         
-        # Check if message should be displayed in light green
-        use_green = False
-        for prefix in green_prefixes:
-            if message.startswith(prefix):
-                use_green = True
-                break
-        
-        # Check if message should be displayed in red (error)
-        use_red = False
-        for keyword in error_keywords:
-            if keyword.lower() in message.lower():
-                use_red = True
-                use_green = False  # Error takes precedence over green
-                break
-        
-        # Configure tags if they don't exist
-        if not self.log_text.tag_names() or "light_green" not in self.log_text.tag_names():
-            self.log_text.tag_configure("light_green", foreground="#90EE90")  # Light green color
-            
-        if not self.log_text.tag_names() or "error_red" not in self.log_text.tag_names():
-            self.log_text.tag_configure("error_red", foreground="#FF6666")  # Light red color
-            
-        # Insert with appropriate color tag
-        if use_red:
-            self.log_text.insert('end', f"{timestamp} {message}\n", "error_red")
-        elif use_green:
-            self.log_text.insert('end', f"{timestamp} {message}\n", "light_green")
-        else:
-            # Insert with default color
-            self.log_text.insert('end', f"{timestamp} {message}\n")
-            
-        # Auto-scroll to the end
-        self.log_text.see('end')
+        Args:
+            entries (list): (datetime, message, kind) tuples
+        """
+        self.log_view.append(entries)
         
     def start_bot(self):
         """Start the bot"""
@@ -917,7 +1083,8 @@ class MainWindow:
             else:
                 self.update_action_status(action, "N/A")
         
-        # Start the runner
+        # Start the runner as the current character
+        self.runner.current_character = self.current_character
         self.runner.start()
     
     def toggle_pause(self):
@@ -960,9 +1127,14 @@ class MainWindow:
     
     def initialize_runner(self):
         """Initialize the appropriate runner based on settings"""
+        # Seed the session before anything takes a random stream
+        from gravrokbot.core.rng import seed_session
+        seed = seed_session(self.settings["runner"].get("random_seed")).seed
+        self.add_log(f"Random seed: {seed}")
+        
         # Create the appropriate runner
         from gravrokbot.core.runner_factory import create_runner
-        self.runner = create_runner(self, self.settings["runner"])
+        self.runner = create_runner(self.ui_bus, self.settings["runner"])
         
         # Create screen interaction for production mode
         from gravrokbot.core.screen_interaction import ScreenInteraction
@@ -971,9 +1143,30 @@ class MainWindow:
         # Add actions based on UI settings
         self.refresh_runner_actions()
         
+        # Start profiling requested on the command line or in the UI
+        if self.profiling_var.get():
+            self.toggle_profiling()
+        
         self.logger.info("Runner initialized with enabled actions")
         self.add_log("Runner initialized")
         
+    def toggle_profiling(self):
+        """Switch loop profiling of the runner on or off"""
+        if not self.runner or not hasattr(self.runner, 'enable_profiling'):
+            # Applied when the runner is created
+            return
+            
+        if self.profiling_var.get():
+            try:
+                loops = int(self.profile_loops_entry.get())
+            except ValueError:
+                loops = None
+            self.runner.enable_profiling(loops, self.profile_mode)
+            self.add_log(f"Profiling the next {self.runner.profiler.loops} loops")
+        else:
+            self.runner.disable_profiling()
+            self.add_log("Profiling stopped")
+    
     def refresh_runner_actions(self):
         """
         Refresh actions based on currently enabled UI checkboxes.
@@ -991,38 +1184,16 @@ class MainWindow:
         from gravrokbot.core.screen_interaction import ScreenInteraction
         screen = ScreenInteraction(self.settings['screen'])
         
-        # Import action classes here to avoid circular imports
-        from gravrokbot.actions.gather_resources import GatherResourcesAction
-        from gravrokbot.actions.collect_city_resources import CollectCityResourcesAction
-        from gravrokbot.actions.material_production import MaterialProductionAction
-        from gravrokbot.actions.open_mails import OpenMailsAction
-        from gravrokbot.actions.claim_daily_vip_gifts import ClaimDailyVIPGiftsAction
-        from gravrokbot.actions.change_character import ChangeCharacterAction
-        
-        # Add actions based on UI checkboxes
-        if self.action_vars.get("Gather Resources", tk.BooleanVar(value=False)).get():
-            gather_action = GatherResourcesAction(screen, self.settings['actions']['gather_resources'])
-            self.runner.add_action(gather_action)
-            
-        if self.action_vars.get("Collect City Resources", tk.BooleanVar(value=False)).get():
-            city_action = CollectCityResourcesAction(screen, self.settings['actions']['collect_city_resources'])
-            self.runner.add_action(city_action)
-            
-        if self.action_vars.get("Material Production", tk.BooleanVar(value=False)).get():
-            material_action = MaterialProductionAction(screen, self.settings['actions']['material_production'])
-            self.runner.add_action(material_action)
-            
-        if self.action_vars.get("Open Mails", tk.BooleanVar(value=False)).get():
-            mail_action = OpenMailsAction(screen, self.settings['actions']['open_mails'])
-            self.runner.add_action(mail_action)
-            
-        if self.action_vars.get("Claim Daily VIP Gifts", tk.BooleanVar(value=False)).get():
-            vip_action = ClaimDailyVIPGiftsAction(screen, self.settings['actions']['claim_daily_vip_gifts'])
-            self.runner.add_action(vip_action)
-            
-        if self.action_vars.get("Change Character", tk.BooleanVar(value=False)).get():
-            char_action = ChangeCharacterAction(screen, self.settings['actions']['change_character'])
-            self.runner.add_action(char_action)
+        # Add actions based on UI checkboxes, importing only the enabled ones
+        actions = get_action_registry()
+        for spec in actions.specs(activities_only=True):
+            if not self.action_vars.get(spec.name, tk.BooleanVar(value=False)).get():
+                continue
+            try:
+                self.runner.add_action(actions.create(spec.key, screen, self.config_snapshot.actions.get(spec.key, {})))
+            except Exception as e:
+                self.logger.error(f"Could not create action '{spec.name}': {e}")
+                self.add_log(f"Could not create action '{spec.name}': {e}", kind='error')
         
         # Silently update UI statuses based on action enabled/disabled state
         # (without adding log entries for each status change)
@@ -1035,7 +1206,7 @@ class MainWindow:
                 self.update_action_status(action_name, "N/A", log_change=False)
         
         self.logger.info("Refresh action list")
-        self.add_log("Refresh action list")
+        self.add_log("Refresh action list", kind='loop')
         
     def update_action_enabled_states(self):
         """
@@ -1098,14 +1269,17 @@ class MainWindow:
                 }
             })
             
+            self.compile_settings()
+            
             # Save to file
             config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "settings.json")
             with open(config_path, 'w') as f:
                 json.dump(self.settings, f, indent=4)
+            self.config_watcher.mark_current()
             
             self.add_log("Settings saved successfully")
         except Exception as e:
-            self.add_log(f"Error saving settings: {str(e)}")
+            self.add_log(f"Error saving settings: {str(e)}", kind='error')
     
     def reset_settings(self):
         """Reset settings to default values"""
@@ -1293,17 +1467,20 @@ class MainWindow:
                 if self.current_character:
                     self.character_settings["characters"][self.current_character]["actions"][action_key]["cooldown_minutes"] = new_cooldown
                     
+            self.compile_settings()
+                    
             # Save both settings files
             config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "settings.json")
             with open(config_path, 'w') as f:
                 json.dump(self.settings, f, indent=4)
+            self.config_watcher.mark_current()
             
             self.save_character_settings()
                     
             self.add_log(f"Configuration saved for {self.selected_action}")
             
         except Exception as e:
-            self.add_log(f"Error saving action configuration: {str(e)}")
+            self.add_log(f"Error saving action configuration: {str(e)}", kind='error')
         
     def validate_number(self, value):
         """Validate that the input is a positive number or empty"""
@@ -1359,16 +1536,22 @@ class MainWindow:
             return
             
         status_label = self.action_status_labels[action]
-        bootstyle = self.ACTION_STATUSES[status]
-        status_label.configure(text=status, bootstyle=bootstyle)
+        if status_label.cget('text') != status:
+            status_label.configure(text=status, bootstyle=self.ACTION_STATUSES[status])
         
         # Log the status change, but not if the status is "N/A"
         if log_change and status != "N/A":
-            self.add_log(f"Action '{action}' status changed to: {status}")
+            self.add_log(f"Action '{action}' status changed to: {status}", kind='error' if status == "Failed" else 'info')
         
     def cleanup_and_exit(self):
         """Perform cleanup operations before exiting"""
         try:
+            # Apply UI updates still queued by the runner
+            self.ui_bus.stop()
+            
+            # Stop reloading the settings files
+            self.config_watcher.stop()
+            
             # Save current character's settings if one is selected
             if self.current_character:
                 self.save_current_character_settings()
@@ -1376,8 +1559,19 @@ class MainWindow:
             # Save character settings file
             self.save_character_settings()
             
-            # Save cooldown states
+            # Save cooldown states now, the Tk loop is about to stop
             self.save_cooldown_states()
+            self.cooldown_store.flush()
+            if self.state_db:
+                self.state_db.close()
+            
+            # Stop vision worker processes
+            from gravrokbot.core.vision_pool import shutdown_shared_pool
+            shutdown_shared_pool()
+            
+            # Stop the metrics endpoint
+            from gravrokbot.core.metrics import get_registry
+            get_registry().stop_server()
             
             # Log cleanup
             self.logger.info("Cleanup completed successfully")
@@ -1391,6 +1585,7 @@ class MainWindow:
         
     def run(self):
         """Start the main event loop"""
+        self.root.after(PRELOAD_DELAY_MS, lambda: preload(PRELOAD_MODULES))
         self.root.mainloop()
 
 def main():
@@ -0,0 +1,221 @@
+"""
+UI event bus for GravRokBot.
+The runner thread publishes UI updates into a queue instead of touching Tk
+widgets, and the Tk main loop drains it on a timer, applying only the last
+status of each action and inserting all new log lines at once.
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+
+class _Reply:
+    """Result of a call the runner waits for, set on the Tk thread"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+class UIEventBus:
+    """Queue of UI updates between runner threads and the Tk main loop"""
+
+    def __init__(self, window, interval_ms=50, call_timeout=3.0):
+        """
+        Initialize the bus
+
+        Must be created on the Tk thread. Runners only reach the window
+        through the methods of the bus, so they never read Tk-owned state.
+
+        Args:
+            window (MainWindow): Window the updates are applied to
+            interval_ms (int): Milliseconds between drains
+            call_timeout (float): Seconds a runner waits for a blocking call, shorter
+                than the time a runner is given to stop
+        """
+        self.window = window
+        self.interval_ms = interval_ms
+        self.call_timeout = call_timeout
+        self.logger = logging.getLogger("GravRokBot.UIEventBus")
+        # deque appends and pops are atomic, so publishers never take a lock
+        self._events = deque()
+        self._tk_thread = threading.get_ident()
+        self._after_id = None
+
+    def start(self):
+        """Start draining the queue from the Tk main loop"""
+        if self._after_id is None:
+            self._after_id = self.window.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        """Stop draining and apply what is still queued"""
+        if self._after_id is not None:
+            self.window.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.drain()
+
+    def _tick(self):
+        """Drain the queue and schedule the next drain"""
+        try:
+            self.drain()
+        except Exception as e:
+            self.logger.error(f"Error applying UI updates: {e}")
+        self._after_id = self.window.root.after(self.interval_ms, self._tick)
+
+    def add_log(self, message, kind='info'):
+        """
+        Queue a log line, timestamped now
+
+        Args:
+            message (str): Log message
+            kind (str): 'info', 'loop' or 'error', selects the color
+        """
+        self._events.append(('log', (datetime.now(), message, kind)))
+
+    def update_action_status(self, action, status, log_change=True):
+        """
+        Queue an action status change
+
+        Args:
+            action (str): Action display name
+            status (str): New status
+            log_change (bool): Whether to log the change
+        """
+        self._events.append(('status', (action, status)))
+        if log_change and status != "N/A":
+            self.add_log(f"Action '{action}' status changed to: {status}", kind='error' if status == "Failed" else 'info')
+
+    def start_cooldown(self, action_key, cooldown_minutes=None):
+        """Queue the start of an action cooldown"""
+        self._events.append(('call', ('start_cooldown', (action_key, cooldown_minutes), None)))
+
+    def record_execution(self, action_key, started_at, finished_at, succeeded):
+        """Queue an action run for the execution history"""
+        self._events.append(('call', ('record_execution', (action_key, started_at, finished_at, succeeded), None)))
+
+    def update_character_name(self, name):
+        """Queue a switch of the current character"""
+        self._events.append(('call', ('update_character_name', (name,), None)))
+
+    def apply_config_snapshot(self, snapshot):
+        """Queue settings reloaded from the settings files"""
+        self._events.append(('call', ('apply_config_snapshot', (snapshot,), None)))
+
+    def refresh_runner_actions(self, stop_event=None):
+        """
+        Rebuild the runner actions on the Tk thread and wait until it is done
+
+        The runner iterates its actions right after refreshing them, so this
+        call blocks until the Tk loop has applied it, the timeout passes or
+        the runner is stopped.
+
+        Args:
+            stop_event (threading.Event, optional): Runner stop event that ends the wait
+        """
+        self._call_and_wait('refresh_runner_actions', (), stop_event)
+
+    def plan_character_switch(self, characters=None, stop_event=None):
+        """
+        Plan the next character switch on the Tk thread, which owns the character settings
+
+        Args:
+            characters (list, optional): Characters a switch can select, all if None
+            stop_event (threading.Event, optional): Runner stop event that ends the wait
+
+        Returns:
+            dict: Batch to switch to, None if no switch is planned or the UI did not answer in time
+        """
+        return self._call_and_wait('plan_character_switch', (characters,), stop_event)
+
+    def is_action_ready(self, action_key, stop_event=None):
+        """
+        Check on the Tk thread whether an action is off cooldown for the current character
+
+        Calls queued before, like the start of a cooldown or a character
+        switch, are applied first.
+
+        Args:
+            action_key (str): Config key of the action
+            stop_event (threading.Event, optional): Runner stop event that ends the wait
+
+        Returns:
+            bool: True if the action is ready, None if the UI did not answer in time
+        """
+        return self._call_and_wait('is_action_ready', (action_key,), stop_event)
+
+    def _call_and_wait(self, name, args, stop_event=None):
+        """
+        Call a window method on the Tk thread and wait for its result
+
+        The Tk thread may itself be waiting for the runner to stop, so the
+        wait ends as soon as the stop event is set.
+
+        Args:
+            name (str): Window method
+            args (tuple): Method arguments
+            stop_event (threading.Event, optional): Event that ends the wait early
+
+        Returns:
+            Result of the method, None if the Tk loop did not run it in time
+        """
+        if threading.get_ident() == self._tk_thread:
+            self.drain()
+            return getattr(self.window, name)(*args)
+
+        reply = _Reply()
+        self._events.append(('call', (name, args, reply)))
+        deadline = time.monotonic() + self.call_timeout
+        while not reply.done.wait(min(self.interval_ms / 1000, max(deadline - time.monotonic(), 0))):
+            if stop_event is not None and stop_event.is_set():
+                self.logger.debug(f"Stopped waiting for {name}")
+                break
+            if time.monotonic() >= deadline:
+                self.logger.warning(f"UI did not run {name} in time")
+                break
+        return reply.result
+
+    def drain(self):
+        """
+        Apply the queued updates, on the Tk thread
+
+        Status changes are coalesced to the last status per action and log
+        lines are inserted in one widget operation. Queued calls run in order,
+        after the updates queued before them. A failing call is logged and the
+        rest of the batch is still applied.
+
+        Returns:
+            int: Number of events applied
+        """
+        count = len(self._events)
+        logs = []
+        statuses = {}
+        for _ in range(count):
+            kind, payload = self._events.popleft()
+            if kind == 'log':
+                logs.append(payload)
+            elif kind == 'status':
+                action, status = payload
+                statuses[action] = status
+            else:
+                self._flush(logs, statuses)
+                logs, statuses = [], {}
+                name, args, reply = payload
+                try:
+                    result = getattr(self.window, name)(*args)
+                    if reply is not None:
+                        reply.result = result
+                except Exception as e:
+                    self.logger.error(f"Error running queued {name}: {e}")
+                finally:
+                    if reply is not None:
+                        reply.done.set()
+        self._flush(logs, statuses)
+        return count
+
+    def _flush(self, logs, statuses):
+        """Apply coalesced status changes and batched log lines"""
+        for action, status in statuses.items():
+            self.window.update_action_status(action, status, log_change=False)
+        if logs:
+            self.window.add_logs(logs)
@@ -0,0 +1,109 @@
+"""
+Deferred imports for GravRokBot.
+Heavy libraries (OpenCV, NumPy, PyAutoGUI, Tesseract, Pillow) are bound to
+module placeholders that import them on first attribute access, so the UI
+can start before the vision stack is loaded.
+"""
+
+import sys
+import types
+import logging
+import importlib
+import threading
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on first use"""
+
+    def __init__(self, name):
+        """
+        Initialize the placeholder
+
+        Args:
+            name (str): Absolute module name, e.g. 'cv2' or 'PIL.Image'
+        """
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self):
+        """Import the module once and keep a reference to it"""
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            # The import lock makes concurrent first uses safe
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, name):
+        """Resolve attributes on the imported module"""
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__['_lazy_module'] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+def lazy_module(name):
+    """
+    Get a module that is imported on first attribute access
+
+    If the module was already imported, it is returned as it is.
+
+    Args:
+        name (str): Absolute module name
+
+    Returns:
+        module: The module or a placeholder for it
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+def lazy_exports(package, exports):
+    """
+    Build a module __getattr__ that imports package members on first use
+
+    Args:
+        package (str): Name of the package, usually __name__
+        exports (dict): Attribute name to defining module, relative to the package
+
+    Returns:
+        function: Function to assign to the package's __getattr__
+    """
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip this function
+        setattr(sys.modules[package], name, value)
+        return value
+    return __getattr__
+
+def preload(names):
+    """
+    Import modules on a background thread
+
+    Called once the UI is shown, so the first bot start does not wait for
+    the vision libraries.
+
+    Args:
+        names (iterable): Absolute module names
+
+    Returns:
+        threading.Thread: Started daemon thread
+    """
+    logger = logging.getLogger("GravRokBot.LazyImport")
+
+    def run():
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                logger.warning(f"Could not preload {name}: {e}")
+
+    thread = threading.Thread(target=run, name="ModulePreload", daemon=True)
+    thread.start()
+    return thread
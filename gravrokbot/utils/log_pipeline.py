@@ -0,0 +1,115 @@
+"""
+Non-blocking logging pipeline for GravRokBot.
+Loggers only put records on a queue; a background listener formats them and
+writes them to the console and to size-rotated log files, so a log call on
+the bot thread costs microseconds however slow the outputs are.
+"""
+
+import os
+import copy
+import queue
+import atexit
+import logging
+import logging.handlers
+import colorlog
+
+# Loggers of the bot modules and of the UI
+LOGGER_NAMES = ("GravRokBot", "gravrokbot")
+
+CONSOLE_FORMAT = "%(log_color)s[%(asctime)s] %(levelname)s: %(message)s"
+FILE_FORMAT = "[%(asctime)s] %(levelname)s %(name)s: %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_COLORS = {
+    'DEBUG': 'cyan',
+    'INFO': 'green',
+    'WARNING': 'yellow',
+    'ERROR': 'red',
+    'CRITICAL': 'red,bg_white',
+}
+
+# Listener, queue handler and logger names of the running pipeline
+_pipeline = None
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves the formatting to the listener thread
+
+    The standard QueueHandler merges the message and its arguments before
+    queueing the record; here the record is queued as it is, so the %-style
+    arguments of a hot-path log call are only formatted in the background.
+    Arguments should therefore not be mutated after logging them.
+    """
+
+    def prepare(self, record):
+        """Copy the record without formatting it"""
+        return copy.copy(record)
+
+def setup_logging(level=logging.DEBUG, console_level=logging.INFO, log_dir="logs",
+                  filename="gravrokbot.log", max_bytes=5 * 1024 * 1024, backup_count=5,
+                  logger_names=LOGGER_NAMES):
+    """
+    Route the bot loggers through a queue to console and rotating file outputs
+
+    Calling it again replaces the previous pipeline.
+
+    Args:
+        level (int): Level of the bot loggers and the log file
+        console_level (int): Level of the console output
+        log_dir (str): Directory of the log files, no file output if None
+        filename (str): Log file name
+        max_bytes (int): Size at which the log file is rotated
+        backup_count (int): Number of rotated files kept
+        logger_names (tuple): Loggers routed through the queue
+
+    Returns:
+        logging.handlers.QueueListener: Started listener
+    """
+    global _pipeline
+    stop_logging()
+
+    console_handler = colorlog.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(colorlog.ColoredFormatter(CONSOLE_FORMAT, datefmt=DATE_FORMAT, log_colors=LOG_COLORS))
+    handlers = [console_handler]
+
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir, filename),
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(level)
+        file_handler.setFormatter(logging.Formatter(FILE_FORMAT, datefmt=DATE_FORMAT))
+        handlers.append(file_handler)
+
+    # SimpleQueue never blocks the logging thread
+    records = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(records)
+    for name in logger_names:
+        logger = logging.getLogger(name)
+        logger.addHandler(queue_handler)
+        logger.setLevel(level)
+        logger.propagate = False
+
+    listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    _pipeline = (listener, queue_handler, logger_names)
+    return listener
+
+def stop_logging():
+    """Write out the queued records and stop the background listener"""
+    global _pipeline
+    if _pipeline is None:
+        return
+
+    listener, queue_handler, logger_names = _pipeline
+    _pipeline = None
+    for name in logger_names:
+        logging.getLogger(name).removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+atexit.register(stop_logging)
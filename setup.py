@@ -17,6 +17,11 @@ setup(
     entry_points={
         'console_scripts': [
             'gravrokbot=gravrokbot.gravrokbot:main',
+            'gravrokbot-bench-vision=gravrokbot.benchmarks.vision:main',
+            'gravrokbot-bench-startup=gravrokbot.benchmarks.startup:main',
+            'gravrokbot-events=gravrokbot.analysis.event_report:main',
+            'gravrokbot-build-templates=gravrokbot.core.template_bundle:main',
+            'gravrokbot-calibrate=gravrokbot.analysis.calibrate:main',
         ],
     },
     author="Gravity",
@@ -0,0 +1,89 @@
+import unittest
+import os
+import sys
+from importlib import metadata
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.action_registry import ActionRegistry, ENTRY_POINT_GROUP, get_action_registry
+
+class DummyAction:
+    """Stand-in action recording its constructor arguments"""
+
+    def __init__(self, screen_interaction, config):
+        self.screen_interaction = screen_interaction
+        self.config = config
+
+class TestActionRegistry(unittest.TestCase):
+    """Test cases for the action registry"""
+
+    def setUp(self):
+        """Create an empty registry"""
+        self.registry = ActionRegistry()
+
+    def test_class_loaded_on_first_use(self):
+        """Test that a registered action is only imported when loaded"""
+        spec = self.registry.register('dummy', 'Dummy', f"{__name__}:DummyAction")
+        self.assertIsNone(spec.action_class)
+
+        action = self.registry.create('dummy', 'screen', {'enabled': True})
+        self.assertIsInstance(action, DummyAction)
+        self.assertEqual(action.config, {'enabled': True})
+        self.assertIs(spec.action_class, DummyAction)
+
+    def test_decorator(self):
+        """Test registering a class with the decorator"""
+        @self.registry.action('daily_quests', activity=False)
+        class DailyQuestsAction(DummyAction):
+            pass
+
+        spec = self.registry.get('daily_quests')
+        self.assertEqual(spec.name, 'Daily Quests')
+        self.assertFalse(spec.activity)
+        self.assertIs(self.registry.load('daily_quests'), DailyQuestsAction)
+        self.assertEqual(self.registry.key_for_name('Daily Quests'), 'daily_quests')
+        self.assertEqual(self.registry.specs(activities_only=True), [])
+
+    def test_replacing_an_action(self):
+        """Test that a later registration with another target wins"""
+        self.registry.register('open_mails', 'Open Mails', 'gravrokbot.actions.open_mails:OpenMailsAction')
+        with self.assertLogs("GravRokBot.ActionRegistry", level="WARNING"):
+            self.registry.register('open_mails', 'Open Mails', f"{__name__}:DummyAction")
+        self.assertIs(self.registry.load('open_mails'), DummyAction)
+
+    def test_unknown_action(self):
+        """Test that unknown keys raise KeyError"""
+        self.assertNotIn('missing', self.registry)
+        with self.assertRaises(KeyError):
+            self.registry.get('missing')
+
+    def test_entry_points(self):
+        """Test that plugin entry points are registered without importing them"""
+        entry_point = metadata.EntryPoint('farm_barbarians', f"{__name__}:DummyAction", ENTRY_POINT_GROUP)
+        with patch('importlib.metadata.entry_points', return_value=[entry_point]) as entry_points:
+            self.registry.load_entry_points()
+            self.registry.load_entry_points()
+
+        entry_points.assert_called_once_with(group=ENTRY_POINT_GROUP)
+        spec = self.registry.get('farm_barbarians')
+        self.assertEqual(spec.name, 'Farm Barbarians')
+        self.assertIsNone(spec.action_class)
+        self.assertIs(spec.load(), DummyAction)
+
+    def test_builtin_actions(self):
+        """Test that the built-in actions are registered in UI order"""
+        registry = get_action_registry()
+        activities = [spec.key for spec in registry.specs(activities_only=True)]
+
+        self.assertEqual(activities[:6], ['gather_resources', 'collect_city_resources', 'material_production',
+                                          'open_mails', 'claim_daily_vip_gifts', 'change_character'])
+        self.assertIn('start_game', registry)
+        self.assertEqual(registry.key_for_name('Claim Daily VIP Gifts'), 'claim_daily_vip_gifts')
+
+        from gravrokbot.actions.gather_resources import GatherResourcesAction
+        self.assertIs(registry.load('gather_resources'), GatherResourcesAction)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -137,6 +137,32 @@ class TestActionWorkflow(unittest.TestCase):
         
         # Verify retry count was reset
         self.assertEqual(self.action.retry_count, 0)
+    
+    def test_execution_outcome(self):
+        """Test that execute leaves the outcome of the run after retries"""
+        class FlakyAction(ActionWorkflow):
+            failures = 0
+            
+            def on_start(self):
+                if self.failures:
+                    self.failures -= 1
+                    self.fail()
+                else:
+                    self.succeed()
+        
+        action = FlakyAction("Flaky Action", self.mock_screen, self.config)
+        action.failures = 1
+        self.assertTrue(action.execute())
+        self.assertTrue(action.succeeded)
+        
+        action.reset()
+        action.failures = 3
+        self.assertTrue(action.execute(ignore_cooldown=True))
+        self.assertFalse(action.succeeded)
+        
+        # A flow that ends without an outcome did not succeed
+        self.action.execute()
+        self.assertFalse(self.action.succeeded)
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,204 @@
+import unittest
+import os
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.adaptive_delay import AdaptiveDelayTuner, get_delay_tuner
+from gravrokbot.core.clock import SimulatedClock, SystemClock, set_clock
+from gravrokbot.core.action_workflow import ActionWorkflow
+
+class LaggyScreen:
+    """Screen stand-in whose expected element shows up a set time after it is asked for"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.lag = 0.0
+        self.asked_at = None
+        self.waits = []
+        self.checks = []
+
+    def template_region(self, image_path):
+        return None
+
+    def find_image(self, image_path, confidence=0.8, region=None, grayscale=True):
+        self.checks.append((self.clock.monotonic(), region))
+        if self.asked_at is None:
+            self.asked_at = self.clock.monotonic()
+        if self.clock.monotonic() - self.asked_at >= self.lag:
+            self.asked_at = None
+            return (100, 100)
+        return None
+
+    def humanized_wait(self, min_seconds, max_seconds):
+        self.waits.append((min_seconds, max_seconds))
+        self.clock.sleep(max_seconds)
+        return max_seconds
+
+class MenuAction(ActionWorkflow):
+    """Action with one transition that expects a menu button"""
+
+    def __init__(self, screen, config):
+        super().__init__("Menu Action", screen, config)
+
+    def setup_transitions(self):
+        self.add_transition_with_delays(
+            'open_menu', '*', 'detecting',
+            pre_delay_min=0.5, pre_delay_max=3.0,
+            expect='menu_button',
+            after='on_open_menu'
+        )
+
+    def on_open_menu(self):
+        self.logger.debug("Menu opened")
+
+class PanelAction(ActionWorkflow):
+    """Action with one transition that expects a button in a known region"""
+
+    def __init__(self, screen, config):
+        super().__init__("Panel Action", screen, config)
+
+    def setup_transitions(self):
+        self.add_transition_with_delays(
+            'open_panel', '*', 'detecting',
+            pre_delay_min=0.5, pre_delay_max=3.0,
+            expect='menu_button',
+            expect_region=(0, 0, 200, 100),
+            after='on_open_panel'
+        )
+
+    def on_open_panel(self):
+        self.logger.debug("Panel opened")
+
+class TestAdaptiveDelayTuner(unittest.TestCase):
+    """Test cases for the adaptive delay tuner"""
+
+    def test_configured_bounds_until_enough_samples(self):
+        """Test that the configured range is used until min_samples are recorded"""
+        tuner = AdaptiveDelayTuner(min_samples=3)
+        tuner.record('a.step', 0.2)
+        tuner.record('a.step', 0.2)
+
+        self.assertIsNone(tuner.observed('a.step'))
+        self.assertEqual(tuner.delay_range('a.step', 0.5, 2.0), (0.5, 2.0))
+
+    def test_range_follows_percentile_within_bounds(self):
+        """Test that the range starts at the percentile and stays within the bounds"""
+        tuner = AdaptiveDelayTuner(min_samples=5, percentile=90, jitter=0.2)
+        for value in (1.0, 1.0, 1.0, 1.0, 1.0):
+            tuner.record('a.step', value)
+
+        low, high = tuner.delay_range('a.step', 0.5, 3.0)
+        self.assertAlmostEqual(low, 1.0)
+        self.assertAlmostEqual(high, 1.2)
+
+        # Responsive game: the range collapses to the minimum
+        self.assertEqual(tuner.delay_range('a.step', 1.5, 3.0), (1.5, 1.5))
+        # Laggy game: the range is capped at the maximum
+        self.assertEqual(tuner.delay_range('a.step', 0.1, 0.8), (0.8, 0.8))
+
+    def test_window_keeps_recent_samples(self):
+        """Test that old samples drop out of the rolling window"""
+        tuner = AdaptiveDelayTuner(window=5, min_samples=1)
+        for _ in range(5):
+            tuner.record('a.step', 5.0)
+        for _ in range(5):
+            tuner.record('a.step', 0.5)
+
+        self.assertAlmostEqual(tuner.observed('a.step'), 0.5)
+        self.assertEqual(tuner.summary()['a.step']['samples'], 5)
+
+        tuner.configure({'window': 2})
+        self.assertEqual(tuner.summary()['a.step']['samples'], 2)
+
+class TestAdaptiveWorkflowDelays(unittest.TestCase):
+    """Test cases for transitions that wait for an expected element"""
+
+    def setUp(self):
+        """Install a simulated clock and a fresh tuner configuration"""
+        self.clock = SimulatedClock(start=datetime(2026, 1, 5, 12, 0))
+        set_clock(self.clock)
+        get_delay_tuner().reset()
+        get_delay_tuner().configure({'enabled': True, 'min_samples': 3, 'jitter': 0.1,
+                                     'poll_interval': 0.1, 'window': 50})
+        self.screen = LaggyScreen(self.clock)
+        self.action = MenuAction(self.screen, {'images': {'menu_button': 'assets/images/menu.png'}})
+
+    def tearDown(self):
+        """Go back to real time"""
+        set_clock(SystemClock())
+        get_delay_tuner().reset()
+
+    def run_transition(self):
+        """Trigger the transition and return the simulated time it took"""
+        started_at = self.clock.monotonic()
+        self.action.open_menu()
+        return self.clock.monotonic() - started_at
+
+    def test_cycle_time_follows_response_time(self):
+        """Test that the wait shrinks when the game is fast and grows when it lags"""
+        # Before enough samples the configured range is used
+        self.screen.lag = 0.2
+        first = self.run_transition()
+        self.assertAlmostEqual(first, 3.0, places=5)
+
+        for _ in range(5):
+            self.run_transition()
+        responsive = self.run_transition()
+        self.assertLess(responsive, 1.0)
+        self.assertGreaterEqual(responsive, 0.5)
+
+        self.screen.lag = 2.5
+        for _ in range(10):
+            self.run_transition()
+        laggy = self.run_transition()
+        self.assertGreater(laggy, 2.5)
+        self.assertLessEqual(laggy, 3.0 + 1e-6)
+
+        summary = get_delay_tuner().summary()['Menu Action.open_menu']
+        self.assertGreater(summary['percentile'], 2.0)
+
+    def test_gives_up_after_timeout(self):
+        """Test that a missing element is waited for at most the timeout and not recorded"""
+        self.screen.lag = 100
+        elapsed = self.run_transition()
+
+        # Without a tuned delay the wait is capped at the maximum delay
+        self.assertAlmostEqual(elapsed, 3.0, places=5)
+        self.assertEqual(get_delay_tuner().summary(), {})
+
+        # Once tuned, the timeout factor applies
+        for _ in range(3):
+            get_delay_tuner().record('Menu Action.open_menu', 1.0)
+        self.screen.asked_at = None
+        elapsed = self.run_transition()
+        self.assertAlmostEqual(elapsed, 6.0, places=5)
+
+    def test_poll_backoff_and_region(self):
+        """Test that checks back off and search the given region"""
+        action = PanelAction(self.screen, {'images': {'menu_button': 'assets/images/menu.png'}})
+        self.screen.lag = 100
+        action.open_panel()
+
+        times = [checked_at for checked_at, _ in self.screen.checks]
+        intervals = [round(later - earlier, 6) for earlier, later in zip(times, times[1:])]
+        self.assertEqual(intervals[:4], [0.1, 0.15, 0.225, 0.3375])
+        self.assertEqual(max(intervals), 0.5)
+        self.assertLess(len(times), 12)
+        self.assertEqual({region for _, region in self.screen.checks}, {(0, 0, 200, 100)})
+
+    def test_disabled_tuner_uses_static_delay(self):
+        """Test that the configured pre-delay is used when tuning is disabled"""
+        get_delay_tuner().configure({'enabled': False})
+        self.screen.find_image = MagicMock()
+
+        self.run_transition()
+
+        self.screen.find_image.assert_not_called()
+        self.assertEqual(self.screen.waits, [(0.5, 3.0)])
+
+if __name__ == '__main__':
+    unittest.main()
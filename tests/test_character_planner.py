@@ -0,0 +1,210 @@
+import unittest
+import os
+import sys
+from datetime import datetime
+from unittest.mock import ANY, MagicMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.cooldown_index import CooldownIndex
+from gravrokbot.core.character_planner import CharacterPlanner
+from gravrokbot.core.action_runner import ActionRunner
+from gravrokbot.core.clock import SimulatedClock, SystemClock, set_clock
+from gravrokbot.actions.change_character import ChangeCharacterAction
+
+class TestCharacterPlanner(unittest.TestCase):
+    """Test cases for CharacterPlanner class"""
+
+    def setUp(self):
+        """Set up test case with three characters and a fixed clock"""
+        self.now = 10000.0
+        self.index = CooldownIndex(clock=lambda: self.now)
+        self.actions = {
+            "Alpha": ["gather_resources", "open_mails", "material_production"],
+            "Beta": ["gather_resources", "open_mails", "material_production"],
+            "Gamma": ["gather_resources", "open_mails", "material_production"]
+        }
+
+        # Alpha is logged in and has just run everything
+        for action in self.actions["Alpha"]:
+            self.index.start("Alpha", action, 3600)
+
+        # Beta has one action due, Gamma has two
+        self.index.set_deadline("Beta", "gather_resources", 9000)
+        self.index.start("Beta", "open_mails", 3600)
+        self.index.start("Beta", "material_production", 3600)
+        self.index.set_deadline("Gamma", "gather_resources", 9500)
+        self.index.set_deadline("Gamma", "open_mails", 9900)
+        self.index.start("Gamma", "material_production", 3600)
+
+    def test_due_actions(self):
+        """Test collecting due actions and how long they have waited"""
+        planner = CharacterPlanner(self.index)
+
+        self.assertEqual(planner.due_actions("Gamma", self.actions["Gamma"]), (["gather_resources", "open_mails"], 500.0))
+        self.assertEqual(planner.due_actions("Alpha", self.actions["Alpha"]), ([], 0.0))
+
+        # Actions without a cooldown are always due
+        due, overdue = planner.due_actions("Delta", ["gather_resources"])
+        self.assertEqual(due, ["gather_resources"])
+        self.assertEqual(overdue, float('inf'))
+
+    def test_lookahead_includes_soon_due_actions(self):
+        """Test that actions becoming due during the switch join the batch"""
+        self.index.set_deadline("Beta", "open_mails", self.now + 60)
+        planner = CharacterPlanner(self.index, lookahead_seconds=120)
+
+        due, _ = planner.due_actions("Beta", self.actions["Beta"])
+        self.assertEqual(due, ["gather_resources", "open_mails"])
+
+    def test_largest_batch_first(self):
+        """Test that switches go to the character with the most due work first"""
+        planner = CharacterPlanner(self.index)
+        plan = planner.plan(self.actions, current_character="Alpha")
+
+        self.assertEqual([batch['character'] for batch in plan], ["Gamma", "Beta"])
+        self.assertEqual(planner.next_switch(self.actions, "Alpha")['character'], "Gamma")
+
+    def test_current_character_first(self):
+        """Test that no switch is planned while the current character has due work"""
+        self.index.clear("Alpha", "open_mails")
+        planner = CharacterPlanner(self.index)
+
+        self.assertEqual(planner.plan(self.actions, current_character="Alpha")[0]['character'], "Alpha")
+        self.assertIsNone(planner.next_switch(self.actions, "Alpha"))
+
+    def test_min_batch_size(self):
+        """Test that small batches wait until they have waited too long"""
+        planner = CharacterPlanner(self.index, min_batch_size=2, max_wait_seconds=2000)
+        self.assertEqual([batch['character'] for batch in planner.plan(self.actions, "Alpha")], ["Gamma"])
+
+        # Beta's single action has now waited longer than max_wait_seconds
+        self.now = 11500.0
+        planner = CharacterPlanner(self.index, min_batch_size=3, max_wait_seconds=2200)
+        self.assertEqual([batch['character'] for batch in planner.plan(self.actions, "Alpha")], ["Beta"])
+
+    def test_nothing_due(self):
+        """Test that no switch is planned when no character has due work"""
+        planner = CharacterPlanner(self.index)
+        self.assertIsNone(planner.next_switch({"Alpha": self.actions["Alpha"]}, "Alpha"))
+
+class TestCharacterSwitch(unittest.TestCase):
+    """Test cases for switching to the planned character"""
+
+    def setUp(self):
+        """Set up a change character action on a screen that finds everything"""
+        self.screen = MagicMock()
+        self.screen.find_and_click_image.return_value = True
+        self.config = {
+            'max_retries': 1,
+            'images': {
+                'settings_button': 'assets/images/settings_button.png',
+                'character_button': 'assets/images/character_button.png',
+                'switch_button': 'assets/images/switch_button.png',
+                'confirmation': 'assets/images/switch_confirmation.png'
+            },
+            'character_images': {'Beta': 'assets/images/characters/beta.png'}
+        }
+        self.main_window = MagicMock()
+        self.runner = ActionRunner(self.main_window, {'tracing': {'enabled': False}})
+        self.runner.current_character = "Alpha"
+
+    def test_switch_selects_target(self):
+        """Test that the switch clicks the target character and reports it"""
+        action = ChangeCharacterAction(self.screen, self.config)
+        action.target_character = "Beta"
+        action.execute(ignore_cooldown=True)
+
+        clicked = [call.args[0] for call in self.screen.find_and_click_image.call_args_list]
+        self.assertIn(action.character_images["Beta"], clicked)
+        self.assertEqual(action.switched_to, "Beta")
+
+        self.runner._apply_character_switch(action)
+        self.assertEqual(self.runner.current_character, "Beta")
+        self.main_window.update_character_name.assert_called_once_with("Beta")
+
+    def test_unknown_character_not_applied(self):
+        """Test that a switch without a known target keeps the current character"""
+        action = ChangeCharacterAction(self.screen, self.config)
+        action.execute(ignore_cooldown=True)
+
+        self.assertIsNone(action.switched_to)
+        self.runner._apply_character_switch(action)
+        self.assertEqual(self.runner.current_character, "Alpha")
+        self.main_window.update_character_name.assert_not_called()
+
+    def test_fixed_cooldown_without_templates(self):
+        """Test that the switch is not planned when it cannot select characters"""
+        del self.config['character_images']
+        action = ChangeCharacterAction(self.screen, self.config)
+
+        self.main_window.is_action_ready.return_value = True
+        self.assertTrue(self.runner._is_due(action))
+        self.main_window.plan_character_switch.assert_not_called()
+        self.main_window.is_action_ready.assert_called_with("change_character", stop_event=self.runner.stop_event)
+
+        self.main_window.is_action_ready.return_value = False
+        self.assertFalse(self.runner._is_due(action))
+
+    def test_planned_switch(self):
+        """Test that the planner is asked for the selectable characters"""
+        action = ChangeCharacterAction(self.screen, self.config)
+        self.main_window.plan_character_switch.return_value = {'character': "Beta", 'actions': ["open_mails"]}
+
+        self.assertTrue(self.runner._is_due(action))
+        self.main_window.plan_character_switch.assert_called_once_with(["Beta"], stop_event=self.runner.stop_event)
+        self.assertEqual(action.target_character, "Beta")
+
+    def _run_loops(self, succeeded, loops=1):
+        """Run loops with a plugin action that succeeds or fails, cooldowns kept in an index"""
+        clock = SimulatedClock(start=datetime(2026, 1, 5, 12, 0))
+        set_clock(clock)
+        self.addCleanup(set_clock, SystemClock())
+        index = CooldownIndex(clock=clock.monotonic)
+        self.main_window.start_cooldown.side_effect = lambda key, minutes: index.start("Alpha", key, minutes * 60)
+        self.main_window.is_action_ready.side_effect = lambda key, stop_event=None: index.is_ready("Alpha", key)
+
+        runner = ActionRunner(self.main_window, {
+            'continuous_running': False,
+            'coffee_break_chance': 0.0,
+            'tracing': {'enabled': False}
+        })
+        action = MagicMock(spec=['name', 'key', 'enabled', 'succeeded', 'retry_count', 'cooldown_minutes', 'execute'])
+        action.name = "Gem Hunt"
+        action.key = "plugin_gem_hunt"
+        action.enabled = True
+        action.succeeded = succeeded
+        action.retry_count = 0
+        action.cooldown_minutes = 30
+        runner.add_action(action)
+        for _ in range(loops):
+            runner.running = True
+            runner._run_loop()
+        return action
+
+    def test_cooldown_uses_registry_key(self):
+        """Test that cooldowns and history use the action key, not its display name"""
+        self._run_loops(True)
+
+        self.main_window.is_action_ready.assert_called_once_with("plugin_gem_hunt", stop_event=ANY)
+        self.main_window.start_cooldown.assert_called_once_with("plugin_gem_hunt", 30)
+        self.assertEqual(self.main_window.record_execution.call_args.args[0], "plugin_gem_hunt")
+
+    def test_successful_action_waits_for_cooldown(self):
+        """Test that a successful run is not repeated while on cooldown"""
+        action = self._run_loops(True, loops=2)
+
+        self.assertEqual(action.execute.call_count, 1)
+
+    def test_failed_action_stays_due(self):
+        """Test that a failed run starts no cooldown, so the action runs again"""
+        action = self._run_loops(False, loops=2)
+
+        self.assertEqual(action.execute.call_count, 2)
+        self.main_window.update_action_status.assert_any_call("Gem Hunt", "Failed")
+        self.main_window.start_cooldown.assert_not_called()
+        self.assertFalse(self.main_window.record_execution.call_args.args[3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import os
+import sys
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.clock import SimulatedClock, SystemClock, get_clock, set_clock
+from gravrokbot.core.tracing import get_tracer
+
+class DummyAction:
+    """Action stand-in that takes half a minute of clock time"""
+
+    def __init__(self, clock):
+        self.name = "Dummy Action"
+        self.key = "dummy_action"
+        self.cooldown_minutes = 0
+        self.enabled = True
+        self.retry_count = 0
+        self.max_retries = 3
+        self.succeeded = None
+        self.clock = clock
+        self.executed_at = []
+
+    def is_on_cooldown(self):
+        return False
+
+    def execute(self, ignore_cooldown=False):
+        self.executed_at.append(self.clock.now())
+        self.clock.sleep(30)
+        self.succeeded = True
+        return True
+
+class TestClock(unittest.TestCase):
+    """Test cases for the clock abstraction"""
+
+    def setUp(self):
+        """Install a simulated clock starting at noon"""
+        self.clock = SimulatedClock(start=datetime(2026, 1, 5, 12, 0))
+        set_clock(self.clock)
+
+    def tearDown(self):
+        """Go back to real time"""
+        set_clock(SystemClock())
+        get_tracer().enabled = True
+
+    def test_simulated_clock(self):
+        """Test that sleeping advances simulated time instantly"""
+        start = time.perf_counter()
+        self.clock.sleep(3600)
+        self.clock.sleep(-5)
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(self.clock.monotonic(), 3600)
+        self.assertEqual(self.clock.now(), datetime(2026, 1, 5, 13, 0))
+        self.assertEqual(self.clock.time(), datetime(2026, 1, 5, 13, 0).timestamp())
+        self.assertIs(get_clock(), self.clock)
+
+    def test_action_cooldown_on_simulated_clock(self):
+        """Test that action cooldowns run on the clock"""
+        from gravrokbot.core.action_workflow import ActionWorkflow
+
+        class CooldownAction(ActionWorkflow):
+            def setup_transitions(self):
+                pass
+
+        action = CooldownAction("Cooldown Action", MagicMock(), {'cooldown_minutes': 30})
+        action.last_execution_time = self.clock.now()
+
+        self.assertTrue(action.is_on_cooldown())
+        self.clock.sleep(29 * 60)
+        self.assertAlmostEqual(action.get_cooldown_remaining(), 1.0)
+        self.clock.sleep(60)
+        self.assertFalse(action.is_on_cooldown())
+
+    def test_simulated_day(self):
+        """Test running a full day of runner loops in simulated time"""
+        from gravrokbot.core.action_runner import ActionRunner
+
+        main_window = MagicMock()
+        runner = ActionRunner(main_window, {
+            'refresh_rate_seconds': 600,
+            'night_sleep_enabled': True,
+            'night_sleep_start': '23:00',
+            'night_sleep_end': '07:00',
+            'coffee_break_chance': 0.0,
+            'tracing': {'enabled': False}
+        })
+        action = DummyAction(self.clock)
+        runner.add_action(action)
+
+        # Stop after one simulated day
+        def stop_after_a_day(stop_event=None):
+            if self.clock.monotonic() >= 24 * 3600:
+                runner.running = False
+        main_window.refresh_runner_actions.side_effect = stop_after_a_day
+
+        start = time.perf_counter()
+        runner.running = True
+        runner._run_loop()
+
+        self.assertLess(time.perf_counter() - start, 10.0)
+        self.assertGreaterEqual(self.clock.monotonic(), 24 * 3600)
+        self.assertGreater(len(action.executed_at), 50)
+        for executed_at in action.executed_at:
+            self.assertTrue(7 <= executed_at.hour < 23, executed_at)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+import dataclasses
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.config_snapshot import (
+    ConfigError, ConfigWatcher, DelayProfile, PACKAGE_DIR, compile_action, compile_settings, load_settings
+)
+from gravrokbot.core.action_workflow import ActionWorkflow
+
+class TestConfigSnapshot(unittest.TestCase):
+    """Test cases for compiled settings"""
+
+    def setUp(self):
+        """Load the default settings"""
+        self.settings = load_settings(user_path=None)
+
+    def test_compile_defaults(self):
+        """Test that the default settings compile with resolved paths and profiles"""
+        snapshot = compile_settings(self.settings)
+
+        gather = snapshot.actions['gather_resources']
+        self.assertEqual(gather.images.gather_button,
+                         os.path.join(PACKAGE_DIR, "assets", "images", "gather_button.png"))
+        self.assertEqual(gather.cooldown_minutes, 60)
+        buildings = snapshot.actions['collect_city_resources'].images.resource_buildings
+        self.assertIsInstance(buildings, tuple)
+        self.assertTrue(all(os.path.isabs(path) for path in buildings))
+
+        # Built-in and configured profiles
+        self.assertEqual(gather.delay_profiles['normal'], DelayProfile(0.5, 1.0, 0.8, 1.2))
+        self.assertEqual(gather.delay_profiles['slow_game'].post_delay_max, 3.0)
+        self.assertEqual(snapshot.actions['start_game'].get('game_path'), self.settings['actions']['start_game']['game_path'])
+
+    def test_snapshot_is_read_only(self):
+        """Test that snapshots cannot be modified"""
+        snapshot = compile_settings(self.settings)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.actions['open_mails'].cooldown_minutes = 5
+        with self.assertRaises(TypeError):
+            snapshot.settings['runner']['refresh_rate_seconds'] = 5
+
+        # Mutable copies for the UI
+        runner = snapshot.section('runner')
+        runner['refresh_rate_seconds'] = 5
+        self.assertEqual(snapshot.settings['runner']['refresh_rate_seconds'], self.settings['runner']['refresh_rate_seconds'])
+
+    def test_validation(self):
+        """Test that all problems are reported together"""
+        self.settings['screen']['default_confidence'] = 1.5
+        self.settings['screen']['match_method'] = 'sqdiff'
+        self.settings['actions']['open_mails']['cooldown_minutes'] = -1
+        self.settings['actions']['open_mails']['images']['bad-name'] = "x.png"
+        self.settings['delay_profiles']['slow_game']['pre_delay_min'] = 9.0
+
+        with self.assertRaises(ConfigError) as context:
+            compile_settings(self.settings)
+
+        problems = context.exception.problems
+        self.assertEqual(len(problems), 5)
+        self.assertIn("screen.default_confidence must be between 0.0 and 1.0, got 1.5", problems)
+        self.assertIn("actions.open_mails.cooldown_minutes must be at least 0.0, got -1", problems)
+        self.assertIn("screen.match_method must be one of ccoeff, edges, concordance", problems)
+
+    def test_action_compiles_dict_config(self):
+        """Test that actions given a plain dict compile it"""
+        action = ActionWorkflow("Open Mails", MagicMock(), {
+            'cooldown_minutes': 15,
+            'images': {'mail_button': 'assets/images/mail_button.png'},
+            'delay_profiles': {'quick': {'pre_delay_min': 0.1, 'pre_delay_max': 0.2}}
+        })
+
+        self.assertEqual(action.settings.key, 'open_mails')
+        self.assertEqual(action.cooldown_minutes, 15)
+        self.assertTrue(os.path.isabs(action.images.mail_button))
+        self.assertEqual(action.get_delay_profile('quick'), DelayProfile(0.1, 0.2, 0.0, 0.0))
+        self.assertIsNone(action.get_delay_profile('missing'))
+
+        with self.assertRaises(ConfigError):
+            compile_action('open_mails', {'max_retries': 'three'})
+
+class TestConfigWatcher(unittest.TestCase):
+    """Test cases for reloading the settings files"""
+
+    def setUp(self):
+        """Write settings files to a temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.default_path = os.path.join(self.temp_dir.name, "default_settings.json")
+        self.user_path = os.path.join(self.temp_dir.name, "settings.json")
+        self.write(self.default_path, load_settings(user_path=None))
+        self.write(self.user_path, {})
+        self.changes = []
+        self.watcher = ConfigWatcher(self.default_path, self.user_path, on_change=self.changes.append)
+
+    def tearDown(self):
+        """Remove the settings files"""
+        self.temp_dir.cleanup()
+
+    def write(self, path, settings):
+        with open(path, 'w') as f:
+            json.dump(settings, f)
+        # Make each write visible even on file systems with coarse timestamps
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000 * (len(getattr(self, 'changes', [])) + 1)))
+
+    def test_reload_on_change(self):
+        """Test that a changed file swaps in a new snapshot"""
+        self.assertIsNone(self.watcher.check())
+
+        self.write(self.user_path, {'actions': {'open_mails': {'cooldown_minutes': 10}}})
+        snapshot = self.watcher.check()
+
+        self.assertIs(self.watcher.current(), snapshot)
+        self.assertEqual(snapshot.version, 1)
+        self.assertEqual(snapshot.actions['open_mails'].cooldown_minutes, 10)
+        self.assertEqual(self.changes, [snapshot])
+
+    def test_invalid_change_keeps_snapshot(self):
+        """Test that settings which do not validate are not applied"""
+        previous = self.watcher.current()
+        self.write(self.user_path, {'screen': {'mouse_motion': 'teleport'}})
+
+        with self.assertLogs("GravRokBot.Config", level="ERROR"):
+            self.assertIsNone(self.watcher.check())
+        self.assertIs(self.watcher.current(), previous)
+        self.assertEqual(self.changes, [])
+
+    def test_mark_current(self):
+        """Test that files written by the UI itself are not reloaded"""
+        self.write(self.user_path, {'runner': {'refresh_rate_seconds': 30}})
+        self.watcher.mark_current()
+        self.assertIsNone(self.watcher.check())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import os
+import sys
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.cooldown_index import CooldownIndex
+
+class TestCooldownIndex(unittest.TestCase):
+    """Test cases for CooldownIndex class"""
+
+    def setUp(self):
+        """Set up test case with a controllable clock"""
+        self.now = 1000.0
+        self.index = CooldownIndex(clock=lambda: self.now)
+
+    def test_start_and_remaining(self):
+        """Test starting a cooldown and reading the remaining time"""
+        deadline = self.index.start("Alpha", "gather_resources", 60)
+
+        self.assertEqual(deadline, 1060.0)
+        self.assertEqual(self.index.remaining("Alpha", "gather_resources"), 60.0)
+        self.assertFalse(self.index.is_ready("Alpha", "gather_resources"))
+
+        self.now = 1060.0
+        self.assertEqual(self.index.remaining("Alpha", "gather_resources"), 0.0)
+        self.assertTrue(self.index.is_ready("Alpha", "gather_resources"))
+
+        # Unknown actions are ready
+        self.assertTrue(self.index.is_ready("Beta", "gather_resources"))
+
+    def test_restart_replaces_deadline(self):
+        """Test that starting a cooldown again replaces the old deadline"""
+        self.index.start("Alpha", "gather_resources", 60)
+        self.index.start("Alpha", "gather_resources", 10)
+
+        self.assertEqual(self.index.cooldowns("Alpha"), [(1010.0, "gather_resources")])
+
+    def test_next_expiry(self):
+        """Test finding the next cooldown to expire"""
+        self.assertIsNone(self.index.next_expiry())
+
+        self.index.start("Alpha", "gather_resources", 300)
+        self.index.start("Alpha", "open_mails", 120)
+        self.index.start("Beta", "collect_city_resources", 60)
+
+        self.assertEqual(self.index.next_expiry("Alpha"), (1120.0, "Alpha", "open_mails"))
+        self.assertEqual(self.index.next_expiry(), (1060.0, "Beta", "collect_city_resources"))
+
+        self.index.clear("Beta", "collect_city_resources")
+        self.assertEqual(self.index.next_expiry(), (1120.0, "Alpha", "open_mails"))
+        self.assertEqual(self.index.characters(), ["Alpha"])
+
+    def test_pop_expired(self):
+        """Test removing expired cooldowns"""
+        self.index.start("Alpha", "gather_resources", 300)
+        self.index.start("Alpha", "open_mails", 120)
+        self.index.start("Alpha", "material_production", 60)
+
+        self.now = 1120.0
+        self.assertEqual(self.index.pop_expired("Alpha"), ["material_production", "open_mails"])
+        self.assertEqual(self.index.pop_expired("Alpha"), [])
+        self.assertEqual(self.index.cooldowns("Alpha"), [(1300.0, "gather_resources")])
+        self.assertIsNone(self.index.deadline("Alpha", "open_mails"))
+
+    def test_set_wall_deadline(self):
+        """Test converting a stored wall-clock end time to a monotonic deadline"""
+        end_time = datetime.now() + timedelta(minutes=10)
+        self.index.set_wall_deadline("Alpha", "gather_resources", end_time.isoformat())
+
+        self.assertAlmostEqual(self.index.remaining("Alpha", "gather_resources"), 600, delta=1)
+
+if __name__ == '__main__':
+    unittest.main()
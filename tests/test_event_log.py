@@ -0,0 +1,154 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+from datetime import datetime
+
+import numpy as np
+from PIL import Image
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.event_log import EventLog, get_event_log
+from gravrokbot.core.clock import SimulatedClock
+from gravrokbot.analysis.event_report import analyze, find_event_files, read_events, main
+
+class TestEventLog(unittest.TestCase):
+    """Test cases for the structured event log"""
+
+    def setUp(self):
+        """Create an event log writing to a temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.clock = SimulatedClock(start=datetime(2026, 1, 5, 23, 59, 58))
+        self.events = EventLog(self.temp_dir.name, enabled=True, flush_events=3, flush_seconds=60, clock=self.clock)
+
+    def tearDown(self):
+        """Remove the event files"""
+        self.temp_dir.cleanup()
+
+    def read(self, day):
+        with open(os.path.join(self.temp_dir.name, f"events-{day}.jsonl")) as f:
+            return [json.loads(line) for line in f]
+
+    def test_buffered_until_batch_is_full(self):
+        """Test that events are written in batches"""
+        self.events.emit('action_start', 'Open Mails', character='Character1')
+        self.events.emit('match', 'Open Mails', template='mail.png', score=0.93)
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+        self.events.emit('action_finish', 'Open Mails', succeeded=True, seconds=12.5)
+        events = self.read('2026-01-05')
+        self.assertEqual([event['kind'] for event in events], ['action_start', 'match', 'action_finish'])
+        self.assertEqual(events[1]['score'], 0.93)
+        self.assertEqual(events[2]['action'], 'Open Mails')
+
+    def test_flushed_by_age_into_daily_files(self):
+        """Test that old buffered events are written and split by day"""
+        self.events.emit('delay', None, ms=500.0)
+        self.clock.advance(61)
+        self.events.emit('delay', None, ms=700.0)
+
+        self.assertEqual(len(self.read('2026-01-05')), 1)
+        self.assertEqual(len(self.read('2026-01-06')), 1)
+
+    def test_trace_sink(self):
+        """Test that tracer steps become events, without the detailed kinds"""
+        self.events.trace_sink(('Open Mails', 'humanized_delay', None, 0, 1500000))
+        self.events.trace_sink(('Open Mails', 'match', 'mail.png', 0, 2000000))
+        self.events.trace_sink(('Open Mails', 'transition', 'claim', 0, 3000000))
+        self.events.flush()
+
+        events = self.read('2026-01-05')
+        self.assertEqual([(event['kind'], event['ms']) for event in events], [('delay', 1.5), ('transition', 3.0)])
+
+    def test_disabled(self):
+        """Test that a disabled log records nothing"""
+        self.events.enabled = False
+        for _ in range(5):
+            self.events.emit('delay', None, ms=1.0)
+        self.events.flush()
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_screen_match_events(self):
+        """Test that template matches are recorded with score and bounding box"""
+        from gravrokbot.testing.replay import ReplayScreenInteraction
+
+        rng = np.random.default_rng(5)
+        frame = rng.integers(0, 60, size=(200, 300, 3), dtype=np.uint8)
+        template = rng.integers(0, 256, size=(20, 30, 3), dtype=np.uint8)
+        frame[50:70, 100:130] = template
+        template_path = os.path.join(self.temp_dir.name, "button.png")
+        Image.fromarray(template).save(template_path)
+
+        shared = get_event_log()
+        previous = (shared.enabled, shared.directory)
+        shared.configure({'enabled': True, 'directory': os.path.join(self.temp_dir.name, "events")})
+        try:
+            screen = ReplayScreenInteraction({}, [Image.fromarray(frame)])
+            self.assertEqual(screen.find_image(template_path), (115, 60))
+            shared.flush()
+        finally:
+            shared.configure({'enabled': previous[0], 'directory': previous[1]})
+
+        paths = find_event_files(os.path.join(self.temp_dir.name, "events"), days=1)
+        match = [event for event in read_events(paths) if event['kind'] == 'match'][0]
+        self.assertEqual(match['template'], 'button.png')
+        self.assertTrue(match['found'])
+        self.assertGreater(match['score'], 0.99)
+        self.assertEqual(match['bbox'], [100, 50, 30, 20])
+
+class TestEventReport(unittest.TestCase):
+    """Test cases for the event log analysis"""
+
+    def make_events(self):
+        """Two days of runs of two actions"""
+        events = []
+        start = datetime(2026, 1, 5, 12, 0).timestamp()
+        for i in range(8):
+            events.append({'ts': start + i * 21600, 'kind': 'action_finish', 'action': 'Open Mails',
+                           'succeeded': i % 4 != 0, 'seconds': 10 + i})
+            events.append({'ts': start + i * 21600 + 1, 'kind': 'match', 'action': 'Open Mails',
+                           'template': 'mail.png', 'found': i % 2 == 0, 'score': 0.7 + i * 0.03, 'ms': 4.0 + i})
+        events.append({'ts': start + 100, 'kind': 'action_finish', 'action': 'Gather Resources',
+                       'succeeded': True, 'seconds': 30})
+        events.append({'ts': start + 200, 'kind': 'delay', 'action': None, 'ms': 800.0})
+        return events
+
+    def test_analyze(self):
+        """Test throughput, failure rates and distributions"""
+        report = analyze(self.make_events())
+
+        mails = report['actions']['Open Mails']
+        self.assertEqual(mails['runs'], 8)
+        self.assertEqual(mails['failed'], 2)
+        self.assertEqual(mails['failure_rate'], 0.25)
+        self.assertAlmostEqual(mails['runs_per_day'], 8 / (7 * 6 / 24), places=1)
+        self.assertEqual(mails['seconds']['max'], 17)
+
+        self.assertEqual(report['latency_ms']['match']['count'], 8)
+        self.assertEqual(report['latency_ms']['delay']['p50'], 800.0)
+        self.assertEqual(report['templates']['mail.png']['found_rate'], 0.5)
+        self.assertEqual(report['period']['start'], '2026-01-05T12:00:00')
+
+    def test_cli(self):
+        """Test the command line report over the files of the last days"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            today = datetime.now().strftime('%Y-%m-%d')
+            with open(os.path.join(temp_dir, f"events-{today}.jsonl"), 'w') as f:
+                for event in self.make_events():
+                    f.write(json.dumps(event) + "\n")
+                f.write('{"ts": 1, "kind": "match", "tem')
+            with open(os.path.join(temp_dir, "events-2000-01-01.jsonl"), 'w') as f:
+                f.write(json.dumps({'ts': 1, 'kind': 'action_finish', 'action': 'Old', 'succeeded': True}) + "\n")
+
+            output = os.path.join(temp_dir, "report.json")
+            self.assertEqual(main(["--directory", temp_dir, "--days", "7", "--json", output]), 0)
+            with open(output) as f:
+                report = json.load(f)
+
+        self.assertEqual(sorted(report['actions']), ['Gather Resources', 'Open Mails'])
+
+if __name__ == '__main__':
+    unittest.main()
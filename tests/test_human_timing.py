@@ -0,0 +1,67 @@
+import unittest
+import os
+import sys
+from datetime import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.clock import SimulatedClock
+from gravrokbot.core.human_timing import HumanTiming
+
+class TestHumanTiming(unittest.TestCase):
+    """Test cases for HumanTiming class"""
+
+    def setUp(self):
+        """Set up test case with a daytime simulated clock"""
+        self.clock = SimulatedClock(start=datetime(2026, 1, 5, 12, 0))
+
+    def test_seeded_delays_are_reproducible(self):
+        """Test that the same seed gives the same delays"""
+        first = HumanTiming(self.clock, seed=42)
+        second = HumanTiming(self.clock, seed=42)
+
+        delays = [first.get_random_delay(0.5, 1.0) for _ in range(300)]
+        self.assertEqual(delays, [second.get_random_delay(0.5, 1.0) for _ in range(300)])
+        self.assertNotEqual(delays, [HumanTiming(self.clock, seed=7).get_random_delay(0.5, 1.0) for _ in range(300)])
+
+    def test_delays_within_limits(self):
+        """Test that delays stay within the absolute limits"""
+        timing = HumanTiming(self.clock, seed=1)
+        delays = [timing.get_random_delay(0.3, 0.7) for _ in range(1000)]
+
+        self.assertGreaterEqual(min(delays), 0.3)
+        self.assertLessEqual(max(delays), 1.4)
+
+    def test_truncated_normal(self):
+        """Test that truncated normal samples respect the bounds"""
+        timing = HumanTiming(self.clock, seed=3)
+        samples = timing._truncated_normal(0.75, 0.125, 0.5, 1.0, 5000)
+
+        self.assertEqual(len(samples), 5000)
+        self.assertGreaterEqual(samples.min(), 0.5)
+        self.assertLessEqual(samples.max(), 1.0)
+        self.assertAlmostEqual(samples.mean(), 0.75, delta=0.01)
+
+    def test_block_buffering(self):
+        """Test that delays of a range are drawn one block at a time"""
+        timing = HumanTiming(self.clock, seed=5, block_size=16)
+        timing.get_random_delay(0.5, 1.0)
+        self.assertEqual(len(timing._delay_buffers[(0.5, 1.0)]), 15)
+
+        for _ in range(15):
+            timing.get_random_delay(0.5, 1.0)
+        timing.get_random_delay(0.5, 1.0)
+        self.assertEqual(len(timing._delay_buffers[(0.5, 1.0)]), 15)
+
+    def test_fixed_range_and_wait(self):
+        """Test a zero-width range and waiting on the clock"""
+        timing = HumanTiming(self.clock, seed=9)
+        self.assertGreaterEqual(timing.get_random_delay(1.0, 1.0), 1.0)
+
+        waited = timing.wait(2.0, 3.0)
+        self.assertEqual(self.clock.monotonic(), waited)
+        self.assertGreater(timing.get_click_delay(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import os
+import sys
+import types
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.utils.lazy_import import LazyModule, lazy_module, lazy_exports
+from gravrokbot.benchmarks.startup import parse_importtime, time_import, HEAVY_MODULES
+
+class TestLazyImport(unittest.TestCase):
+    """Test cases for deferred imports"""
+
+    def test_module_imported_on_first_use(self):
+        """Test that a lazy module is only imported when an attribute is used"""
+        sys.modules.pop('colorsys', None)
+        colorsys = lazy_module('colorsys')
+
+        self.assertIsInstance(colorsys, LazyModule)
+        self.assertNotIn('colorsys', sys.modules)
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn('colorsys', sys.modules)
+
+    def test_loaded_module_returned_directly(self):
+        """Test that an already imported module is not wrapped"""
+        self.assertIs(lazy_module('os'), os)
+
+    def test_lazy_exports(self):
+        """Test that package members are imported and cached on first access"""
+        package = types.ModuleType('lazy_test_package')
+        package.__getattr__ = lazy_exports('lazy_test_package', {'JSONDecoder': 'json', 'missing': 'json'})
+        sys.modules['lazy_test_package'] = package
+        try:
+            import json
+            self.assertIs(package.JSONDecoder, json.JSONDecoder)
+            self.assertIn('JSONDecoder', vars(package))
+            with self.assertRaises(AttributeError):
+                package.missing
+            with self.assertRaises(AttributeError):
+                package.unknown
+        finally:
+            del sys.modules['lazy_test_package']
+
+    def test_actions_loaded_on_use(self):
+        """Test that the actions package resolves classes by name"""
+        import gravrokbot.actions as actions
+        from gravrokbot.actions.open_mails import OpenMailsAction
+
+        self.assertIs(actions.OpenMailsAction, OpenMailsAction)
+
+class TestStartupBenchmark(unittest.TestCase):
+    """Test cases for the import time benchmark"""
+
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output"""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     numpy.version\n"
+            "import time:      5300 |      48000 |   numpy\n"
+            "import time:       900 |      49500 | gravrokbot.core.rng\n"
+        )
+        modules = parse_importtime(output)
+        self.assertEqual(modules['numpy'], (5300, 48000, 1))
+        self.assertEqual(modules['gravrokbot.core.rng'], (900, 49500, 0))
+        self.assertEqual(modules['numpy.version'][2], 2)
+
+    def test_entry_modules_skip_vision_stack(self):
+        """Test that importing the bot modules does not load the heavy libraries"""
+        for module in ("gravrokbot.core.screen_interaction", "gravrokbot.core.runner_factory", "gravrokbot.actions"):
+            times = time_import(module)
+            self.assertIn(module, times)
+            self.assertEqual([name for name in HEAVY_MODULES if name in times], [], module)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import time
+import logging
+import logging.handlers
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.utils.log_pipeline import setup_logging, stop_logging
+
+class SlowHandler(logging.Handler):
+    """Handler that takes a millisecond per record, like a slow disk or console"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        time.sleep(0.001)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+class CountingArg:
+    """Argument that counts how often it is formatted"""
+
+    def __init__(self):
+        self.formatted_in = []
+
+    def __str__(self):
+        self.formatted_in.append(threading.current_thread().name)
+        return "arg"
+
+class TestLogPipeline(unittest.TestCase):
+    """Test cases for the queued logging pipeline"""
+
+    def setUp(self):
+        """Start a pipeline writing to a temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.listener = setup_logging(level=logging.DEBUG, console_level=logging.CRITICAL,
+                                      log_dir=self.temp_dir.name, max_bytes=4096, backup_count=2,
+                                      logger_names=("GravRokBotTest",))
+        self.slow = SlowHandler()
+        self.listener.handlers = self.listener.handlers + (self.slow,)
+        self.logger = logging.getLogger("GravRokBotTest.Screen")
+
+    def tearDown(self):
+        """Stop the pipeline"""
+        stop_logging()
+        self.temp_dir.cleanup()
+
+    def test_logging_does_not_wait_for_outputs(self):
+        """Test that log calls return long before the slow output has written them"""
+        start = time.perf_counter()
+        for i in range(200):
+            self.logger.debug("Searching for image: %s", i)
+        elapsed = time.perf_counter() - start
+
+        # 200 records take at least 0.2 s in the slow handler
+        self.assertLess(elapsed, 0.1)
+
+        stop_logging()
+        self.assertEqual(len(self.slow.messages), 200)
+        self.assertNotIn(threading.current_thread().name, self.slow.threads)
+
+    def test_arguments_formatted_in_background(self):
+        """Test that %-style arguments are formatted by the listener, not the caller"""
+        arg = CountingArg()
+        self.logger.debug("Found image at %s", arg)
+        stop_logging()
+
+        self.assertEqual(self.slow.messages, ["Found image at arg"])
+        self.assertNotIn(threading.current_thread().name, arg.formatted_in)
+
+    def test_files_rotate_by_size(self):
+        """Test that the log file is rotated once it reaches the maximum size"""
+        for i in range(200):
+            self.logger.info("Line %d of the rotation test", i)
+        stop_logging()
+
+        files = sorted(os.listdir(self.temp_dir.name))
+        self.assertEqual(files, ["gravrokbot.log", "gravrokbot.log.1", "gravrokbot.log.2"])
+        for name in files:
+            self.assertLessEqual(os.path.getsize(os.path.join(self.temp_dir.name, name)), 4096)
+
+    def test_stop_detaches_loggers(self):
+        """Test that stopping removes the queue handler so records do not pile up"""
+        stop_logging()
+        handlers = logging.getLogger("GravRokBotTest").handlers
+        self.assertFalse([handler for handler in handlers if isinstance(handler, logging.handlers.QueueHandler)])
+
+if __name__ == '__main__':
+    unittest.main()
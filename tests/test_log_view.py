@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+from datetime import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.ui.log_view import LogView
+
+class FakeText:
+    """Text widget stand-in that keeps lines and counts widget operations"""
+
+    def __init__(self):
+        self.lines = []
+        self.tags = {}
+        self.inserts = 0
+        self.deletes = 0
+        self.seen = 0
+        self.at_end = True
+
+    def tag_configure(self, tag, **options):
+        self.tags[tag] = options
+
+    def insert(self, index, *chunks):
+        self.inserts += 1
+        for text, tag in zip(chunks[::2], chunks[1::2]):
+            self.lines.append((text, tag))
+
+    def delete(self, start, end):
+        self.deletes += 1
+        if end == 'end':
+            self.lines = []
+        else:
+            del self.lines[:int(end.split('.')[0]) - 1]
+
+    def yview(self):
+        return (0.0, 1.0 if self.at_end else 0.5)
+
+    def see(self, index):
+        self.seen += 1
+
+class TestLogView(unittest.TestCase):
+    """Test cases for the bounded log view"""
+
+    def setUp(self):
+        """Create a log view on a fake widget"""
+        self.text = FakeText()
+        self.view = LogView(self.text, max_lines=100, trim_lines=20)
+        self.now = datetime(2026, 1, 5, 12, 30, 15)
+
+    def test_kinds_tagged_without_scanning(self):
+        """Test that lines are tagged by kind, not by their text"""
+        self.view.append([
+            (self.now, "Start loop number 1", 'loop'),
+            (self.now, "Error saving settings", 'error'),
+            (self.now, "Error in a plain message", 'info'),
+        ])
+
+        self.assertEqual(self.text.inserts, 1)
+        self.assertEqual([tag for _, tag in self.text.lines], ['light_green', 'error_red', ()])
+        self.assertEqual(self.text.lines[0][0], "[12:30:15] Start loop number 1\n")
+        self.assertIn('light_green', self.text.tags)
+
+    def test_trimmed_in_bulk(self):
+        """Test that the widget is trimmed once it grows past the slack"""
+        for i in range(119):
+            self.view.append([(self.now, f"line {i}", 'info')])
+        self.assertEqual(self.text.deletes, 0)
+        self.assertEqual(len(self.text.lines), 119)
+
+        self.view.append([(self.now, "line 119", 'info')])
+        self.view.append([(self.now, "line 120", 'info')])
+
+        self.assertEqual(self.text.deletes, 1)
+        self.assertEqual(len(self.text.lines), 100)
+        self.assertEqual(self.text.lines[0][0], "[12:30:15] line 21\n")
+        self.assertEqual(len(self.view.lines()), 100)
+        self.assertEqual(self.view.lines()[-1], "[12:30:15] line 120\n")
+
+    def test_follows_end_only_when_scrolled_there(self):
+        """Test that the view keeps its position while the user reads older lines"""
+        self.view.append([(self.now, "first", 'info')])
+        self.text.at_end = False
+        self.view.append([(self.now, "second", 'info')])
+
+        self.assertEqual(self.text.seen, 1)
+
+    def test_clear(self):
+        """Test that clearing empties the model and the widget"""
+        self.view.append([(self.now, "first", 'info')])
+        self.view.clear()
+
+        self.assertEqual(self.view.lines(), [])
+        self.assertEqual(self.text.lines, [])
+
+if __name__ == '__main__':
+    unittest.main()
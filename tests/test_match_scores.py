@@ -0,0 +1,160 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+import numpy as np
+from unittest.mock import patch
+from PIL import Image
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.match_scores import BINS, MatchScores, get_match_scores
+from gravrokbot.core.config_snapshot import PACKAGE_DIR, compile_settings, load_settings
+from gravrokbot.testing.replay import ReplayScreenInteraction
+from gravrokbot.analysis.calibrate import propose_threshold, calibrate, write_thresholds
+
+def histogram(scores):
+    """Histogram of scores in the MatchScores layout"""
+    counts = [0] * BINS
+    for score in scores:
+        counts[int(score * BINS)] += 1
+    return counts
+
+class TestMatchScores(unittest.TestCase):
+    """Test cases for match score telemetry"""
+
+    def setUp(self):
+        """Create telemetry writing to a temporary file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "scores", "match_scores.json")
+
+    def tearDown(self):
+        """Remove the temporary files"""
+        self.temp_dir.cleanup()
+
+    def test_record_and_accumulate(self):
+        """Test that histograms are written and added to by the next session"""
+        scores = MatchScores()
+        scores.configure({'enabled': True, 'path': self.path, 'near_miss_floor': 0.6})
+        scores.record('assets/images/farm.png', 0.93, True)
+        scores.record('assets/images/farm.png', 0.71, False)
+        scores.record('assets/images/farm.png', 0.2, False)
+        scores.flush()
+
+        with open(self.path, 'r') as f:
+            saved = json.load(f)['assets/images/farm.png']
+        self.assertEqual(saved['hits'][93], 1)
+        self.assertEqual(saved['near_misses'][71], 1)
+        self.assertEqual(saved['far_misses'], 1)
+
+        next_session = MatchScores()
+        next_session.configure({'enabled': True, 'path': self.path})
+        next_session.record('assets/images/farm.png', 0.93, True)
+        self.assertEqual(next_session.to_dict()['assets/images/farm.png']['hits'][93], 2)
+
+    def test_failed_write_retried(self):
+        """Test that a failed write keeps the histograms pending and leaves no temp file"""
+        scores = MatchScores()
+        scores.configure({'enabled': True, 'path': self.path})
+        scores.record('assets/images/farm.png', 0.93, True)
+
+        with patch('gravrokbot.core.match_scores.os.replace', side_effect=OSError("disk full")):
+            scores.flush()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), [])
+
+        scores.flush()
+        with open(self.path, 'r') as f:
+            self.assertEqual(json.load(f)['assets/images/farm.png']['hits'][93], 1)
+
+    def test_disabled(self):
+        """Test that nothing is recorded or written while disabled"""
+        scores = MatchScores()
+        scores.configure({'path': self.path})
+        scores.record('assets/images/farm.png', 0.93, True)
+        scores.flush()
+
+        self.assertEqual(scores.to_dict(), {})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_screen_thresholds_and_recording(self):
+        """Test that matches use the template's threshold and record their scores"""
+        rng = np.random.default_rng(3)
+        frame = rng.integers(0, 256, size=(120, 160, 3), dtype=np.uint8)
+        template_path = os.path.join(self.temp_dir.name, "button.png")
+        Image.fromarray(frame[20:40, 30:60]).save(template_path)
+
+        screen = ReplayScreenInteraction({
+            'default_confidence': 0.7,
+            'template_thresholds': {'assets/images/farm.png': 0.9}
+        }, [Image.fromarray(frame)])
+        self.assertEqual(screen.confidence_for(os.path.join(PACKAGE_DIR, "assets", "images", "farm.png")), 0.9)
+        self.assertEqual(screen.confidence_for(template_path), 0.7)
+
+        telemetry = get_match_scores()
+        telemetry.configure({'enabled': True, 'path': self.path})
+        try:
+            self.assertEqual(screen.find_image(template_path), (45, 30))
+        finally:
+            telemetry.enabled = False
+            # Write now, not at exit when the directory is gone
+            telemetry.flush()
+        recorded = telemetry.to_dict()[screen.template_key(template_path)]
+        self.assertEqual(sum(recorded['hits']), 1)
+        self.assertEqual(recorded['hits'][BINS - 1], 1)
+
+class TestCalibrate(unittest.TestCase):
+    """Test cases for threshold calibration"""
+
+    def test_strict_threshold_lowered(self):
+        """Test that a template the screen shows at lower scores gets a lower threshold"""
+        absent = [0.52 + 0.001 * i for i in range(60)]
+        present = [0.74 + 0.001 * i for i in range(40)]
+        proposal = propose_threshold({'hits': [0] * BINS, 'near_misses': histogram(absent + present)}, 0.8)
+
+        self.assertEqual(proposal['reason'], 'gap')
+        self.assertTrue(0.6 < proposal['proposed'] < 0.74, proposal)
+
+    def test_loose_threshold_raised(self):
+        """Test that false hits below the true hits raise the threshold"""
+        false_hits = [0.81 + 0.001 * i for i in range(20)]
+        true_hits = [0.95 + 0.001 * i for i in range(30)]
+        proposal = propose_threshold({'hits': histogram(false_hits + true_hits), 'near_misses': [0] * BINS}, 0.8)
+
+        self.assertTrue(0.83 < proposal['proposed'] < 0.95, proposal)
+
+    def test_no_proposal(self):
+        """Test that small or single-cluster samples keep the current threshold"""
+        few = propose_threshold({'hits': histogram([0.9] * 5)}, 0.8)
+        self.assertIsNone(few['proposed'])
+        self.assertEqual(few['reason'], 'too few samples')
+
+        single = propose_threshold({'hits': histogram([0.95] * 50)}, 0.8)
+        self.assertIsNone(single['proposed'])
+        self.assertEqual(single['reason'], 'single cluster')
+
+    def test_write_thresholds(self):
+        """Test that proposals are stored in the user settings and validate"""
+        histograms = {
+            'assets/images/farm.png': {'hits': histogram([0.81] * 20 + [0.96] * 30)},
+            'assets/images/quarry.png': {'hits': histogram([0.9] * 3)}
+        }
+        proposals = calibrate(histograms, {}, 0.8)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = os.path.join(temp_dir, "settings.json")
+            with open(settings_path, 'w') as f:
+                json.dump({'runner': {'refresh_rate_seconds': 30}}, f)
+
+            self.assertEqual(write_thresholds(proposals, settings_path), 1)
+            settings = load_settings(user_path=settings_path)
+
+        self.assertEqual(settings['runner']['refresh_rate_seconds'], 30)
+        self.assertEqual(settings['screen']['template_thresholds'],
+                         {'assets/images/farm.png': proposals['assets/images/farm.png']['proposed']})
+        compile_settings(settings)
+
+if __name__ == '__main__':
+    unittest.main()
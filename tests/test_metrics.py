@@ -0,0 +1,77 @@
+import unittest
+import os
+import sys
+import urllib.request
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.metrics import MetricsRegistry
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for MetricsRegistry class"""
+
+    def setUp(self):
+        """Set up test case with an enabled registry"""
+        self.registry = MetricsRegistry(enabled=True)
+
+    def tearDown(self):
+        """Stop the endpoint if a test started it"""
+        self.registry.stop_server()
+
+    def test_counters(self):
+        """Test counter increments per label set"""
+        self.registry.inc('gravrokbot_actions_executed_total', character="Alpha", action="Open Mails")
+        self.registry.inc('gravrokbot_actions_executed_total', character="Alpha", action="Open Mails")
+        self.registry.inc('gravrokbot_actions_executed_total', character="Beta", action="Open Mails")
+
+        self.assertEqual(self.registry.value('gravrokbot_actions_executed_total', character="Alpha", action="Open Mails"), 2)
+        self.assertEqual(self.registry.value('gravrokbot_actions_executed_total', action="Open Mails", character="Beta"), 1)
+
+    def test_no_increments_lost_without_reads(self):
+        """Test that the writer folds a long queue instead of dropping updates"""
+        registry = MetricsRegistry(enabled=True, fold_threshold=100)
+        for _ in range(1000):
+            registry.inc('gravrokbot_loops_total')
+
+        self.assertLess(len(registry._pending), 100)
+        self.assertEqual(registry.value('gravrokbot_loops_total'), 1000)
+
+    def test_disabled_registry(self):
+        """Test that a disabled registry ignores updates"""
+        registry = MetricsRegistry()
+        registry.inc('gravrokbot_loops_total')
+        self.assertEqual(registry.value('gravrokbot_loops_total'), 0)
+
+    def test_render_histogram(self):
+        """Test the text format of a histogram"""
+        self.registry.observe('gravrokbot_match_score', 0.82, template="button.png")
+        self.registry.observe('gravrokbot_match_score', 0.97, template="button.png")
+
+        text = self.registry.render()
+        self.assertIn('# TYPE gravrokbot_match_score histogram', text)
+        self.assertIn('gravrokbot_match_score_bucket{template="button.png",le="0.8"} 0', text)
+        self.assertIn('gravrokbot_match_score_bucket{template="button.png",le="0.85"} 1', text)
+        self.assertIn('gravrokbot_match_score_bucket{template="button.png",le="+Inf"} 2', text)
+        self.assertIn('gravrokbot_match_score_count{template="button.png"} 2', text)
+
+    def test_trace_sink(self):
+        """Test that traced capture steps become latency observations"""
+        self.registry.trace_sink(("Open Mails", 'capture', None, 0, 20_000_000))
+        self.registry.trace_sink(("Open Mails", 'input', None, 0, 20_000_000))
+
+        text = self.registry.render()
+        self.assertIn('gravrokbot_capture_seconds_count 1', text)
+        self.assertIn('gravrokbot_capture_seconds_bucket{le="0.025"} 1', text)
+
+    def test_http_endpoint(self):
+        """Test serving the metrics over HTTP"""
+        self.registry.inc('gravrokbot_loops_total')
+        port = self.registry.start_server(port=0)
+
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode('utf-8')
+        self.assertIn('gravrokbot_loops_total 1', body)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+import os
+import sys
+import time
+from unittest.mock import patch, MagicMock
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.mouse_motion import MouseMotion, minimum_jerk, plan_path
+from gravrokbot.core.clock import SimulatedClock, SystemClock
+
+class TestMousePath(unittest.TestCase):
+    """Test cases for mouse path planning"""
+
+    def test_minimum_jerk_profile(self):
+        """Test that the profile starts and ends at rest and is monotonic"""
+        t = np.linspace(0, 1, 101)
+        profile = minimum_jerk(t)
+
+        self.assertEqual(profile[0], 0)
+        self.assertAlmostEqual(profile[-1], 1)
+        self.assertAlmostEqual(profile[50], 0.5)
+        self.assertTrue(np.all(np.diff(profile) >= 0))
+        # Slow at both ends, fastest in the middle
+        steps = np.diff(profile)
+        self.assertLess(steps[0], steps[50])
+        self.assertLess(steps[-1], steps[50])
+
+    def test_path_shape(self):
+        """Test that the path ends on target, bends within bounds and has no repeated points"""
+        rng = np.random.default_rng(3)
+        points, times = plan_path((100, 100), (700, 400), 0.5, rng, rate=120, curvature=0.15)
+
+        self.assertEqual(points[0].tolist(), [100, 100])
+        self.assertEqual(points[-1].tolist(), [700, 400])
+        self.assertEqual(len(points), len(times))
+        self.assertAlmostEqual(times[-1], 0.5)
+        self.assertTrue(np.all(np.diff(times) > 0))
+        self.assertTrue(np.all(np.any(np.diff(points, axis=0) != 0, axis=1)))
+
+        # Distance from the straight line stays within the curvature bound
+        delta = np.array([600, 300])
+        normal = np.array([-delta[1], delta[0]]) / np.hypot(*delta)
+        off_line = np.abs((points - [100, 100]) @ normal)
+        self.assertLess(off_line.max(), 0.15 * np.hypot(*delta) + 1)
+
+    def test_zero_distance(self):
+        """Test that a move to the current position is a single point"""
+        points, times = plan_path((50, 50), (50, 50), 0.3, np.random.default_rng(0))
+        self.assertEqual(points.tolist(), [[50, 50]])
+
+class TestMouseMotion(unittest.TestCase):
+    """Test cases for streaming mouse paths"""
+
+    def test_streams_path_in_duration(self):
+        """Test that the gesture ends on target in about the planned duration"""
+        moves = []
+        motion = MouseMotion(lambda x, y: moves.append((x, y)), lambda: (0, 0),
+                             clock=SystemClock(), rng=np.random.default_rng(1), rate=200)
+
+        start = time.perf_counter()
+        sent = motion.move_to(400, 300, 0.1)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(moves[-1], (400, 300))
+        self.assertEqual(sent, len(moves))
+        self.assertGreater(sent, 5)
+        self.assertGreaterEqual(elapsed, 0.095)
+        self.assertLess(elapsed, 0.2)
+
+    def test_slow_backend_drops_points(self):
+        """Test that points behind schedule are dropped instead of stretching the gesture"""
+        moves = []
+
+        def slow_move(x, y):
+            moves.append((x, y))
+            time.sleep(0.01)
+
+        motion = MouseMotion(slow_move, lambda: (0, 0), clock=SystemClock(),
+                             rng=np.random.default_rng(1), rate=1000)
+        start = time.perf_counter()
+        motion.move_to(800, 600, 0.1)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(moves[-1], (800, 600))
+        self.assertLess(len(moves), 50)
+        self.assertLess(elapsed, 0.25)
+
+    def test_simulated_clock_jumps(self):
+        """Test that a simulated clock takes the movement time and the cursor jumps"""
+        clock = SimulatedClock()
+        move = MagicMock()
+        motion = MouseMotion(move, lambda: (0, 0), clock=clock)
+
+        self.assertEqual(motion.move_to(10, 20, 0.4), 1)
+        move.assert_called_once_with(10, 20)
+        self.assertAlmostEqual(clock.monotonic(), 0.4)
+
+    def test_screen_interaction_curved_click(self):
+        """Test that curved motion streams moves and clicks without PyAutoGUI's pause"""
+        from gravrokbot.core.screen_interaction import ScreenInteraction
+
+        mock_pyautogui = MagicMock()
+        mock_pyautogui.size.return_value = (1600, 900)
+        mock_pyautogui.position.return_value = (0, 0)
+        with patch('gravrokbot.core.screen_interaction.pyautogui', mock_pyautogui):
+            screen = ScreenInteraction({'mouse_motion': 'curved', 'mouse_motion_rate': 60})
+            screen.clock = SimulatedClock()
+            screen.mouse_motion.clock = SystemClock()
+            screen.mouse_motion.move_to(500, 200, 0.05)
+            screen.humanized_click(800, 450, randomize=False)
+
+        self.assertGreater(mock_pyautogui.moveTo.call_count, 2)
+        mock_pyautogui.moveTo.assert_called_with(800, 450, _pause=False)
+        mock_pyautogui.click.assert_called_once_with(button='left', _pause=False)
+
+if __name__ == '__main__':
+    unittest.main()
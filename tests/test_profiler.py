@@ -0,0 +1,81 @@
+import unittest
+import os
+import sys
+import time
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.profiler import StackSampler, LoopProfiler
+
+def busy_work(seconds):
+    """Spin the CPU for a number of seconds"""
+    end_time = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end_time:
+        total += sum(range(100))
+    return total
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for the loop profiler"""
+
+    def setUp(self):
+        """Set up test case with a temporary output directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the output directory"""
+        self.temp_dir.cleanup()
+
+    def test_sampler_collapsed_stacks(self):
+        """Test that samples are folded into collapsed stacks"""
+        sampler = StackSampler(thread_id=0)
+        sampler.sample(sys._getframe())
+        sampler.sample(sys._getframe())
+
+        stack, count = sampler.stacks.most_common(1)[0]
+        self.assertEqual(count, 2)
+        self.assertIn("test_sampler_collapsed_stacks (test_profiler.py:", stack.split(";")[-1])
+        self.assertEqual(sampler.top_functions(1)[0][2], 1.0)
+
+    def test_sampling_loops(self):
+        """Test profiling loops with the stack sampler"""
+        profiler = LoopProfiler(2, mode='sampling', output_dir=self.temp_dir.name, interval=0.001)
+
+        profiler.begin_loop()
+        busy_work(0.1)
+        self.assertFalse(profiler.end_loop())
+        profiler.begin_loop()
+        busy_work(0.1)
+        self.assertTrue(profiler.end_loop())
+
+        self.assertTrue(profiler.output_path.endswith(".collapsed"))
+        with open(profiler.output_path) as f:
+            content = f.read()
+        self.assertIn("busy_work", content)
+
+    def test_cprofile_loops(self):
+        """Test profiling loops with cProfile"""
+        profiler = LoopProfiler(1, mode='cprofile', output_dir=self.temp_dir.name)
+
+        profiler.begin_loop()
+        busy_work(0.05)
+        self.assertTrue(profiler.end_loop())
+
+        self.assertTrue(profiler.output_path.endswith(".prof"))
+        self.assertTrue(os.path.exists(profiler.output_path))
+
+    def test_finish_before_any_loop(self):
+        """Test stopping a profiler that never ran"""
+        profiler = LoopProfiler(3, output_dir=self.temp_dir.name)
+        self.assertIsNone(profiler.finish())
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_unknown_mode(self):
+        """Test that an unknown mode is rejected"""
+        with self.assertRaises(ValueError):
+            LoopProfiler(1, mode='tracing')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+import numpy as np
+from PIL import Image
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.testing.replay import load_session, load_settings, replay_session, find_sessions
+
+# Template name and its position in the frame where it appears
+STEPS = [
+    ("resource_icon", (100, 80)),
+    ("gather_button", (300, 200)),
+    ("march_button", (500, 120)),
+    ("confirmation", (200, 300))
+]
+
+class TestReplay(unittest.TestCase):
+    """Test cases for the recorded-session replay harness"""
+
+    def setUp(self):
+        """Record a synthetic gather resources session"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.session_dir = os.path.join(self.temp_dir.name, "gather_ok")
+        os.makedirs(self.session_dir)
+
+        rng = np.random.default_rng(7)
+        background = rng.integers(0, 60, size=(400, 640, 3), dtype=np.uint8)
+        frames = []
+        images = {}
+        for index, (name, (x, y)) in enumerate(STEPS):
+            template = rng.integers(0, 256, size=(32, 48, 3), dtype=np.uint8)
+            Image.fromarray(template).save(os.path.join(self.session_dir, f"{name}.png"))
+            images[name] = f"{name}.png"
+
+            frame = background.copy()
+            frame[y:y + 32, x:x + 48] = template
+            frame_name = f"{index:03d}.png"
+            Image.fromarray(frame).save(os.path.join(self.session_dir, frame_name))
+            frames.append(frame_name)
+
+        self.session = {
+            "action": "gather_resources",
+            "frames": frames,
+            "images": images,
+            "expect": {"succeeded": True, "clicks": [[124, 96], [324, 216], [524, 136]]}
+        }
+        self.write_session()
+
+    def tearDown(self):
+        """Remove the recorded session"""
+        self.temp_dir.cleanup()
+
+    def write_session(self):
+        """Write session.json for the current session settings"""
+        with open(os.path.join(self.session_dir, "session.json"), 'w') as f:
+            json.dump(self.session, f)
+
+    def test_replay_succeeds(self):
+        """Test replaying a session where every step is on screen"""
+        report = replay_session(load_session(self.session_dir), load_settings(), repeat=2)
+
+        self.assertTrue(report['succeeded'])
+        self.assertTrue(report['correct'])
+        self.assertEqual(report['runs'], 2)
+        self.assertEqual(report['matches'], 6)
+        self.assertEqual(report['captures'], 6)
+        self.assertEqual(report['frames_used'], 4)
+
+    def test_replay_detects_wrong_outcome(self):
+        """Test that a session ending differently than recorded is reported"""
+        self.session["frames"] = self.session["frames"][:2]
+        self.write_session()
+
+        report = replay_session(load_session(self.session_dir), load_settings())
+
+        self.assertFalse(report['succeeded'])
+        self.assertFalse(report['correct'])
+
+    def test_find_sessions(self):
+        """Test finding sessions in a parent directory"""
+        self.assertEqual(find_sessions([self.temp_dir.name]), [self.session_dir])
+        self.assertEqual(find_sessions([self.session_dir]), [self.session_dir])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.rng import RandomService, get_random_service, seed_session
+from gravrokbot.core.human_timing import HumanTiming
+
+class TestRandomService(unittest.TestCase):
+    """Test cases for RandomService class"""
+
+    def test_same_seed_same_streams(self):
+        """Test that a seed reproduces every stream"""
+        first = RandomService(1234)
+        second = RandomService(1234)
+
+        self.assertEqual(
+            [first.random('screen').random() for _ in range(3)],
+            [second.random('screen').random() for _ in range(3)]
+        )
+        self.assertEqual(list(first.generator('human_timing').random(5)), list(second.generator('human_timing').random(5)))
+
+    def test_streams_are_independent(self):
+        """Test that subsystems and instances get different streams"""
+        service = RandomService(1234)
+
+        screen = service.random('screen').random()
+        runner = service.random('runner').random()
+        second_screen = service.random('screen').random()
+
+        self.assertNotEqual(screen, runner)
+        self.assertNotEqual(screen, second_screen)
+
+    def test_random_seed_is_recorded(self):
+        """Test that a seed is chosen and kept when none is given"""
+        service = RandomService()
+        self.assertIsInstance(service.seed, int)
+        self.assertEqual(RandomService(service.seed).random('runner').random(), service.random('runner').random())
+
+    def test_seed_session(self):
+        """Test starting a session and logging its seed"""
+        with patch('gravrokbot.core.rng.logging.getLogger') as get_logger:
+            service = seed_session(99)
+
+        self.assertIs(get_random_service(), service)
+        self.assertEqual(service.seed, 99)
+        get_logger.return_value.info.assert_called_once_with("Random seed: 99")
+
+    def test_human_timing_uses_session(self):
+        """Test that human timing delays follow the session seed"""
+        seed_session(5)
+        first = [HumanTiming().get_random_delay(0.5, 1.0) for _ in range(3)]
+        seed_session(5)
+        second = [HumanTiming().get_random_delay(0.5, 1.0) for _ in range(3)]
+
+        self.assertEqual(first, second)
+
+if __name__ == '__main__':
+    unittest.main()
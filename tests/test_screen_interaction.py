@@ -55,19 +55,21 @@ class TestScreenInteraction(unittest.TestCase):
         """Test find_image method"""
         # Set up mock
         mock_location = (800, 450)
-        self.mock_pyautogui.locateCenterOnScreen.return_value = mock_location
+        self.mock_pyautogui.center.return_value = mock_location
         
         # Call method
         image_path = "test_image.png"
         with patch('os.path.exists', return_value=True):
             result = self.screen.find_image(image_path)
         
-        # Verify image was searched
-        self.mock_pyautogui.locateCenterOnScreen.assert_called_once()
+        # Verify image was searched in a screenshot taken first
+        self.mock_pyautogui.screenshot.assert_called_once()
+        self.mock_pyautogui.locate.assert_called_once()
+        self.assertIs(self.mock_pyautogui.locate.call_args[0][1], self.mock_pyautogui.screenshot.return_value)
         self.assertEqual(result, mock_location)
         
         # Test with image not found
-        self.mock_pyautogui.locateCenterOnScreen.return_value = None
+        self.mock_pyautogui.locate.return_value = None
         with patch('os.path.exists', return_value=True):
             result = self.screen.find_image(image_path)
         self.assertIsNone(result)
@@ -0,0 +1,186 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.sqlite_store import SQLiteStateStore, JSON_MIGRATED_KEY
+
+class TestSQLiteStateStore(unittest.TestCase):
+    """Test cases for SQLiteStateStore class"""
+
+    def setUp(self):
+        """Set up test case"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = SQLiteStateStore(os.path.join(self.temp_dir, "state.db"))
+
+    def tearDown(self):
+        """Clean up after test case"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_wal_mode(self):
+        """Test that the database uses write-ahead logging"""
+        mode = self.store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_characters(self):
+        """Test adding characters and tracking the current one"""
+        self.assertTrue(self.store.is_empty())
+
+        self.store.add_character("Alpha")
+        self.store.add_character("Beta")
+        self.store.add_character("Alpha")
+        self.store.set_current_character("Beta")
+
+        self.assertFalse(self.store.is_empty())
+        self.assertEqual(self.store.get_characters(), ["Alpha", "Beta"])
+        self.assertEqual(self.store.get_current_character(), "Beta")
+
+        self.store.set_current_character("Alpha")
+        self.assertEqual(self.store.get_current_character(), "Alpha")
+
+    def test_action_settings(self):
+        """Test storing and updating action settings"""
+        self.store.set_action_settings("Alpha", "gather_resources", True, 60)
+        self.store.set_action_settings("Alpha", "gather_resources", False, 45)
+
+        self.assertEqual(
+            self.store.get_action_settings("Alpha"),
+            {"gather_resources": {"enabled": False, "cooldown_minutes": 45}}
+        )
+
+    def test_next_due_across_characters(self):
+        """Test finding the next due action across all characters"""
+        self.store.set_action_settings("Alpha", "gather_resources", True, 60)
+        self.store.set_action_settings("Alpha", "open_mails", False, 30)
+        self.store.set_action_settings("Beta", "gather_resources", True, 60)
+        self.store.set_action_settings("Beta", "collect_city_resources", True, 30)
+
+        self.store.start_cooldown("Alpha", "gather_resources", 600, now=1000)
+        self.store.start_cooldown("Beta", "gather_resources", 300, now=1000)
+
+        # Actions without a cooldown are due first, disabled actions are ignored
+        self.assertEqual(
+            self.store.next_due(limit=3),
+            [
+                ("Beta", "collect_city_resources", 0),
+                ("Beta", "gather_resources", 1300),
+                ("Alpha", "gather_resources", 1600)
+            ]
+        )
+        self.assertEqual(
+            self.store.due_actions(now=1400),
+            [("Beta", "collect_city_resources", 0), ("Beta", "gather_resources", 1300)]
+        )
+
+        self.store.clear_cooldown("Alpha", "gather_resources")
+        self.assertIsNone(self.store.get_cooldown_deadline("Alpha", "gather_resources"))
+        self.assertEqual(self.store.get_cooldown_deadline("Beta", "gather_resources"), 1300)
+
+    def test_execution_history(self):
+        """Test recording and querying execution history"""
+        self.store.record_execution("Alpha", "gather_resources", 100, 110, True)
+        self.store.record_execution("Alpha", "open_mails", 200, 205, False)
+        self.store.record_execution("Alpha", "gather_resources", 300, 312, False)
+
+        history = self.store.get_history("Alpha", action_key="gather_resources")
+        self.assertEqual([run["started_at"] for run in history], [100, 300])
+        self.assertEqual([run["succeeded"] for run in history], [True, False])
+
+        self.assertEqual(len(self.store.get_history("Alpha", since=200)), 2)
+        self.assertEqual(self.store.get_history("Beta"), [])
+
+    def test_migrate_from_json(self):
+        """Test importing the existing JSON state files"""
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        character_settings = {
+            "characters": {
+                "Alpha": {"actions": {"gather_resources": {"enabled": True, "cooldown_minutes": 79}}},
+                "Beta": {"actions": {"open_mails": {"enabled": False, "cooldown_minutes": 30}}}
+            },
+            "current_character": "Beta"
+        }
+        cooldown_states = {
+            "Alpha": {
+                "gather_resources": {
+                    "is_active": True,
+                    "start_time": start.isoformat(),
+                    "end_time": (start + timedelta(minutes=79)).isoformat()
+                }
+            },
+            "Beta": {"open_mails": {"is_active": False, "start_time": None, "end_time": None}},
+            "start_game": {"is_active": False, "start_time": None, "end_time": None}
+        }
+
+        character_path = os.path.join(self.temp_dir, "character_settings.json")
+        cooldown_path = os.path.join(self.temp_dir, "cooldown_states.json")
+        with open(character_path, 'w') as f:
+            json.dump(character_settings, f)
+        with open(cooldown_path, 'w') as f:
+            json.dump(cooldown_states, f)
+
+        self.store.migrate_from_json(character_path, cooldown_path)
+
+        self.assertEqual(self.store.export_character_settings(), character_settings)
+        self.assertEqual(
+            self.store.get_cooldown_deadline("Alpha", "gather_resources"),
+            (start + timedelta(minutes=79)).timestamp()
+        )
+
+        exported = self.store.export_cooldown_states()
+        self.assertEqual(exported["Alpha"], cooldown_states["Alpha"])
+        self.assertEqual(exported["Beta"], cooldown_states["Beta"])
+
+        # Later starts keep the database state even if the files still exist
+        self.store.set_action_settings("Alpha", "gather_resources", False, 60)
+        self.assertFalse(self.store.migrate_from_json(character_path, cooldown_path))
+        self.assertEqual(self.store.get_action_settings("Alpha")["gather_resources"]["cooldown_minutes"], 60)
+
+    def test_migrate_from_json_is_atomic(self):
+        """Test that a malformed entry rolls back the whole import"""
+        character_path = os.path.join(self.temp_dir, "character_settings.json")
+        cooldown_path = os.path.join(self.temp_dir, "cooldown_states.json")
+        with open(character_path, 'w') as f:
+            json.dump({"characters": {"Alpha": {"actions": {}}}, "current_character": "Alpha"}, f)
+        with open(cooldown_path, 'w') as f:
+            json.dump({"Alpha": {"open_mails": {"is_active": True, "start_time": "soon", "end_time": "later"}}}, f)
+
+        with self.assertRaises(ValueError):
+            self.store.migrate_from_json(character_path, cooldown_path)
+        self.assertTrue(self.store.is_empty())
+        self.assertIsNone(self.store.get_meta(JSON_MIGRATED_KEY))
+
+        # The next start imports the repaired files
+        os.remove(cooldown_path)
+        self.assertTrue(self.store.migrate_from_json(character_path, cooldown_path))
+        self.assertEqual(self.store.get_characters(), ["Alpha"])
+
+    def test_save_character_settings(self):
+        """Test that every character is stored and removed characters are deleted"""
+        self.store.set_action_settings("Gamma", "open_mails", True, 30)
+        self.store.record_execution("Gamma", "open_mails", 100, 110, True)
+        character_settings = {
+            "characters": {
+                "Alpha": {"actions": {"gather_resources": {"enabled": True, "cooldown_minutes": 79}}},
+                "Beta": {"actions": {"open_mails": {"enabled": False, "cooldown_minutes": 30}}}
+            },
+            "current_character": "Alpha"
+        }
+
+        self.store.save_character_settings(character_settings)
+
+        self.assertEqual(self.store.export_character_settings(), character_settings)
+        self.assertEqual(self.store.get_history("Gamma"), [])
+
+        # A character added again gets a new row
+        self.store.set_action_settings("Gamma", "open_mails", False, 15)
+        self.assertEqual(self.store.get_characters(), ["Alpha", "Beta", "Gamma"])
+
+if __name__ == '__main__':
+    unittest.main()
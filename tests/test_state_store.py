@@ -0,0 +1,129 @@
+import unittest
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.state_store import JsonStateStore
+
+class TestJsonStateStore(unittest.TestCase):
+    """Test cases for JsonStateStore class"""
+
+    def setUp(self):
+        """Set up test case"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "state.json")
+
+        # Collect scheduled writes instead of running them on a timer
+        self.scheduled = []
+        self.store = JsonStateStore(
+            self.path,
+            debounce_seconds=0.5,
+            scheduler=lambda delay, callback: self.scheduled.append((delay, callback))
+        )
+
+    def tearDown(self):
+        """Clean up after test case"""
+        self.store.flush()
+        shutil.rmtree(self.temp_dir)
+
+    def run_scheduled(self):
+        """Run all scheduled writes"""
+        scheduled, self.scheduled = self.scheduled, []
+        for _, callback in scheduled:
+            callback()
+
+    def test_load_missing_file(self):
+        """Test loading when the file does not exist yet"""
+        self.assertEqual(self.store.load({}), {})
+
+    def test_saves_are_coalesced(self):
+        """Test that several saves before the debounce expires write once"""
+        state = {"count": 0}
+        for i in range(10):
+            state["count"] = i
+            self.store.save(state)
+
+        # Only one write is scheduled and nothing is written yet
+        self.assertEqual(len(self.scheduled), 1)
+        self.assertEqual(self.scheduled[0][0], 0.5)
+        self.assertFalse(os.path.exists(self.path))
+
+        self.run_scheduled()
+
+        self.assertEqual(self.store.write_count, 1)
+        self.assertEqual(self.store.load(), {"count": 9})
+
+        # A later save schedules a new write
+        self.store.save({"count": 10})
+        self.assertEqual(len(self.scheduled), 1)
+
+    def test_flush_writes_immediately(self):
+        """Test that flush writes pending data without waiting"""
+        self.store.save({"a": 1})
+        self.store.flush()
+
+        self.assertEqual(self.store.load(), {"a": 1})
+
+        # The scheduled write has nothing left to do
+        self.run_scheduled()
+        self.assertEqual(self.store.write_count, 1)
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        """Test that writes replace the file without leaving temp files behind"""
+        self.store.save({"a": 1})
+        self.store.flush()
+        self.store.save({"a": 2})
+        self.store.flush()
+
+        self.assertEqual(os.listdir(self.temp_dir), ["state.json"])
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), {"a": 2})
+
+    def test_failed_write_keeps_previous_file(self):
+        """Test that a failed write does not corrupt the existing file"""
+        self.store.save({"a": 1})
+        self.store.flush()
+
+        # Sets are not JSON serializable
+        self.store.save({"a": {1, 2}})
+        self.store.flush()
+
+        self.assertEqual(self.store.load(), {"a": 1})
+        self.assertEqual(os.listdir(self.temp_dir), ["state.json"])
+
+    def test_concurrent_flushes_keep_order(self):
+        """Test that a flush started later cannot be overwritten by an earlier one"""
+        writing = threading.Event()
+        release = threading.Event()
+        write_atomic = self.store._write_atomic
+
+        def slow_write(data):
+            if data == {"version": 1}:
+                writing.set()
+                release.wait(5)
+            write_atomic(data)
+        self.store._write_atomic = slow_write
+
+        self.store.save({"version": 1})
+        first = threading.Thread(target=self.store.flush)
+        first.start()
+        self.assertTrue(writing.wait(5))
+
+        self.store.save({"version": 2})
+        second = threading.Thread(target=self.store.flush)
+        second.start()
+        second.join(0.2)
+        release.set()
+        first.join(5)
+        second.join(5)
+
+        self.assertEqual(self.store.load(), {"version": 2})
+
+if __name__ == '__main__':
+    unittest.main()
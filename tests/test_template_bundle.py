@@ -0,0 +1,95 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+import cv2
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.template_bundle import TemplateBundle, build_bundle, bundle_key, referenced_templates
+from gravrokbot.core.template_matcher import TemplateMatcher
+from gravrokbot.core.config_snapshot import compile_settings, load_settings
+
+class TestTemplateBundle(unittest.TestCase):
+    """Test cases for the memory-mapped template bundle"""
+
+    def setUp(self):
+        """Write two templates and pack them"""
+        self.temp_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(0)
+        self.frame = rng.integers(0, 255, size=(120, 160, 3), dtype=np.uint8)
+        self.template = self.frame[30:50, 70:95].copy()
+
+        self.images_dir = os.path.join(self.temp_dir, "assets", "images")
+        os.makedirs(self.images_dir)
+        self.template_path = os.path.join(self.images_dir, "button.png")
+        self.other_path = os.path.join(self.images_dir, "icon.png")
+        cv2.imwrite(self.template_path, cv2.cvtColor(self.template, cv2.COLOR_RGB2BGR))
+        cv2.imwrite(self.other_path, rng.integers(0, 255, size=(7, 9, 3), dtype=np.uint8))
+
+        self.bundle_path = os.path.join(self.temp_dir, "templates.bundle")
+        self.keys = build_bundle(
+            [self.template_path, self.other_path, os.path.join(self.images_dir, "missing.png")],
+            self.bundle_path,
+            metadata={self.other_path: {'roi': [0, 0, 100, 50], 'scale': 0.5}},
+            base_dir=self.temp_dir
+        )
+        self.bundle = TemplateBundle(self.bundle_path, base_dir=self.temp_dir)
+
+    def tearDown(self):
+        """Unmap the bundle and remove the files"""
+        self.bundle.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_packed_templates_match_decoded_files(self):
+        """Test that packed arrays equal the decoded image files"""
+        self.assertEqual(self.keys, ['assets/images/button.png', 'assets/images/icon.png'])
+
+        gray = self.bundle.get(self.template_path)
+        bgr = self.bundle.get(self.template_path, grayscale=False)
+        np.testing.assert_array_equal(gray, cv2.imread(self.template_path, cv2.IMREAD_GRAYSCALE))
+        np.testing.assert_array_equal(bgr, cv2.imread(self.template_path, cv2.IMREAD_COLOR))
+        self.assertFalse(gray.flags.writeable)
+        del gray, bgr
+
+        self.assertEqual(self.bundle.size(self.other_path), (9, 7))
+        self.assertEqual(self.bundle.metadata(self.other_path), {'roi': [0, 0, 100, 50], 'scale': 0.5})
+        self.assertNotIn(os.path.join(self.images_dir, "missing.png"), self.bundle)
+
+    def test_changed_file_not_served(self):
+        """Test that a template edited after the build is read from its file"""
+        stat = os.stat(self.template_path)
+        os.utime(self.template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        self.assertIsNone(self.bundle.get(self.template_path))
+        self.assertIsNotNone(self.bundle.get(self.other_path))
+
+    def test_packed_copy_used_without_file(self):
+        """Test that the bundle serves templates whose files are not deployed"""
+        os.remove(self.template_path)
+        matcher = TemplateMatcher(bundle=self.bundle)
+
+        location, score = matcher.find(self.frame, self.template_path)
+        self.assertEqual(location, (82, 40))
+        self.assertGreater(score, 0.99)
+        matcher.templates.clear()
+
+    def test_not_a_bundle(self):
+        """Test that other files are rejected"""
+        with self.assertRaises(ValueError):
+            TemplateBundle(self.template_path)
+
+    def test_referenced_templates(self):
+        """Test collecting the templates of all actions"""
+        snapshot = compile_settings(load_settings(user_path=None))
+        paths = referenced_templates(snapshot)
+
+        self.assertEqual(len(paths), len(set(paths)))
+        self.assertIn('assets/images/gather_button.png', [bundle_key(path) for path in paths])
+        self.assertIn('assets/images/farm.png', [bundle_key(path) for path in paths])
+
+if __name__ == '__main__':
+    unittest.main()
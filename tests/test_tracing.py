@@ -0,0 +1,105 @@
+import unittest
+import os
+import sys
+import time
+import json
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.tracing import StepTracer
+
+class TestStepTracer(unittest.TestCase):
+    """Test cases for StepTracer class"""
+
+    def setUp(self):
+        """Set up test case with a fresh tracer"""
+        self.tracer = StepTracer(capacity=8)
+
+    def test_summary_per_action(self):
+        """Test that steps are totalled per action and category"""
+        self.tracer.set_action("Gather Resources")
+        self.tracer.record('capture', None, 0, 2_000_000)
+        self.tracer.record('match', 'button.png', 0, 3_000_000)
+        self.tracer.record('match', 'other.png', 0, 1_000_000)
+        self.tracer.set_action(None)
+        self.tracer.record('humanized_delay', None, 0, 5_000_000)
+
+        summary = self.tracer.summary()
+        self.assertEqual(summary["Gather Resources"]['capture_ms'], 2.0)
+        self.assertEqual(summary["Gather Resources"]['match_ms'], 4.0)
+        self.assertEqual(summary["Gather Resources"]['ocr_ms'], 0.0)
+        self.assertEqual(summary['runner']['humanized_delay_ms'], 5.0)
+
+    def test_span_records_duration(self):
+        """Test that a span records one step on exit"""
+        with self.tracer.span('ocr'):
+            pass
+
+        self.assertEqual(len(self.tracer.steps), 1)
+        action, category, name, _, duration_ns = self.tracer.steps[0]
+        self.assertIsNone(action)
+        self.assertEqual(category, 'ocr')
+        self.assertGreaterEqual(duration_ns, 0)
+
+    def test_nested_spans_record_exclusive_time(self):
+        """Test that a span does not count the steps nested in it"""
+        with self.tracer.span('transition', 'open_mail'):
+            with self.tracer.span('humanized_delay'):
+                time.sleep(0.02)
+
+        delay, transition = self.tracer.steps
+        self.assertEqual(delay[1], 'humanized_delay')
+        self.assertGreaterEqual(delay[4], 20_000_000)
+        self.assertLess(transition[4], 10_000_000)
+
+    def test_disabled_tracer(self):
+        """Test that a disabled tracer records nothing"""
+        self.tracer.enabled = False
+        with self.tracer.span('capture'):
+            pass
+        self.assertEqual(len(self.tracer.steps), 0)
+
+    def test_ring_buffer_capacity(self):
+        """Test that old steps are dropped once the buffer is full"""
+        for i in range(20):
+            self.tracer.record('input', str(i), 0, 1000)
+
+        self.assertEqual(len(self.tracer.steps), 8)
+        self.assertEqual(self.tracer.steps[0][2], "12")
+
+        self.tracer.set_capacity(4)
+        self.assertEqual([step[2] for step in self.tracer.steps], ["16", "17", "18", "19"])
+
+    def test_histograms_and_export(self):
+        """Test histogram buckets and the JSON export"""
+        self.tracer.set_action("Open Mails")
+        for ms in (1, 3, 40, 700):
+            self.tracer.record('match', None, 0, ms * 1_000_000)
+
+        histogram = self.tracer.histograms()["Open Mails"]['match']
+        self.assertEqual(histogram['count'], 4)
+        self.assertEqual(histogram['buckets']['1'], 1)
+        self.assertEqual(histogram['buckets']['5'], 1)
+        self.assertEqual(histogram['buckets']['50'], 1)
+        self.assertEqual(histogram['buckets']['1000'], 1)
+        self.assertEqual(histogram['max_ms'], 700.0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "trace.json")
+            self.tracer.export(path)
+            with open(path) as f:
+                exported = json.load(f)
+        self.assertEqual(exported['summary']["Open Mails"]['match_ms'], 744.0)
+
+    def test_sinks_receive_steps(self):
+        """Test that sinks are called with every recorded step"""
+        received = []
+        self.tracer.add_sink(received.append)
+        self.tracer.record('transition', 'start', 10, 30)
+
+        self.assertEqual(received, [(None, 'transition', 'start', 10, 20)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import unittest
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.ui.ui_event_bus import UIEventBus
+
+class FakeRoot:
+    """Tk root stand-in that keeps scheduled callbacks"""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, after_id):
+        self.scheduled[after_id - 1] = None
+
+    def run_pending(self):
+        """Run the callbacks scheduled so far, like one pass of the Tk loop"""
+        pending, self.scheduled = self.scheduled, []
+        for callback in pending:
+            if callback:
+                callback()
+
+class TestUIEventBus(unittest.TestCase):
+    """Test cases for the UI event bus"""
+
+    def setUp(self):
+        """Create a bus for a mock window"""
+        self.window = MagicMock()
+        self.window.root = FakeRoot()
+        self.window.current_character = "Character1"
+        self.bus = UIEventBus(self.window)
+
+    def test_updates_wait_for_drain(self):
+        """Test that published updates only reach the window when drained"""
+        self.bus.add_log("Start loop number 1")
+        self.bus.update_action_status("Open Mails", "Working")
+
+        self.window.add_logs.assert_not_called()
+        self.window.update_action_status.assert_not_called()
+
+        self.assertEqual(self.bus.drain(), 3)
+        self.window.update_action_status.assert_called_once_with("Open Mails", "Working", log_change=False)
+        self.window.add_logs.assert_called_once()
+
+    def test_statuses_coalesced_and_logs_batched(self):
+        """Test that only the last status is applied and logs go in one insert"""
+        for status in ("Waiting", "Working", "Done"):
+            self.bus.update_action_status("Open Mails", status)
+        self.bus.update_action_status("Gather Resources", "Waiting", log_change=False)
+
+        self.bus.drain()
+
+        self.assertEqual(self.window.update_action_status.call_count, 2)
+        self.window.update_action_status.assert_any_call("Open Mails", "Done", log_change=False)
+        self.window.add_logs.assert_called_once()
+        messages = [message for _, message, _ in self.window.add_logs.call_args[0][0]]
+        self.assertEqual(messages, [
+            "Action 'Open Mails' status changed to: Waiting",
+            "Action 'Open Mails' status changed to: Working",
+            "Action 'Open Mails' status changed to: Done"
+        ])
+
+    def test_failed_status_logged_as_error(self):
+        """Test that a failed action is logged with the error color"""
+        self.bus.update_action_status("Open Mails", "Done")
+        self.bus.update_action_status("Gather Resources", "Failed")
+        self.bus.drain()
+
+        kinds = {message: kind for _, message, kind in self.window.add_logs.call_args[0][0]}
+        self.assertEqual(kinds["Action 'Open Mails' status changed to: Done"], 'info')
+        self.assertEqual(kinds["Action 'Gather Resources' status changed to: Failed"], 'error')
+
+    def test_calls_keep_order(self):
+        """Test that queued calls run after the updates published before them"""
+        order = []
+        self.window.add_logs.side_effect = lambda entries: order.append('logs')
+        self.window.start_cooldown.side_effect = lambda key, minutes: order.append(('cooldown', key))
+
+        self.bus.add_log("Action done")
+        self.bus.start_cooldown("open_mails")
+        self.bus.add_log("Next action")
+        self.bus.drain()
+
+        self.assertEqual(order, ['logs', ('cooldown', 'open_mails'), 'logs'])
+
+    def test_failing_call_keeps_batch(self):
+        """Test that updates queued after a failing call are still applied"""
+        self.window.start_cooldown.side_effect = KeyError("plugin_action")
+
+        self.bus.start_cooldown("plugin_action")
+        self.bus.add_log("Next action")
+        self.bus.update_action_status("Open Mails", "Done", log_change=False)
+        self.assertEqual(self.bus.drain(), 3)
+
+        self.window.add_logs.assert_called_once()
+        self.window.update_action_status.assert_called_once_with("Open Mails", "Done", log_change=False)
+
+    def test_refresh_blocks_until_tick(self):
+        """Test that a runner thread waits for the Tk loop to refresh the actions"""
+        self.bus.start()
+        finished = threading.Event()
+
+        def runner():
+            self.bus.refresh_runner_actions()
+            finished.set()
+
+        thread = threading.Thread(target=runner)
+        thread.start()
+        while not self.bus._events:
+            pass
+        self.assertFalse(finished.is_set())
+
+        self.window.root.run_pending()
+        thread.join(5)
+
+        self.assertTrue(finished.is_set())
+        self.window.refresh_runner_actions.assert_called_once()
+        # The tick schedules the next drain
+        self.assertEqual(len(self.window.root.scheduled), 1)
+
+    def test_wait_ends_when_runner_stops(self):
+        """Test that a runner waiting on a busy Tk loop is released by its stop event"""
+        self.assertLess(self.bus.call_timeout, 5.0)
+        stop_event = threading.Event()
+        finished = threading.Event()
+
+        def runner():
+            self.bus.refresh_runner_actions(stop_event=stop_event)
+            finished.set()
+
+        thread = threading.Thread(target=runner)
+        thread.start()
+        while not self.bus._events:
+            pass
+        stop_event.set()
+
+        self.assertTrue(finished.wait(1.0))
+        thread.join(1.0)
+        self.window.refresh_runner_actions.assert_not_called()
+
+    def test_plan_runs_on_tk_thread(self):
+        """Test that a runner gets the switch plan computed by the Tk loop"""
+        batch = {'character': "Beta", 'actions': ["open_mails"]}
+        tk_thread = threading.get_ident()
+        planned_on = []
+
+        def plan(characters):
+            planned_on.append(threading.get_ident())
+            return batch
+        self.window.plan_character_switch.side_effect = plan
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(self.bus.plan_character_switch(["Beta"])))
+        thread.start()
+        while not self.bus._events:
+            pass
+        self.bus.drain()
+        thread.join(5)
+
+        self.assertEqual(results, [batch])
+        self.assertEqual(planned_on, [tk_thread])
+
+    def test_window_state_not_forwarded(self):
+        """Test that window attributes cannot be read through the bus"""
+        with self.assertRaises(AttributeError):
+            self.bus.current_character
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.benchmarks.vision import measure, compare, run_benchmarks
+
+class TestVisionBenchmark(unittest.TestCase):
+    """Test cases for the vision micro-benchmarks"""
+
+    def test_measure(self):
+        """Test timing and allocation figures of a simple function"""
+        result = measure(lambda: bytearray(256 * 1024), iterations=5)
+
+        self.assertEqual(result['iterations'], 5)
+        self.assertLessEqual(result['min_ms'], result['median_ms'])
+        self.assertLessEqual(result['median_ms'], result['p95_ms'])
+        self.assertGreaterEqual(result['peak_alloc_kb'], 256)
+
+    def test_run_benchmarks(self):
+        """Test running the suite on one small screen"""
+        results = run_benchmarks(iterations=1, resolutions=[(320, 240)], template_sizes=[(16, 16)], log=lambda line: None)
+        names = {result['name'] for result in results}
+
+        self.assertTrue({'find_image', 'find_all_images', 'find_image_locate', 'find_all_images_locate',
+                         'highlight_matches', 'pil_to_cv2', 'enhance_image_for_ocr'} <= names)
+        self.assertEqual(results[0]['resolution'], "320x240")
+        self.assertEqual(results[0]['template'], "16x16")
+
+    def test_compare(self):
+        """Test comparing results with a baseline"""
+        baseline = [{'name': 'find_image', 'resolution': '320x240', 'template': '16x16', 'median_ms': 2.0}]
+        results = [
+            {'name': 'find_image', 'resolution': '320x240', 'template': '16x16', 'median_ms': 3.0},
+            {'name': 'pil_to_cv2', 'resolution': '320x240', 'template': None, 'median_ms': 1.0}
+        ]
+
+        self.assertEqual(compare(results, baseline), [(('find_image', '320x240', '16x16'), 2.0, 3.0, 1.5)])
+
+if __name__ == '__main__':
+    unittest.main()
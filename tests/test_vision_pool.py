@@ -0,0 +1,142 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+import cv2
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gravrokbot.core.template_matcher import TemplateMatcher
+from gravrokbot.core.vision_pool import VisionPool, SharedFrame
+
+class TestVisionPool(unittest.TestCase):
+    """Test cases for TemplateMatcher and VisionPool"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a synthetic frame with a known template inside it"""
+        cls.temp_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(0)
+
+        # Random noise background with the template pasted at (x=120, y=40)
+        cls.frame = rng.integers(0, 255, size=(200, 300, 3), dtype=np.uint8)
+        cls.template = rng.integers(0, 255, size=(20, 30, 3), dtype=np.uint8)
+        cls.frame[40:60, 120:150] = cls.template
+
+        # Templates are stored as BGR files, the frame is RGB like a screenshot
+        cls.template_path = os.path.join(cls.temp_dir, "template.png")
+        cv2.imwrite(cls.template_path, cv2.cvtColor(cls.template, cv2.COLOR_RGB2BGR))
+
+        cls.pool = VisionPool(workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after test case"""
+        cls.pool.shutdown()
+        shutil.rmtree(cls.temp_dir)
+
+    def test_matcher_find(self):
+        """Test finding a template in process"""
+        matcher = TemplateMatcher()
+        location, score = matcher.find(self.frame, self.template_path)
+
+        self.assertEqual(location, (135, 50))
+        self.assertGreater(score, 0.99)
+
+        # Color matching finds the same location
+        location, _ = matcher.find(self.frame, self.template_path, grayscale=False)
+        self.assertEqual(location, (135, 50))
+
+    def test_matcher_find_missing_template(self):
+        """Test matching with a template file that does not exist"""
+        matcher = TemplateMatcher()
+        location, score = matcher.find(self.frame, os.path.join(self.temp_dir, "missing.png"))
+
+        self.assertIsNone(location)
+        self.assertEqual(score, 0.0)
+
+    def test_matcher_find_all(self):
+        """Test finding every instance of a template"""
+        frame = self.frame.copy()
+        frame[120:140, 10:40] = self.template
+
+        locations = TemplateMatcher().find_all(frame, self.template_path, confidence=0.95)
+
+        self.assertCountEqual(locations, [(135, 50), (25, 130)])
+
+    def test_template_variants_cached(self):
+        """Test that derived templates are computed once per template and scale"""
+        matcher = TemplateMatcher()
+        edges = matcher.template_variant(self.template_path, 'edges')
+        zero_mean = matcher.template_variant(self.template_path, 'zero_mean')
+        scaled = matcher.template_variant(self.template_path, 'gray', 0.5)
+
+        self.assertIs(matcher.template_variant(self.template_path, 'edges'), edges)
+        self.assertTrue(set(np.unique(edges)) <= {0, 255})
+        self.assertEqual(zero_mean.dtype, np.float32)
+        self.assertAlmostEqual(float(zero_mean.mean()), 0.0, places=3)
+        self.assertEqual(scaled.shape, (10, 15))
+
+    def test_matcher_methods(self):
+        """Test that the edge and concordance methods find the template"""
+        matcher = TemplateMatcher()
+        # Edges along the template border differ from those inside the frame
+        for method, minimum in (('edges', 0.85), ('concordance', 0.99)):
+            location, score = matcher.find(self.frame, self.template_path, match_method=method)
+            self.assertEqual(location, (135, 50), method)
+            self.assertGreater(score, minimum, method)
+
+        with self.assertRaises(ValueError):
+            matcher.find(self.frame, self.template_path, match_method='sqdiff')
+
+    def test_concordance_ignores_brightness_offset(self):
+        """Test that a uniformly brighter screen still matches perfectly"""
+        template = np.full((20, 30, 3), 60, dtype=np.uint8)
+        template[5:15, 5:25] = 140
+        template_path = os.path.join(self.temp_dir, "flat.png")
+        cv2.imwrite(template_path, template)
+
+        frame = np.full((100, 100, 3), 200, dtype=np.uint8)
+        frame[30:50, 40:70] = template.astype(np.int16) + 50
+
+        location, score = TemplateMatcher().find(frame, template_path, match_method='concordance')
+        self.assertEqual(location, (55, 40))
+        self.assertGreater(score, 0.99)
+
+    def test_matcher_scales(self):
+        """Test matching a template shown larger than it was captured"""
+        frame = np.zeros((200, 300, 3), dtype=np.uint8)
+        frame[100:130, 50:95] = cv2.resize(self.template, (45, 30), interpolation=cv2.INTER_LINEAR)
+        matcher = TemplateMatcher()
+
+        location, _ = matcher.find(frame, self.template_path, confidence=0.9)
+        self.assertIsNone(location)
+        location, score = matcher.find(frame, self.template_path, confidence=0.9, scales=(1.0, 1.5))
+        self.assertEqual(location, (72, 115))
+        self.assertEqual(matcher.find_all(frame, self.template_path, confidence=0.9, scales=(1.0, 1.5)), [(72, 115)])
+
+    def test_shared_frame(self):
+        """Test that a shared frame holds a copy of the original data"""
+        with SharedFrame(self.frame) as shared_frame:
+            view = np.ndarray(shared_frame.shape, dtype=shared_frame.dtype, buffer=shared_frame.shm.buf)
+            self.assertTrue(np.array_equal(view, self.frame))
+            del view
+
+    def test_pool_matches_in_process_result(self):
+        """Test that the pool returns the same results as the in-process matcher"""
+        self.assertEqual(
+            self.pool.find(self.frame, self.template_path),
+            TemplateMatcher().find(self.frame, self.template_path)
+        )
+        self.assertEqual(self.pool.find_all(self.frame, self.template_path), [(135, 50)])
+        self.assertEqual(self.pool.find(self.frame, self.template_path, match_method='edges')[0], (135, 50))
+
+        results = self.pool.find_many(self.frame, [self.template_path, "missing.png"])
+        self.assertEqual(results[self.template_path][0], (135, 50))
+        self.assertIsNone(results["missing.png"][0])
+
+if __name__ == '__main__':
+    unittest.main()